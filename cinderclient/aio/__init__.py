@@ -0,0 +1,31 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+asyncio flavour of the v2 client.
+
+Every manager method that talks to Cinder is a coroutine::
+
+    from cinderclient import aio
+
+    async with aio.Client(user, password, project, auth_url) as cs:
+        volumes = await cs.volumes.list()
+
+Requires Python 3.6 or later and the ``aiohttp`` package.
+"""
+
+import sys
+
+if sys.version_info < (3, 6):
+    raise ImportError("cinderclient.aio requires Python 3.6 or later")
+
+from cinderclient.aio.client import Client    # noqa
@@ -0,0 +1,112 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Coroutine versions of the base manager helpers.
+"""
+
+from cinderclient.openstack.common.apiclient import base as common_base
+
+
+class Resource(common_base.Resource):
+    """A resource that never lazy-loads.
+
+    Lazy loading would need a blocking request from inside attribute
+    access, so missing attributes raise AttributeError right away. Use
+    ``await manager.get(id)`` to fetch the full representation.
+    """
+
+    def get(self):
+        self.set_loaded(True)
+
+
+class ManagerMixin(object):
+    """Turns the request helpers of :class:`cinderclient.base.Manager` into
+    coroutines.
+
+    Mix it in ahead of a v2 manager; its public methods that simply return
+    the result of a helper then become coroutines as well.
+    """
+
+    async def _list(self, url, response_key, obj_class=None, body=None,
+                    limit=None, items=None):
+        items = list(items or [])
+        if limit:
+            limit = int(limit) - len(items)
+            if limit <= 0:
+                return items
+        async for item in self._list_iter(url, response_key, obj_class,
+                                          body, limit):
+            items.append(item)
+        return items
+
+    async def _list_iter(self, url, response_key, obj_class=None, body=None,
+                         limit=None):
+        """Iterate over a paginated listing one page at a time."""
+        if obj_class is None:
+            obj_class = self.resource_class
+        if limit:
+            limit = int(limit)
+
+        count = 0
+        while url:
+            if body:
+                resp, resp_body = await self.api.client.post(url, body=body)
+                body = None
+            else:
+                resp, resp_body = await self.api.client.get(url)
+            data, url = self._parse_page(resp_body, response_key)
+            for res in data:
+                if not res:
+                    continue
+                yield obj_class(self, res, loaded=True)
+                count += 1
+                if limit and count >= limit:
+                    return
+
+    async def _get(self, url, response_key=None):
+        resp, body = await self.api.client.get(url)
+        if response_key:
+            return self.resource_class(self, body[response_key], loaded=True)
+        else:
+            return self.resource_class(self, body, loaded=True)
+
+    async def _create(self, url, body, response_key, return_raw=False,
+                      **kwargs):
+        self.run_hooks('modify_body_for_create', body, **kwargs)
+        resp, body = await self.api.client.post(url, body=body)
+        self._invalidate_responses()
+        if return_raw:
+            return body[response_key]
+        return self.resource_class(self, body[response_key], loaded=True)
+
+    async def _delete(self, url, resource_id=None):
+        resp, body = await self.api.client.delete(url)
+        self._forget(resource_id)
+
+    async def _update(self, url, body, response_key=None, resource_id=None,
+                      **kwargs):
+        self.run_hooks('modify_body_for_update', body, **kwargs)
+        resp, body = await self.api.client.put(url, body=body)
+        self._forget(resource_id)
+        if response_key:
+            return self.resource_class(self, body[response_key], loaded=True)
+        return body
+
+    async def find(self, **kwargs):
+        """Find a single item with attributes matching ``**kwargs``."""
+        return self._find_one(await self.findall(**kwargs), kwargs)
+
+    async def findall(self, **kwargs):
+        """Find all items with attributes matching ``**kwargs``."""
+        objs = await self.list(search_opts=self._findall_search_opts(kwargs))
+        return self._findall_filter(objs, kwargs)
@@ -0,0 +1,225 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+asyncio HTTP client and top-level client object.
+"""
+
+import asyncio
+import datetime
+import ssl
+import time
+
+import requests
+from requests import structures
+
+from cinderclient.aio import pools
+from cinderclient.aio import quotas
+from cinderclient.aio import services
+from cinderclient.aio import volume_backups
+from cinderclient.aio import volume_snapshots
+from cinderclient.aio import volume_types
+from cinderclient.aio import volumes
+from cinderclient import client
+from cinderclient import instrumentation
+from cinderclient.openstack.common import importutils
+
+aiohttp = importutils.try_import("aiohttp")
+
+
+class HTTPClient(client.HTTPClient):
+    """:class:`cinderclient.client.HTTPClient` with coroutine requests.
+
+    Headers, body encoding, logging, retries and the mapping of error
+    responses to :mod:`cinderclient.exceptions` are shared with the
+    blocking client. Authentication against Keystone is rare and still
+    goes through the blocking code path, run in the default executor so
+    it does not stall the event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(HTTPClient, self).__init__(*args, **kwargs)
+        self._session = None
+        self._async_auth_lock = None
+
+    async def _send(self, method, url, headers=None, data=None, timeout=None,
+                    allow_redirects=True):
+        """Send a single request with aiohttp.
+
+        :returns: a :class:`requests.Response` so the response can go
+                  through the same processing as for the blocking client
+        """
+        if aiohttp is None:
+            raise ImportError("cinderclient.aio requires the aiohttp package")
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+
+        ssl_context = None
+        if self.verify_cert is False:
+            ssl_context = False
+        elif isinstance(self.verify_cert, str):
+            ssl_context = ssl.create_default_context(cafile=self.verify_cert)
+
+        start = time.time()
+        try:
+            async with self._session.request(
+                    method, url, headers=headers, data=data,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    allow_redirects=allow_redirects,
+                    ssl=ssl_context) as http_resp:
+                elapsed = time.time() - start
+                content = await http_resp.read()
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(e)
+        except aiohttp.ClientConnectionError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        resp = requests.Response()
+        resp.status_code = http_resp.status
+        resp.reason = http_resp.reason
+        resp.headers = structures.CaseInsensitiveDict(http_resp.headers)
+        resp.url = str(http_resp.url)
+        resp._content = content
+        resp.elapsed = datetime.timedelta(seconds=elapsed)
+        return resp
+
+    async def async_request(self, url, method, **kwargs):
+        kwargs = self._prepare_request(kwargs)
+        self.http_log_req((url, method,), kwargs)
+        # aiohttp connections are not timed.
+        instrumentation.reset_connect_time()
+        resp = await self._send(method, url, **kwargs)
+        return resp, self._process_response(resp)
+
+    async def _authenticate_once(self, failed_token=None):
+        """Authenticate unless another coroutine already did.
+
+        Concurrent requests that all get a 401 for the same token trigger a
+        single authentication; the others wait for it and reuse the result.
+        """
+        if self._async_auth_lock is None:
+            self._async_auth_lock = asyncio.Lock()
+        async with self._async_auth_lock:
+            if self._needs_authentication(failed_token):
+                # get_running_loop() is new in Python 3.7.
+                get_loop = getattr(asyncio, 'get_running_loop',
+                                   asyncio.get_event_loop)
+                # The management URL is cleared on the event loop rather
+                # than in the executor, so no coroutine finds it unset
+                # between checking it and building its request URL.
+                with self._checking_endpoint():
+                    await get_loop().run_in_executor(None, self.authenticate)
+
+    async def _cs_request(self, url, method, **kwargs):
+        timing = self._start_timing(method, url)
+        try:
+            resp, body = await self._cs_request_with_retries(
+                url, method, timing, **kwargs)
+        except Exception as e:
+            self._finish_timing(timing, error=e)
+            raise
+        self._finish_timing(timing, resp)
+        return resp, body
+
+    async def _cs_request_with_retries(self, url, method, timing, **kwargs):
+        attempts = client.RequestAttempts(self, timing)
+        while True:
+            attempts.start()
+            if self._needs_authentication():
+                await self._authenticate_once()
+            request_url, token = self._prepare_attempt(url, kwargs)
+            try:
+                return await self.async_request(request_url, method,
+                                                **kwargs)
+            except Exception:
+                delay = attempts.failed()
+            if delay is client.RequestAttempts.REAUTHENTICATE:
+                await self._authenticate_once(failed_token=token)
+            else:
+                await asyncio.sleep(delay)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.http.close()
+
+
+class Client(object):
+    """Top-level object to access the OpenStack Volume API with asyncio.
+
+    Create an instance with your creds::
+
+        >>> client = Client(USERNAME, PASSWORD, PROJECT_ID, AUTH_URL)
+
+    Then await methods on its managers::
+
+        >>> await client.volumes.list()
+        ...
+    """
+
+    version = '2'
+
+    def __init__(self, username=None, api_key=None, project_id=None,
+                 auth_url='', insecure=False, timeout=None, tenant_id=None,
+                 proxy_tenant_id=None, proxy_token=None, region_name=None,
+                 endpoint_type='publicURL', service_type='volumev2',
+                 service_name=None, volume_service_name=None,
+                 bypass_url=None, retries=None, http_log_debug=False,
+                 cacert=None, auth_system='keystone', auth_plugin=None):
+        self.volumes = volumes.VolumeManager(self)
+        self.volume_snapshots = volume_snapshots.SnapshotManager(self)
+        self.volume_types = volume_types.VolumeTypeManager(self)
+        self.quotas = quotas.QuotaSetManager(self)
+        self.backups = volume_backups.VolumeBackupManager(self)
+        self.services = services.ServiceManager(self)
+        self.pools = pools.PoolManager(self)
+
+        self.client = HTTPClient(
+            username,
+            api_key,
+            project_id,
+            auth_url,
+            insecure=insecure,
+            timeout=timeout,
+            tenant_id=tenant_id,
+            proxy_token=proxy_token,
+            proxy_tenant_id=proxy_tenant_id,
+            region_name=region_name,
+            endpoint_type=endpoint_type,
+            service_type=service_type,
+            service_name=service_name,
+            volume_service_name=volume_service_name,
+            bypass_url=bypass_url,
+            retries=retries,
+            http_log_debug=http_log_debug,
+            cacert=cacert,
+            auth_system=auth_system,
+            auth_plugin=auth_plugin)
+
+    async def authenticate(self):
+        """Authenticate against the server.
+
+        Normally this is called automatically when you first access the API,
+        but you can call this method to force authentication right now.
+        """
+        await self.client._authenticate_once()
+
+    async def close(self):
+        """Close the connections held by this client."""
+        await self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
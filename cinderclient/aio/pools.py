@@ -0,0 +1,48 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Pools interface (asyncio)"""
+
+import six
+
+from cinderclient.aio import base
+from cinderclient.v2 import pools
+
+
+class Pool(base.Resource, pools.Pool):
+    pass
+
+
+class PoolManager(base.ManagerMixin, pools.PoolManager):
+    resource_class = Pool
+
+    async def list(self, detailed=False):
+        """Lists all
+
+        :rtype: list of :class:`Pool`
+        """
+        if detailed is True:
+            pools = await self._list(
+                "/scheduler-stats/get_pools?detail=True", "pools")
+            # Move the capabilities up a level, as the sync manager does.
+            for pool in pools:
+                if hasattr(pool, 'capabilities'):
+                    for k, v in six.iteritems(pool.capabilities):
+                        setattr(pool, k, v)
+                    del pool.capabilities
+            return pools
+        else:
+            pools = await self._list("/scheduler-stats/get_pools", "pools")
+            for pool in pools:
+                if hasattr(pool, 'capabilities'):
+                    del pool.capabilities
+            return pools
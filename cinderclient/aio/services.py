@@ -0,0 +1,44 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+service interface (asyncio)
+"""
+
+from cinderclient.aio import base
+from cinderclient.v2 import services
+
+
+class Service(base.Resource, services.Service):
+    pass
+
+
+class ServiceManager(base.ManagerMixin, services.ServiceManager):
+    resource_class = Service
+
+    async def enable(self, host, binary):
+        """Enable the service specified by hostname and binary."""
+        body = {"host": host, "binary": binary}
+        result = await self._update("/os-services/enable", body)
+        return self.resource_class(self, result, loaded=True)
+
+    async def disable(self, host, binary):
+        """Disable the service specified by hostname and binary."""
+        body = {"host": host, "binary": binary}
+        result = await self._update("/os-services/disable", body)
+        return self.resource_class(self, result, loaded=True)
+
+    async def disable_log_reason(self, host, binary, reason):
+        """Disable the service with reason."""
+        body = {"host": host, "binary": binary, "disabled_reason": reason}
+        result = await self._update("/os-services/disable-log-reason", body)
+        return self.resource_class(self, result, loaded=True)
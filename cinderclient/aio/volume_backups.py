@@ -0,0 +1,62 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Volume Backups interface (asyncio).
+"""
+
+from cinderclient.aio import base
+from cinderclient import base as sync_base
+from cinderclient.v2 import volume_backups
+
+
+class VolumeBackup(base.Resource, volume_backups.VolumeBackup):
+
+    def reset_state(self, state):
+        return self.manager.reset_state(self, state)
+
+
+class VolumeBackupManager(base.ManagerMixin,
+                          volume_backups.VolumeBackupManager):
+    resource_class = VolumeBackup
+
+    async def delete(self, backup):
+        """Delete a volume backup.
+
+        :param backup: The :class:`VolumeBackup` to delete.
+        """
+        await self._delete("/backups/%s" % sync_base.getid(backup),
+                           resource_id=sync_base.getid(backup))
+
+    async def export_record(self, backup_id):
+        """Export volume backup metadata record.
+
+        :param backup_id: The ID of the backup to export.
+        :rtype: A dictionary containing 'backup_url' and 'backup_service'.
+        """
+        resp, body = await self.api.client.get(
+            "/backups/%s/export_record" % backup_id)
+        return body['backup-record']
+
+    async def import_record(self, backup_service, backup_url):
+        """Import volume backup metadata record.
+
+        :param backup_service: Backup service to use for importing the backup
+        :param backup_url: Backup URL for importing the backup metadata
+        :rtype: A dictionary containing volume backup metadata.
+        """
+        body = {'backup-record': {'backup_service': backup_service,
+                                  'backup_url': backup_url}}
+        self.run_hooks('modify_body_for_update', body, 'backup-record')
+        resp, body = await self.api.client.post("/backups/import_record",
+                                                body=body)
+        return body['backup']
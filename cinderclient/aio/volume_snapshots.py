@@ -0,0 +1,66 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Volume snapshot interface (asyncio).
+"""
+
+from cinderclient.aio import base
+from cinderclient import base as sync_base
+from cinderclient.v2 import volume_snapshots
+
+
+class Snapshot(base.Resource, volume_snapshots.Snapshot):
+
+    def delete(self):
+        return self.manager.delete(self)
+
+    def update(self, **kwargs):
+        return self.manager.update(self, **kwargs)
+
+    def reset_state(self, state):
+        return self.manager.reset_state(self, state)
+
+
+class SnapshotManager(base.ManagerMixin, volume_snapshots.SnapshotManager):
+    resource_class = Snapshot
+
+    async def delete(self, snapshot):
+        """Delete a snapshot.
+
+        :param snapshot: The :class:`Snapshot` to delete.
+        """
+        await self._delete("/snapshots/%s" % sync_base.getid(snapshot),
+                           resource_id=sync_base.getid(snapshot))
+
+    async def update(self, snapshot, **kwargs):
+        """Update the name or description for a snapshot.
+
+        :param snapshot: The :class:`Snapshot` to update.
+        """
+        if not kwargs:
+            return
+
+        body = {"snapshot": kwargs}
+
+        await self._update("/snapshots/%s" % sync_base.getid(snapshot), body,
+                           resource_id=sync_base.getid(snapshot))
+
+    async def delete_metadata(self, snapshot, keys):
+        """Delete specified keys from snapshot metadata.
+
+        :param snapshot: The :class:`Snapshot`.
+        :param keys: A list of keys to be removed.
+        """
+        snapshot_id = sync_base.getid(snapshot)
+        for k in keys:
+            await self._delete("/snapshots/%s/metadata/%s" % (snapshot_id, k))
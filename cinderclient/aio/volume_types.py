@@ -0,0 +1,53 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Volume Type interface (asyncio).
+"""
+
+from cinderclient.aio import base
+from cinderclient import base as sync_base
+from cinderclient.v2 import volume_types
+
+
+class VolumeType(base.Resource, volume_types.VolumeType):
+
+    async def get_keys(self):
+        """Get extra specs from a volume type.
+
+        :param vol_type: The :class:`VolumeType` to get extra specs from
+        """
+        _resp, body = await self.manager.api.client.get(
+            "/types/%s/extra_specs" % sync_base.getid(self))
+        return body["extra_specs"]
+
+    async def unset_keys(self, keys):
+        """Unset extra specs on a volume type.
+
+        :param type_id: The :class:`VolumeType` to unset extra spec on
+        :param keys: A list of keys to be unset
+        """
+        for k in keys:
+            await self.manager._delete(
+                "/types/%s/extra_specs/%s" % (sync_base.getid(self), k))
+
+
+class VolumeTypeManager(base.ManagerMixin, volume_types.VolumeTypeManager):
+    resource_class = VolumeType
+
+    async def delete(self, volume_type):
+        """Delete a specific volume_type.
+
+        :param volume_type: The name or ID of the :class:`VolumeType` to get.
+        """
+        await self._delete("/types/%s" % sync_base.getid(volume_type),
+                           resource_id=sync_base.getid(volume_type))
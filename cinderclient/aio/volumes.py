@@ -0,0 +1,170 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Volume interface (asyncio).
+"""
+
+import asyncio
+
+from cinderclient.aio import base
+from cinderclient import base as sync_base
+from cinderclient.v2 import volumes
+
+
+class Volume(base.Resource, volumes.Volume):
+
+    def delete(self):
+        return self.manager.delete(self)
+
+    def update(self, **kwargs):
+        return self.manager.update(self, **kwargs)
+
+    def force_delete(self):
+        return self.manager.force_delete(self)
+
+    def reset_state(self, state, attach_status=None, migration_status=None):
+        return self.manager.reset_state(self, state, attach_status,
+                                        migration_status)
+
+    def extend(self, volume, new_size):
+        return self.manager.extend(self, new_size)
+
+    def migrate_volume(self, host, force_host_copy, lock_volume):
+        return self.manager.migrate_volume(self, host, force_host_copy,
+                                           lock_volume)
+
+    def retype(self, volume_type, policy):
+        return self.manager.retype(self, volume_type, policy)
+
+    def update_readonly_flag(self, volume, read_only):
+        return self.manager.update_readonly_flag(self, read_only)
+
+    def unmanage(self, volume):
+        return self.manager.unmanage(volume)
+
+    def promote(self, volume):
+        return self.manager.promote(volume)
+
+    def reenable(self, volume):
+        return self.manager.reenable(volume)
+
+    def get_pools(self, detail):
+        return self.manager.get_pools(detail)
+
+
+class VolumeManager(base.ManagerMixin, volumes.VolumeManager):
+    resource_class = Volume
+
+    async def delete(self, volume):
+        """Delete a volume.
+
+        :param volume: The :class:`Volume` to delete.
+        """
+        await self._delete("/volumes/%s" % sync_base.getid(volume),
+                           resource_id=sync_base.getid(volume))
+
+    async def update(self, volume, **kwargs):
+        """Update the name or description for a volume.
+
+        :param volume: The :class:`Volume` to update.
+        """
+        if not kwargs:
+            return
+
+        body = {"volume": kwargs}
+
+        await self._update("/volumes/%s" % sync_base.getid(volume), body,
+                           resource_id=sync_base.getid(volume))
+
+    async def bulk(self, action, volumes, concurrency=10, **kwargs):
+        """Perform the same volume "action" on many volumes concurrently.
+
+        :param action: The action to perform, e.g. 'os-reset_status'.
+        :param volumes: The :class:`Volume` objects (or their IDs).
+        :param concurrency: Maximum number of requests in flight at once.
+        :param kwargs: The body of the action.
+        :returns: list with one entry per volume, in the same order: the
+                  ``(resp, body)`` tuple on success or the exception raised
+                  for that volume.
+        """
+        info = kwargs or None
+        volumes = list(volumes)
+        semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+
+        async def call(volume):
+            async with semaphore:
+                return await self._action(action, volume, info)
+
+        return await asyncio.gather(*[call(volume) for volume in volumes],
+                                    return_exceptions=True)
+
+    async def initialize_connection(self, volume, connector):
+        """Initialize a volume connection.
+
+        :param volume: The :class:`Volume` (or its ID).
+        :param connector: connector dict from nova.
+        """
+        resp, body = await self._action('os-initialize_connection', volume,
+                                        {'connector': connector})
+        return body['connection_info']
+
+    async def terminate_connection(self, volume, connector):
+        """Terminate a volume connection.
+
+        :param volume: The :class:`Volume` (or its ID).
+        :param connector: connector dict from nova.
+        """
+        await self._action('os-terminate_connection', volume,
+                           {'connector': connector})
+
+    async def delete_metadata(self, volume, keys):
+        """Delete specified keys from volumes metadata.
+
+        :param volume: The :class:`Volume`.
+        :param keys: A list of keys to be removed.
+        """
+        for k in keys:
+            await self._delete("/volumes/%s/metadata/%s" %
+                               (sync_base.getid(volume), k))
+
+    async def delete_image_metadata(self, volume, keys):
+        """Delete specified keys from volume's image metadata.
+
+        :param volume: The :class:`Volume`.
+        :param keys: A list of keys to be removed.
+        """
+        for key in keys:
+            await self._action("os-unset_image_metadata", volume,
+                               {'key': key})
+
+    async def get_encryption_metadata(self, volume_id):
+        """Retrieve the encryption metadata from the desired volume.
+
+        :param volume_id: the id of the volume to query
+        :return: a dictionary of volume encryption metadata
+        """
+        volume = await self._get("/volumes/%s/encryption" % volume_id)
+        return volume._info
+
+    async def migrate_volume_completion(self, old_volume, new_volume, error):
+        """Complete the migration from the old volume to the temp new one.
+
+        :param old_volume: The original :class:`Volume` in the migration
+        :param new_volume: The new temporary :class:`Volume` in the migration
+        :param error: Inform of an error to cause migration cleanup
+        """
+        new_volume_id = sync_base.getid(new_volume)
+        resp, body = await self._action(
+            'os-migrate_volume_completion', old_volume,
+            {'new_volume': new_volume_id, 'error': error})
+        return body
@@ -19,16 +19,21 @@
 Base utilities to build API operation managers and objects on top of.
 """
 import abc
+import collections
 import contextlib
-import hashlib
-import os
+import itertools
+import logging
+import sys
+import threading
+import time
 
 import six
+from six.moves import queue
 from six.moves.urllib import parse
 
 from cinderclient import exceptions
 from cinderclient.openstack.common.apiclient import base as common_base
-from cinderclient import utils
+from cinderclient.openstack.common import strutils
 
 
 # Valid sort directions and client sort keys
@@ -38,7 +43,118 @@ SORT_KEY_VALUES = ('id', 'status', 'size', 'availability_zone', 'name',
 # Mapping of client keys to actual sort keys
 SORT_KEY_MAPPINGS = {'name': 'display_name'}
 
-Resource = common_base.Resource
+logger = logging.getLogger(__name__)
+
+# Number of lazy-load GETs sent, per resource class name. Each one is a
+# request the caller probably didn't mean to make.
+lazy_loads = collections.Counter()
+
+
+class Resource(common_base.Resource):
+    """A resource that lazy-loads missing attributes with a GET.
+
+    Clients created with ``lazy_loading=False`` never do: reading a
+    missing attribute just raises AttributeError. Lazy loads that do
+    happen are counted in :data:`lazy_loads` and logged.
+    """
+
+    def __getattr__(self, k):
+        if k not in self.__dict__ and not self.__dict__.get('_loaded', True):
+            api = getattr(self.__dict__.get('manager'), 'api', None)
+            if not getattr(api, 'lazy_loading', True):
+                raise AttributeError(k)
+            self._count_lazy_load(k)
+        return super(Resource, self).__getattr__(k)
+
+    def _count_lazy_load(self, k):
+        lazy_loads[self.__class__.__name__] += 1
+        logger.debug("Lazy-loading %s %s to read %r",
+                     self.__class__.__name__, self.__dict__.get('id'), k)
+
+
+class CompactResource(object):
+    """Read-only, memory lean variant of a :class:`Resource` subclass.
+
+    A regular resource keeps its attributes twice, in ``_info`` and in the
+    instance ``__dict__``. A compact one only keeps ``_info`` and reads
+    attributes from it, so large listings take noticeably less memory.
+    Compact resources never lazy-load and cannot be modified. Use
+    :func:`compact_class` to get the compact variant of a resource class.
+    """
+
+    __slots__ = ()
+    _resource_class = Resource
+
+    def __init__(self, manager, info, loaded=True):
+        self.manager = manager
+        self._info = info
+
+    def __getattr__(self, k):
+        if k == '_info':
+            # Not set yet, e.g. while being copied.
+            raise AttributeError(k)
+        try:
+            return self._info[k]
+        except KeyError:
+            raise AttributeError(k)
+
+    def __setattr__(self, k, v):
+        if k not in ('manager', '_info'):
+            raise AttributeError("%s is read-only" % type(self).__name__)
+        object.__setattr__(self, k, v)
+
+    def __repr__(self):
+        info = ", ".join("%s=%s" % (k, self._info[k])
+                         for k in sorted(self._info) if k[0] != '_')
+        return "<%s %s>" % (self.__class__.__name__, info)
+
+    def __eq__(self, other):
+        if not isinstance(other, Resource):
+            return NotImplemented
+        if not isinstance(other, self._resource_class):
+            return False
+        if 'id' in self._info and hasattr(other, 'id'):
+            return self.id == other.id
+        return self._info == other._info
+
+    @property
+    def human_id(self):
+        if self.HUMAN_ID and self.NAME_ATTR in self._info:
+            return strutils.to_slug(self._info[self.NAME_ATTR])
+        return None
+
+    @property
+    def _loaded(self):
+        return True
+
+    def is_loaded(self):
+        return True
+
+    def set_loaded(self, val):
+        pass
+
+    def get(self):
+        pass
+
+
+_compact_classes = {}
+
+
+def compact_class(resource_class):
+    """Return the :class:`CompactResource` variant of ``resource_class``.
+
+    It keeps the name, methods and properties of ``resource_class`` and
+    instances pass ``isinstance`` checks against it.
+    """
+    try:
+        return _compact_classes[resource_class]
+    except KeyError:
+        cls = type(resource_class.__name__,
+                   (CompactResource, resource_class),
+                   {'__slots__': ('manager', '_info'),
+                    '__module__': resource_class.__module__,
+                    '_resource_class': resource_class})
+        return _compact_classes.setdefault(resource_class, cls)
 
 
 def getid(obj):
@@ -52,29 +168,307 @@ def getid(obj):
         return obj
 
 
+def _prefetch(iterable, depth):
+    """Consume ``iterable`` on a background thread, ``depth`` items ahead.
+
+    Items are handed over in order. An exception raised by ``iterable`` is
+    re-raised in the consuming thread once the items produced before it
+    have been handed over. When the consumer stops early the background
+    thread stops as soon as it is done with the item it is producing.
+    """
+    results = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(value):
+        while not stop.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((done, sys.exc_info()))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc_info = results.get()
+            if exc_info:
+                six.reraise(*exc_info)
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+class ResolutionCache(object):
+    """Recently seen IDs, names and human IDs of resources, mapped to IDs.
+
+    Filled from listings, used by :func:`cinderclient.utils.find_resource`
+    so that a name can be resolved with a single GET of the cached ID
+    instead of full listings. Only the mapping is cached, never the
+    resource itself, and a hit still has to be confirmed by that GET; a
+    deleted or renamed resource falls back to a normal lookup.
+
+    :param ttl: seconds for which a mapping is used
+    :param maxsize: number of mappings kept; the least recently used
+                    ones are dropped first
+    """
+
+    # A key that more than one resource answered to.
+    _AMBIGUOUS = object()
+
+    def __init__(self, ttl=60, maxsize=1000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _info(resource):
+        # Compact resources have no __dict__, and getattr() could lazy-load
+        # a regular one.
+        info = getattr(resource, '_info', None)
+        return resource.__dict__ if info is None else info
+
+    @classmethod
+    def _keys(cls, resource, resource_id):
+        keys = [resource_id, cls._info(resource).get(resource.NAME_ATTR),
+                getattr(resource, 'human_id', None)]
+        return set(key for key in keys
+                   if isinstance(key, six.string_types + six.integer_types))
+
+    def add(self, resource_type, resources):
+        """Record ``resources``, all of type ``resource_type``.
+
+        A name or human ID shared by several resources, in ``resources`` or
+        in a listing recorded earlier and not expired yet, is marked
+        ambiguous, so that it is never resolved from the cache.
+        """
+        mappings = {}
+        for resource in resources:
+            resource_id = self._info(resource).get('id')
+            if resource_id is None:
+                continue
+            for key in self._keys(resource, resource_id):
+                if mappings.get(key, resource_id) != resource_id:
+                    mappings[key] = self._AMBIGUOUS
+                else:
+                    mappings[key] = resource_id
+        now = time.time()
+        expires = now + self.ttl
+        with self._lock:
+            for key, resource_id in mappings.items():
+                key = (resource_type, key)
+                cached_id, cached_expires = self._entries.pop(key,
+                                                              (None, 0))
+                if cached_expires >= now and cached_id != resource_id:
+                    # Also covers an entry that was ambiguous already.
+                    resource_id = self._AMBIGUOUS
+                self._entries[key] = (resource_id, expires)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, resource_type, key):
+        """Return the ID ``key`` resolves to, or None."""
+        key = (resource_type, key)
+        with self._lock:
+            try:
+                resource_id, expires = self._entries.pop(key)
+            except (KeyError, TypeError):
+                return None
+            if expires < time.time():
+                return None
+            self._entries[key] = (resource_id, expires)
+        if resource_id is self._AMBIGUOUS:
+            return None
+        return resource_id
+
+    def invalidate(self, resource_id):
+        """Forget every key resolving to ``resource_id``."""
+        resource_id = six.text_type(resource_id)
+        with self._lock:
+            for key, (cached_id, _expires) in list(self._entries.items()):
+                if resource_id in (six.text_type(cached_id),
+                                   six.text_type(key[1])):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class Manager(common_base.HookableMixin):
     """
     Managers interact with a particular type of API (servers, flavors, images,
     etc.) and provide CRUD operations for them.
     """
     resource_class = None
+    # Whether listings may return compact resources, see CompactResource;
+    # managers that modify the resources they list must not.
+    supports_compact = True
+    # Whether GET responses may be served from the client's response
+    # cache, see cinderclient.client.ResponseCache; only for resources
+    # that rarely change.
+    cache_responses = False
 
     def __init__(self, api):
         self.api = api
 
     def _list(self, url, response_key, obj_class=None, body=None,
               limit=None, items=None):
-        resp = None
-        if items is None:
-            items = []
-        if body:
-            resp, body = self.api.client.post(url, body=body)
-        else:
-            resp, body = self.api.client.get(url)
+        items = list(items or [])
+        if limit:
+            limit = int(limit) - len(items)
+            if limit <= 0:
+                return items
+        items.extend(self._list_iter(url, response_key, obj_class, body,
+                                     limit))
+        return items
 
+    def _list_iter(self, url, response_key, obj_class=None, body=None,
+                   limit=None):
+        """Iterate over a paginated listing one page at a time.
+
+        Only the page currently being consumed is held in memory, or with
+        ``stream_listings`` only the resource being consumed; the next
+        page is requested once the previous one has been exhausted. If the
+        client has ``prefetch_pages`` set, up to that many following pages
+        are fetched on a background thread while the caller works through
+        the current one.
+
+        :param url: URL of the first page
+        :param response_key: the key holding the items in the response body
+        :param obj_class: class for constructing the returned objects
+        :param body: optional body; the first page is then fetched via POST
+        :param limit: maximum number of items to yield
+        """
         if obj_class is None:
             obj_class = self.resource_class
+        if limit:
+            limit = int(limit)
 
+        prefetch_pages = getattr(self.api, 'prefetch_pages', None)
+        # The background thread needs the next page URL, which a streamed
+        # page only has once it has been parsed entirely.
+        pages = self._iter_pages(url, response_key, obj_class, body,
+                                 lazy=not prefetch_pages)
+        if prefetch_pages:
+            pages = _prefetch(pages, int(prefetch_pages))
+
+        count = 0
+        try:
+            for page in pages:
+                for item in page:
+                    yield item
+                    count += 1
+                    if limit and count >= limit:
+                        return
+        finally:
+            # Stops the prefetch thread and releases the connection of a
+            # streamed page right away, not when garbage collected.
+            pages.close()
+
+    def _iter_pages(self, url, response_key, obj_class, body=None,
+                    lazy=False):
+        """Yield the pages of a listing, each an iterable of resources.
+
+        :param lazy: whether a streamed page may be yielded as a generator
+                     producing the resources as they are parsed; it must
+                     then be exhausted before the next page is asked for
+        """
+        if self.supports_compact and getattr(self.api, 'compact_listings',
+                                             False):
+            obj_class = compact_class(obj_class)
+
+        cache_mode = "w"
+        while url:
+            streamed = None
+            if (not body and not self._response_cache() and
+                    getattr(self.api, 'stream_listings', False)):
+                get_streamed = getattr(self.api.client, 'get_streamed', None)
+                if get_streamed:
+                    streamed = get_streamed(url, response_key)
+
+            if streamed:
+                resp, data, rest = streamed
+                page = self._stream_page(data, obj_class, cache_mode)
+                yield page if lazy else list(page)
+                # The links come after the items in the document.
+                rest[response_key] = []
+                _data, url = self._parse_page(rest, response_key)
+            else:
+                page, url = self._list_page(url, response_key, obj_class,
+                                            body, cache_mode)
+                yield page
+            body = None
+            cache_mode = "a"
+
+    def _stream_page(self, data, obj_class, cache_mode):
+        """Yield resources from the items of a streamed page as they come.
+
+        Only their IDs and human IDs are kept, for the completion cache.
+        """
+        resolution_cache = getattr(self.api, 'resolution_cache', None)
+        completion_cache = getattr(self.api, 'completion_cache', None)
+        ids = []
+        human_ids = []
+        try:
+            for res in data:
+                if not res:
+                    continue
+                item = obj_class(self, res, loaded=True)
+                if resolution_cache:
+                    resolution_cache.add(obj_class.__name__, [item])
+                if completion_cache:
+                    ids.append(item._info.get('id'))
+                    human_ids.append(item.human_id)
+                yield item
+        finally:
+            # Closes the response when the caller stops early.
+            close = getattr(data, 'close', None)
+            if close:
+                close()
+        if completion_cache:
+            completion_cache.update(obj_class.__name__.lower(), {
+                'uuid': ids,
+                'human_id': human_ids,
+            }, replace=cache_mode == "w")
+
+    def _list_page(self, url, response_key, obj_class, body=None,
+                   cache_mode="w"):
+        """Fetch a single page of a listing.
+
+        :returns: tuple of (list of resources, URL of the next page or None)
+        """
+        if body:
+            resp, body = self.api.client.post(url, body=body)
+        else:
+            resp, body = self._get_url(url)
+        data, next_url = self._parse_page(body, response_key)
+        items = [obj_class(self, res, loaded=True) for res in data if res]
+        self._cache_completion(obj_class, items, replace=cache_mode == "w")
+        resolution_cache = getattr(self.api, 'resolution_cache', None)
+        if resolution_cache:
+            resolution_cache.add(obj_class.__name__, items)
+        return items, next_url
+
+    @staticmethod
+    def _parse_page(body, response_key):
+        """Split a listing response into its items and the next page URL."""
         data = body[response_key]
         # NOTE(ja): keystone returns values as list as {'values': [ ... ]}
         #           unlike other services which just return the list...
@@ -84,39 +478,15 @@ class Manager(common_base.HookableMixin):
             except KeyError:
                 pass
 
-        with self.completion_cache('human_id', obj_class, mode="w"):
-            with self.completion_cache('uuid', obj_class, mode="w"):
-                items_new = [obj_class(self, res, loaded=True)
-                             for res in data if res]
-        if limit:
-            limit = int(limit)
-            margin = limit - len(items)
-            if margin <= len(items_new):
-                # If the limit is reached, return the items.
-                items = items + items_new[:margin]
-                return items
-            else:
-                items = items + items_new
-        else:
-            items = items + items_new
-
         # It is possible that the length of the list we request is longer
-        # than osapi_max_limit, so we have to retrieve multiple times to
-        # get the complete list.
-        next = None
-        if 'volumes_links' in body:
-            volumes_links = body['volumes_links']
-            if volumes_links:
-                for volumes_link in volumes_links:
-                    if 'rel' in volumes_link and 'next' == volumes_link['rel']:
-                        next = volumes_link['href']
-                        break
-            if next:
-                # As long as the 'next' link is not empty, keep requesting it
-                # till there is no more items.
-                items = self._list(next, response_key, obj_class, None,
-                                   limit, items)
-        return items
+        # than osapi_max_limit, so the server returns a 'next' link pointing
+        # at the rest of the list.
+        next_url = None
+        for link in body.get('%s_links' % response_key) or []:
+            if link.get('rel') == 'next':
+                next_url = link.get('href')
+                break
+        return data, next_url
 
     def _build_list_url(self, resource_type, detailed=True, search_opts=None,
                         marker=None, limit=None, sort_key=None, sort_dir=None,
@@ -228,67 +598,65 @@ class Manager(common_base.HookableMixin):
                % ', '.join(SORT_DIR_VALUES))
         raise ValueError(msg)
 
-    @contextlib.contextmanager
-    def completion_cache(self, cache_type, obj_class, mode):
-        """
-        The completion cache store items that can be used for bash
-        autocompletion, like UUIDs or human-friendly IDs.
-
-        A resource listing will clear and repopulate the cache.
+    def _cache_completion(self, obj_class, items, replace=False):
+        """Record the IDs of ``items`` for bash completion.
 
-        A resource create will append to the cache.
+        Only done when the client was created with ``completion_cache``,
+        as the shell does; library users get no filesystem I/O at all.
 
-        Delete is not handled because listings are assumed to be performed
-        often enough to keep the cache reasonably up-to-date.
+        A resource listing replaces the cached IDs, a create adds to
+        them. Delete is not handled because listings are assumed to be
+        performed often enough to keep the cache reasonably up-to-date.
         """
-        base_dir = utils.env('CINDERCLIENT_UUID_CACHE_DIR',
-                             default="~/.cinderclient")
+        cache = getattr(self.api, 'completion_cache', None)
+        if not cache:
+            return
+        cache.update(obj_class.__name__.lower(), {
+            'uuid': [item._info.get('id') for item in items],
+            'human_id': [item.human_id for item in items],
+        }, replace=replace)
 
-        # NOTE(sirp): Keep separate UUID caches for each username + endpoint
-        # pair
-        username = utils.env('OS_USERNAME', 'CINDER_USERNAME')
-        url = utils.env('OS_URL', 'CINDER_URL')
-        uniqifier = hashlib.md5(username.encode('utf-8') +
-                                url.encode('utf-8')).hexdigest()
-
-        cache_dir = os.path.expanduser(os.path.join(base_dir, uniqifier))
-
-        try:
-            os.makedirs(cache_dir, 0o755)
-        except OSError:
-            # NOTE(kiall): This is typically either permission denied while
-            #              attempting to create the directory, or the directory
-            #              already exists. Either way, don't fail.
-            pass
-
-        resource = obj_class.__name__.lower()
-        filename = "%s-%s-cache" % (resource, cache_type.replace('_', '-'))
-        path = os.path.join(cache_dir, filename)
+    @contextlib.contextmanager
+    def completion_cache(self, cache_type, obj_class, mode):
+        """Collect values given to write_to_completion_cache().
 
+        They are stored with a single write when the block exits; mode
+        "w" replaces the cached values of ``cache_type``, "a" adds to
+        them. Nothing is collected unless the client has a completion
+        cache.
+        """
+        cache = getattr(self.api, 'completion_cache', None)
         cache_attr = "_%s_cache" % cache_type
-
-        try:
-            setattr(self, cache_attr, open(path, mode))
-        except IOError:
-            # NOTE(kiall): This is typically a permission denied while
-            #              attempting to write the cache file.
-            pass
-
+        if cache:
+            setattr(self, cache_attr, [])
         try:
             yield
         finally:
-            cache = getattr(self, cache_attr, None)
-            if cache:
-                cache.close()
+            values = getattr(self, cache_attr, None)
+            if values is not None:
                 delattr(self, cache_attr)
+                cache.update(obj_class.__name__.lower(),
+                             {cache_type: values}, replace=mode == "w")
 
     def write_to_completion_cache(self, cache_type, val):
         cache = getattr(self, "_%s_cache" % cache_type, None)
-        if cache:
-            cache.write("%s\n" % val)
+        if cache is not None:
+            cache.append(val)
+
+    def _response_cache(self):
+        if self.cache_responses:
+            return getattr(self.api, 'response_cache', None)
+        return None
+
+    def _get_url(self, url):
+        """GET ``url``, through the response cache if it applies."""
+        response_cache = self._response_cache()
+        if response_cache:
+            return response_cache.get(self.api.client, url)
+        return self.api.client.get(url)
 
     def _get(self, url, response_key=None):
-        resp, body = self.api.client.get(url)
+        resp, body = self._get_url(url)
         if response_key:
             return self.resource_class(self, body[response_key], loaded=True)
         else:
@@ -297,19 +665,45 @@ class Manager(common_base.HookableMixin):
     def _create(self, url, body, response_key, return_raw=False, **kwargs):
         self.run_hooks('modify_body_for_create', body, **kwargs)
         resp, body = self.api.client.post(url, body=body)
+        self._invalidate_responses()
         if return_raw:
             return body[response_key]
 
-        with self.completion_cache('human_id', self.resource_class, mode="a"):
-            with self.completion_cache('uuid', self.resource_class, mode="a"):
-                return self.resource_class(self, body[response_key])
+        resource = self.resource_class(self, body[response_key])
+        self._cache_completion(self.resource_class, [resource])
+        return resource
+
+    def _forget(self, resource_id=None):
+        resolution_cache = getattr(self.api, 'resolution_cache', None)
+        if resolution_cache and resource_id is not None:
+            resolution_cache.invalidate(resource_id)
+        self._invalidate_responses()
+
+    def _invalidate_responses(self):
+        # Writes are rare for cached resources; simply start over.
+        response_cache = self._response_cache()
+        if response_cache:
+            response_cache.clear()
+
+    def _delete(self, url, resource_id=None):
+        """Delete ``url``.
 
-    def _delete(self, url):
+        :param resource_id: ID of the resource deleted or modified, whose
+                            names are then no longer resolved from the
+                            client's resolution cache
+        """
         resp, body = self.api.client.delete(url)
+        self._forget(resource_id)
+
+    def _update(self, url, body, response_key=None, resource_id=None,
+                **kwargs):
+        """PUT ``body`` to ``url``.
 
-    def _update(self, url, body, response_key=None, **kwargs):
+        :param resource_id: see :meth:`_delete`
+        """
         self.run_hooks('modify_body_for_update', body, **kwargs)
         resp, body = self.api.client.put(url, body=body)
+        self._forget(resource_id)
         if response_key:
             return self.resource_class(self, body[response_key], loaded=True)
         return body
@@ -320,6 +714,11 @@ class ManagerWithFind(six.with_metaclass(abc.ABCMeta, Manager)):
     Like a `Manager`, but with additional `find()`/`findall()` methods.
     """
 
+    # Attributes the server can filter listings on. find() and findall()
+    # pass these to list() as search options instead of downloading
+    # everything and filtering on the client.
+    server_filters = ('name', 'display_name')
+
     @abc.abstractmethod
     def list(self):
         pass
@@ -331,7 +730,12 @@ class ManagerWithFind(six.with_metaclass(abc.ABCMeta, Manager)):
         This isn't very efficient for search options which require the
         Python side filtering(e.g. 'human_id')
         """
-        matches = self.findall(**kwargs)
+        # Two matches are enough to know the match is not unique; with
+        # managers that page lazily the rest is never fetched.
+        matches = list(itertools.islice(self._iter_findall(kwargs), 2))
+        return self._find_one(matches, kwargs)
+
+    def _find_one(self, matches, kwargs):
         num_matches = len(matches)
         if num_matches == 0:
             msg = "No %s matching %s." % (self.resource_class.__name__, kwargs)
@@ -348,31 +752,43 @@ class ManagerWithFind(six.with_metaclass(abc.ABCMeta, Manager)):
         This isn't very efficient for search options which require the
         Python side filtering(e.g. 'human_id')
         """
+        return list(self._iter_findall(kwargs))
+
+    def _iter_findall(self, kwargs):
+        search_opts = self._findall_search_opts(kwargs)
+        if hasattr(self, 'iter'):
+            objs = self.iter(search_opts=search_opts)
+        else:
+            objs = self.list(search_opts=search_opts)
+        return self._iter_findall_filter(objs, kwargs)
 
+    def _findall_search_opts(self, kwargs):
         # Want to search for all tenants here so that when attempting to delete
         # that a user like admin doesn't get a failure when trying to delete
         # another tenant's volume by name.
         search_opts = {'all_tenants': 1}
 
-        # Pass 'name' or 'display_name' search_opts to server filtering to
-        # increase search performance.
-        if 'name' in kwargs:
-            search_opts['name'] = kwargs['name']
-        elif 'display_name' in kwargs:
-            search_opts['display_name'] = kwargs['display_name']
+        # Pass what the server can filter on to increase search performance.
+        for attr in self.server_filters:
+            if attr in kwargs:
+                search_opts[attr] = kwargs[attr]
+        return search_opts
+
+    def _findall_filter(self, objs, kwargs):
+        return list(self._iter_findall_filter(objs, kwargs))
 
-        found = []
+    def _iter_findall_filter(self, objs, kwargs):
         searches = kwargs.items()
 
         # Not all resources attributes support filters on server side
         # (e.g. 'human_id' doesn't), so when doing findall some client
-        # side filtering is still needed.
-        for obj in self.list(search_opts=search_opts):
+        # side filtering is still needed. Server filtered attributes are
+        # checked again: servers ignore filters they predate, and match
+        # metadata as a subset rather than exactly.
+        for obj in objs:
             try:
                 if all(getattr(obj, attr) == value
                        for (attr, value) in searches):
-                    found.append(obj)
+                    yield obj
             except AttributeError:
                 continue
-
-        return found
@@ -0,0 +1,350 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+On-disk caches that let the cinder CLI skip Keystone round trips and
+repeated extension discovery, and that feed bash completion.
+
+Entries are JSON files below the client cache directory (the one used for
+the bash completion cache, env[CINDERCLIENT_UUID_CACHE_DIR] or
+~/.cinderclient). Directories are kept at mode 0700, existing ones
+included, and files are created with mode 0600 and replaced atomically so
+concurrent invocations never read a partially written entry.
+"""
+
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from cinderclient import utils
+
+logger = logging.getLogger(__name__)
+
+# Cached tokens are not reused within this many seconds of their expiry.
+TOKEN_EXPIRY_WINDOW = 120
+# Seconds for which Keystone version discovery results are reused.
+DISCOVERY_TTL = 24 * 60 * 60
+
+
+def cache_dir(*parts):
+    base_dir = utils.env('CINDERCLIENT_UUID_CACHE_DIR',
+                         default="~/.cinderclient")
+    return os.path.expanduser(os.path.join(base_dir, *parts))
+
+
+def make_key(*parts):
+    """Build a file name safe key from ``parts``."""
+    return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+def read_entry(path):
+    """Return the JSON document stored at ``path``, or None."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _make_private_dir(directory):
+    """Create ``directory`` if needed and restrict it to its owner.
+
+    The client cache directory itself is restricted as well: older
+    releases created it world-readable, which would let others list the
+    entries.
+
+    :raises OSError: if a directory cannot be created or restricted, e.g.
+                     because it belongs to another user
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
+    base_dir = cache_dir()
+    for path in set([base_dir, directory]):
+        if os.stat(path).st_mode & 0o077:
+            os.chmod(path, 0o700)
+
+
+def write_file(path, text):
+    """Atomically replace ``path`` with ``text``, readable by owner only.
+
+    Failures are logged and otherwise ignored; a cache must never break
+    the command using it.
+    """
+    directory = os.path.dirname(path)
+    try:
+        _make_private_dir(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            # mkstemp creates the file with mode 0600.
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.rename(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except (IOError, OSError) as e:
+        logger.debug("Unable to write cache entry %s: %s", path, e)
+
+
+def write_entry(path, data):
+    """Atomically store ``data`` as JSON at ``path``, see write_file()."""
+    try:
+        text = json.dumps(data)
+    except (TypeError, ValueError) as e:
+        logger.debug("Unable to write cache entry %s: %s", path, e)
+        return
+    write_file(path, text)
+
+
+def delete_entry(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _secret():
+    """Return the random key of this user's cache, creating it if needed.
+
+    Returns None if it can be neither read nor created.
+    """
+    path = cache_dir('secret')
+    for _attempt in range(2):
+        try:
+            with open(path) as f:
+                secret = f.read().strip()
+            if secret:
+                return binascii.unhexlify(secret)
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+        write_file(path, binascii.hexlify(os.urandom(32)).decode('ascii'))
+    return None
+
+
+class TokenCache(object):
+    """Keystone tokens and service catalogs, one file per identity.
+
+    The password is not part of the file name, which others may be able
+    to see. An HMAC of it, keyed with a random per-user secret, is stored
+    in the entry instead, so that a wrong or changed password never
+    picks up a token obtained with another one.
+
+    :param auth_url: the auth URL given by the user
+    :param user: user name or ID, including its domain if any
+    :param project: project name or ID, including its domain if any
+    :param region: region name
+    :param password: the password the token is obtained with
+    """
+
+    def __init__(self, auth_url, user, project, region, password=None):
+        self.path = cache_dir('tokens',
+                              make_key(auth_url, user, project, region))
+        self._password = password
+
+    def _password_hmac(self):
+        """Return the HMAC of the password, or None if it has no secret."""
+        secret = _secret()
+        if secret is None:
+            return None
+        return hmac.new(secret, (self._password or '').encode('utf-8'),
+                        hashlib.sha256).hexdigest()
+
+    def load(self):
+        """Return ``(auth_url, auth_ref)`` for a token that is still fresh.
+
+        ``auth_url`` is the versioned Keystone URL the token was issued by.
+        Returns ``(None, None)`` if nothing usable is cached.
+        """
+        # Only needed when a token is cached; the shell imports this module
+        # on every run for the extension index.
+        from keystoneclient import access
+
+        entry = read_entry(self.path)
+        if not entry:
+            return None, None
+        try:
+            password_hmac = self._password_hmac()
+            if (password_hmac is None or not hmac.compare_digest(
+                    password_hmac, entry['password_hmac'])):
+                return None, None
+            auth_ref = entry['auth_ref']
+            if auth_ref.get('version') == 'v3':
+                auth_ref = access.AccessInfo.factory(
+                    body={'token': auth_ref},
+                    auth_token=auth_ref['auth_token'])
+            else:
+                auth_ref = access.AccessInfo.factory(
+                    body={'access': auth_ref})
+            if auth_ref.will_expire_soon(TOKEN_EXPIRY_WINDOW):
+                return None, None
+            return entry['auth_url'], auth_ref
+        except Exception as e:
+            logger.debug("Ignoring unusable cached token: %s", e)
+            return None, None
+
+    def store(self, auth_url, auth_ref):
+        password_hmac = self._password_hmac()
+        if password_hmac is None:
+            return
+        write_entry(self.path, {'auth_url': auth_url,
+                                'password_hmac': password_hmac,
+                                'auth_ref': dict(auth_ref)})
+
+    def clear(self):
+        delete_entry(self.path)
+
+
+class DiscoveryCache(object):
+    """Keystone v2/v3 URLs found by version discovery, per auth URL.
+
+    :param ttl: seconds for which an entry is reused
+    """
+
+    def __init__(self, ttl=DISCOVERY_TTL):
+        self.ttl = ttl
+
+    def _path(self, auth_url):
+        return cache_dir('discovery', make_key(auth_url))
+
+    def load(self, auth_url):
+        """Return the cached ``(v2_auth_url, v3_auth_url)`` or None."""
+        entry = read_entry(self._path(auth_url))
+        try:
+            if entry and 0 <= time.time() - entry['time'] < self.ttl:
+                return entry['v2'], entry['v3']
+        except (KeyError, TypeError):
+            pass
+        return None
+
+    def store(self, auth_url, v2_auth_url, v3_auth_url):
+        write_entry(self._path(auth_url), {'time': time.time(),
+                                           'v2': v2_auth_url,
+                                           'v3': v3_auth_url})
+
+
+class ExtensionIndex(object):
+    """Extensions found on sys.path and in contrib, with their commands.
+
+    Finding extensions means scanning every sys.path entry and importing
+    what was found. The index records the outcome so later runs only
+    import the extensions they need. It is rebuilt when any sys.path
+    entry, the contrib directory or an indexed extension changes.
+
+    :param version: the volume API version the extensions are for
+    :param contrib_path: the version's contrib directory
+    """
+
+    def __init__(self, version, contrib_path):
+        self.paths = list(sys.path) + [contrib_path]
+        self.path = cache_dir('extensions', make_key(version, self.paths))
+
+    def signature(self):
+        """Return the mtimes of the directories extensions are found in."""
+        signature = []
+        for path in self.paths:
+            try:
+                signature.append(os.stat(path or os.curdir).st_mtime)
+            except OSError:
+                signature.append(None)
+        return signature
+
+    def load(self):
+        """Return the indexed extensions, or None if the index is stale.
+
+        Each extension is a dict with the keys ``name``, ``file``,
+        ``mtime``, ``contrib`` (whether it was loaded from ``file`` rather
+        than imported by name), ``commands`` and ``hooks``.
+        """
+        entry = read_entry(self.path)
+        try:
+            if not entry or entry['signature'] != self.signature():
+                return None
+            for extension in entry['extensions']:
+                path = extension['file']
+                if path and os.stat(path).st_mtime != extension['mtime']:
+                    return None
+            return entry['extensions']
+        except (KeyError, TypeError, OSError):
+            return None
+
+    def store(self, extensions):
+        write_entry(self.path, {'signature': self.signature(),
+                                'extensions': extensions})
+
+
+class CompletionCache(object):
+    """UUIDs and human-friendly IDs for bash completion, per endpoint.
+
+    All resources of an endpoint share one indexed JSON file, updated
+    with a single atomic write per listing or create. Values are
+    deduplicated and only the :attr:`MAX_ENTRIES` most recently seen
+    are kept per resource and ID type. Every update also rewrites
+    ``completion-cache``, the plain list of values read by
+    tools/cinder.bash_completion.
+
+    :param username: user the cached resources were listed by
+    :param url: endpoint the cached resources were listed from
+    """
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, username, url):
+        uniqifier = hashlib.md5((username or '').encode('utf-8') +
+                                (url or '').encode('utf-8')).hexdigest()
+        self.path = cache_dir(uniqifier, 'completion.json')
+        self.export_path = cache_dir(uniqifier, 'completion-cache')
+
+    def update(self, resource, values, replace=False):
+        """Record completion values seen for a resource type.
+
+        :param resource: resource type, e.g. ``volume``
+        :param values: dict mapping an ID type (``uuid``, ``human_id``) to
+                       the values seen
+        :param replace: drop the values recorded earlier for these ID
+                        types, as after a full listing
+        """
+        index = read_entry(self.path)
+        if not isinstance(index, dict):
+            index = {}
+        now = time.time()
+        entries = index.get(resource)
+        if not isinstance(entries, dict):
+            entries = index[resource] = {}
+        for id_type, seen in values.items():
+            last_seen = entries.get(id_type)
+            if replace or not isinstance(last_seen, dict):
+                last_seen = {}
+            for value in seen:
+                if value:
+                    last_seen['%s' % value] = now
+            if len(last_seen) > self.MAX_ENTRIES:
+                newest = sorted(last_seen, key=last_seen.get, reverse=True)
+                last_seen = dict((value, last_seen[value])
+                                 for value in newest[:self.MAX_ENTRIES])
+            entries[id_type] = last_seen
+        write_entry(self.path, index)
+        write_file(self.export_path,
+                   ''.join('%s\n' % value for value in self.values(index)))
+
+    def values(self, index=None):
+        """Return every cached value, sorted."""
+        if index is None:
+            index = read_entry(self.path) or {}
+        return sorted(set(value for entries in index.values()
+                          for seen in entries.values()
+                          for value in seen))
@@ -20,22 +20,29 @@ OpenStack Client interface. Handles the REST calls and responses.
 
 from __future__ import print_function
 
+import collections
+import contextlib
+import copy
+import decimal
 import logging
 import re
 import six
+import sys
+import threading
+import time
+import zlib
 
-from keystoneclient import access
 from keystoneclient import adapter
-from keystoneclient.auth.identity import base
-from keystoneclient import discover
 import requests
 
+from cinderclient import codec
 from cinderclient import exceptions
+from cinderclient import instrumentation
 from cinderclient.openstack.common import importutils
 from cinderclient.openstack.common.gettextutils import _
-from oslo_utils import strutils
 
 osprofiler_web = importutils.try_import("osprofiler.web")
+ijson = importutils.try_import("ijson")
 
 try:
     import urlparse
@@ -47,11 +54,6 @@ try:
 except ImportError:
     from time import sleep
 
-try:
-    import json
-except ImportError:
-    import simplejson as json
-
 # Python 2.5 compat fix
 if not hasattr(urlparse, 'parse_qsl'):
     import cgi
@@ -59,11 +61,169 @@ if not hasattr(urlparse, 'parse_qsl'):
 
 _VALID_VERSIONS = ['v1', 'v2']
 
+# Request bodies smaller than this are sent uncompressed even when
+# compression is enabled; they fit in a single packet either way.
+COMPRESS_MIN_SIZE = 1400
+# zlib window bits selecting the gzip container.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+_discover_hack_added = False
+
+
+def iter_json_array(fp, key, rest):
+    """Yield the elements of the top-level ``key`` array of a JSON document.
+
+    ``fp`` is parsed incrementally with ijson, so each element is yielded as
+    soon as it has been read and the document is never held in memory as a
+    whole. The other top-level keys of the document are stored in the
+    ``rest`` dict, which is complete once the generator is exhausted.
+
+    Non-integer numbers are decoded as floats, as the json module does,
+    rather than as the Decimals ijson gives.
+    """
+    item_prefix = key + '.item'
+    top = ijson.common.ObjectBuilder()
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(fp):
+        if event == 'number' and isinstance(value, decimal.Decimal):
+            value = float(value)
+        if builder is not None:
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+                if not depth:
+                    yield builder.value
+                    builder = None
+        elif prefix == item_prefix:
+            if event in ('start_map', 'start_array'):
+                builder = ijson.common.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            else:
+                yield value
+        elif prefix == key:
+            if event not in ('start_array', 'end_array'):
+                raise ValueError("'%s' is not an array" % key)
+        else:
+            top.event(event, value)
+    rest.update(top.value)
+
+
+def decode_body(resp, json_codec):
+    """Return the decoded JSON body of ``resp``, or None.
+
+    JSON is UTF-8 (RFC 8259), so the codec decodes ``resp.content``
+    directly; ``resp.text`` would make requests guess the charset of every
+    body sent without one. Empty bodies and bodies declared as something
+    other than JSON are not decoded at all.
+
+    :raises ValueError: if the body is not valid JSON
+    """
+    content = resp.content
+    if not content:
+        return None
+    content_type = (resp.headers or {}).get('Content-Type')
+    if content_type and 'json' not in content_type.split(';')[0].lower():
+        return None
+    return json_codec.loads(content)
+
+
+def compress_body(headers, data):
+    """Gzip the request body ``data`` unless it is small.
+
+    Sets the Content-Encoding header in ``headers`` if the body was
+    compressed.
+
+    :returns: the body to send
+    """
+    if isinstance(data, six.text_type):
+        data = data.encode('utf-8')
+    if len(data) < COMPRESS_MIN_SIZE:
+        return data
+    compressor = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS)
+    headers['Content-Encoding'] = 'gzip'
+    return compressor.compress(data) + compressor.flush()
+
+
+class ResponseCache(object):
+    """Bodies of GET responses, revalidated with conditional requests.
+
+    Meant for read-mostly resources such as volume types or pools, see
+    :attr:`cinderclient.base.Manager.cache_responses`. A response carrying
+    an ETag or Last-Modified validator is requested again with
+    If-None-Match or If-Modified-Since, and a 304 answer is served from
+    the cache. A response without validators is reused for ``ttl``
+    seconds without asking the server at all.
+
+    :param ttl: seconds for which responses without validators are reused
+    :param maxsize: number of responses kept; the least recently used
+                    ones are dropped first
+    """
+
+    def __init__(self, ttl=30, maxsize=100):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, http_client, url):
+        """GET ``url`` with ``http_client``, answering from the cache if
+        possible.
+
+        :returns: tuple of (response, body) like ``http_client.get``
+        """
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry:
+                self._entries[url] = entry
+        headers = {}
+        if entry:
+            resp, body, expires = entry
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+            if not (etag or last_modified) and time.time() < expires:
+                return resp, copy.deepcopy(body)
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        resp, body = http_client.get(url, headers=headers)
+        if resp.status_code == 304 and entry:
+            return entry[0], copy.deepcopy(entry[1])
+        if resp.status_code == 200 and body is not None:
+            if resp.headers is None:
+                resp.headers = requests.structures.CaseInsensitiveDict()
+            entry = (resp, copy.deepcopy(body), time.time() + self.ttl)
+            with self._lock:
+                self._entries.pop(url, None)
+                self._entries[url] = entry
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return resp, body
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
 
-# tell keystoneclient that we can ignore the /v1|v2/{project_id} component of
-# the service catalog when doing discovery lookups
-for svc in ('volume', 'volumev2'):
-    discover.add_catalog_discover_hack(svc, re.compile('/v[12]/\w+/?$'), '/')
+def _add_catalog_discover_hack():
+    # tell keystoneclient that we can ignore the /v1|v2/{project_id}
+    # component of the service catalog when doing discovery lookups.
+    # keystoneclient.discover is slow to import and only needed with a
+    # session, so this is done when the first SessionClient is created.
+    global _discover_hack_added
+    if _discover_hack_added:
+        return
+    from keystoneclient import discover
+    for svc in ('volume', 'volumev2'):
+        discover.add_catalog_discover_hack(svc,
+                                           re.compile('/v[12]/\w+/?$'), '/')
+    _discover_hack_added = True
 
 
 def get_volume_api_from_url(url):
@@ -79,16 +239,85 @@ def get_volume_api_from_url(url):
     raise exceptions.UnsupportedVersion(msg)
 
 
-class SessionClient(adapter.LegacyJsonAdapter):
+class RequestHooksMixin(object):
+    """Calls the hooks added with add_request_hook() after each request."""
+
+    request_hooks = ()
+
+    def add_request_hook(self, hook):
+        """Call ``hook`` with the timing of every request made from now on.
 
-    def request(self, *args, **kwargs):
+        :param hook: callable taking a
+                     :class:`cinderclient.instrumentation.RequestTiming`,
+                     for instance a
+                     :class:`cinderclient.instrumentation.TimingHistogram`
+        """
+        self.request_hooks = tuple(self.request_hooks) + (hook,)
+
+    def _run_request_hooks(self, timing):
+        for hook in self.request_hooks:
+            try:
+                hook(timing)
+            except Exception as e:
+                # Instrumentation must never break the request itself.
+                logging.getLogger(__name__).debug(
+                    "Request hook %r failed: %s", hook, e)
+
+
+class SessionClient(RequestHooksMixin, adapter.Adapter):
+
+    def __init__(self, *args, **kwargs):
+        self.json_codec = codec.get_codec(kwargs.pop('json_codec', None))
+        self.compression = kwargs.pop('compression', False)
+        super(SessionClient, self).__init__(*args, **kwargs)
+
+    def add_request_hook(self, hook):
+        # The keystone session belongs to the caller and may be shared
+        # with other clients, so its connections are only timed once
+        # timings are actually wanted.
+        if not self.request_hooks:
+            http = getattr(self.session, 'session', None)
+            if isinstance(http, requests.Session):
+                instrumentation.time_connections(http)
+        super(SessionClient, self).add_request_hook(hook)
+
+    def request(self, url, method, **kwargs):
+        if not self.request_hooks:
+            return self._request(url, method, **kwargs)
+        instrumentation.reset_connect_time()
+        # Retries and re-authentication happen inside the keystone
+        # session and are not counted.
+        timing = instrumentation.RequestTiming(method, url)
+        try:
+            resp, body = self._request(url, method, **kwargs)
+        except Exception as e:
+            timing.finish(error=e)
+            self._run_request_hooks(timing)
+            raise
+        timing.finish(resp)
+        self._run_request_hooks(timing)
+        return resp, body
+
+    def _request(self, *args, **kwargs):
         kwargs.setdefault('authenticated', False)
         # Note(tpatil): The standard call raises errors from
         # keystoneclient, here we need to raise the cinderclient errors.
         raise_exc = kwargs.pop('raise_exc', True)
-        resp, body = super(SessionClient, self).request(*args,
-                                                        raise_exc=False,
-                                                        **kwargs)
+        headers = kwargs.setdefault('headers', {})
+        headers.setdefault('Accept', 'application/json')
+        if 'body' in kwargs:
+            headers['Content-Type'] = 'application/json'
+            kwargs['data'] = self.json_codec.dumps(kwargs.pop('body'))
+            if self.compression:
+                kwargs['data'] = compress_body(headers, kwargs['data'])
+        if self.compression:
+            headers['Accept-Encoding'] = 'gzip, deflate'
+        resp = super(SessionClient, self).request(*args, raise_exc=False,
+                                                  **kwargs)
+        try:
+            body = decode_body(resp, self.json_codec)
+        except ValueError:
+            body = None
         if raise_exc and resp.status_code >= 400:
             raise exceptions.from_response(resp, body)
 
@@ -128,6 +357,8 @@ class SessionClient(adapter.LegacyJsonAdapter):
     @property
     def service_catalog(self):
         # NOTE(jamielennox): This is ugly and should be deprecated.
+        from keystoneclient.auth.identity import base
+
         auth = self.auth or self.session.auth
 
         if isinstance(auth, base.BaseIdentityPlugin):
@@ -137,9 +368,88 @@ class SessionClient(adapter.LegacyJsonAdapter):
                              'auth plugin.')
 
 
-class HTTPClient(object):
+class RequestAttempts(object):
+    """Retry, re-authentication and backoff policy of a single request.
+
+    Shared by :class:`HTTPClient` and the asyncio client, which only
+    differ in how they wait and authenticate.
+
+    :param http_client: the client making the request
+    :param timing: :class:`cinderclient.instrumentation.RequestTiming` to
+                   count retries and re-authentications in, or None
+    """
+
+    # Returned by failed() when the request is to be retried with a new
+    # token.
+    REAUTHENTICATE = object()
+
+    def __init__(self, http_client, timing=None):
+        self.http_client = http_client
+        self.timing = timing
+        self.attempts = 0
+        self.auth_attempts = 0
+        self.backoff = 1
+
+    def start(self):
+        self.attempts += 1
+        if self.timing:
+            self.timing.retries = self.attempts - 1
+
+    def failed(self):
+        """Decide what to do about the exception being handled.
+
+        Must be called from the ``except`` clause of the failed attempt.
+
+        :returns: :attr:`REAUTHENTICATE`, or the seconds to wait before
+                  the next attempt
+        :raises: the exception being handled, or the one to raise instead,
+                 if the request is not to be retried
+        """
+        e = sys.exc_info()[1]
+        logger = self.http_client._logger
+        retries = self.http_client.retries
+        if isinstance(e, exceptions.BadRequest):
+            if self.attempts > retries:
+                raise
+        elif isinstance(e, exceptions.Unauthorized):
+            if self.auth_attempts > 0:
+                raise
+            logger.debug("Unauthorized, reauthenticating.")
+            # First reauth. Discount this attempt.
+            self.attempts -= 1
+            self.auth_attempts += 1
+            if self.timing:
+                self.timing.reauths = self.auth_attempts
+            return self.REAUTHENTICATE
+        elif isinstance(e, exceptions.ClientException):
+            if self.attempts > retries:
+                raise
+            if not 500 <= e.code <= 599:
+                raise
+        elif isinstance(e, requests.exceptions.ConnectionError):
+            logger.debug("Connection error: %s" % e)
+            if self.attempts > retries:
+                msg = 'Unable to establish connection: %s' % e
+                raise exceptions.ConnectionError(msg)
+        elif isinstance(e, requests.exceptions.Timeout):
+            logger.debug("Timeout error: %s" % e)
+            if self.attempts > retries:
+                raise
+        else:
+            raise
+        backoff = self.backoff
+        logger.debug(
+            "Failed attempt(%s of %s), retrying in %s seconds" %
+            (self.attempts, retries, backoff))
+        self.backoff *= 2
+        return backoff
+
+
+class HTTPClient(RequestHooksMixin):
 
     USER_AGENT = 'python-cinderclient'
+    # Seconds before expiry at which a token is refreshed proactively.
+    TOKEN_REFRESH_WINDOW = 30
 
     def __init__(self, user, password, projectid, auth_url=None,
                  insecure=False, timeout=None, tenant_id=None,
@@ -148,7 +458,9 @@ class HTTPClient(object):
                  service_name=None, volume_service_name=None,
                  bypass_url=None, retries=None,
                  http_log_debug=False, cacert=None,
-                 auth_system='keystone', auth_plugin=None):
+                 auth_system='keystone', auth_plugin=None,
+                 pool_connections=None, pool_maxsize=None, pool_block=False,
+                 keepalive=True, json_codec=None, compression=False):
         self.user = user
         self.password = password
         self.projectid = projectid
@@ -189,9 +501,45 @@ class HTTPClient(object):
 
         self.auth_system = auth_system
         self.auth_plugin = auth_plugin
+        self.auth_ref = None
+        self._auth_lock = threading.Lock()
+
+        self.http = self._create_http_session(pool_connections, pool_maxsize,
+                                              pool_block, keepalive)
+        self.json_codec = codec.get_codec(json_codec)
+        # Ask for compressed responses and gzip large request bodies. Only
+        # enable this against endpoints that accept gzipped requests.
+        self.compression = compression
 
         self._logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def _create_http_session(pool_connections=None, pool_maxsize=None,
+                             pool_block=False, keepalive=True):
+        """Build the requests session shared by all calls of this client.
+
+        Reusing a single session keeps TCP/TLS connections to Cinder and
+        Keystone alive between requests instead of opening a new one for
+        every call.
+
+        :param pool_connections: number of per-host connection pools to keep
+        :param pool_maxsize: maximum number of connections kept per host
+        :param pool_block: block instead of opening extra connections when
+                           a host already has ``pool_maxsize`` connections
+        :param keepalive: set to False to close connections after each call
+        """
+        http = requests.Session()
+        http_adapter = instrumentation.TimedHTTPAdapter(
+            pool_connections=(pool_connections or
+                              requests.adapters.DEFAULT_POOLSIZE),
+            pool_maxsize=pool_maxsize or requests.adapters.DEFAULT_POOLSIZE,
+            pool_block=pool_block)
+        http.mount('http://', http_adapter)
+        http.mount('https://', http_adapter)
+        if not keepalive:
+            http.headers['Connection'] = 'close'
+        return http
+
     def http_log_req(self, args, kwargs):
         if not self.http_log_debug:
             return
@@ -208,10 +556,14 @@ class HTTPClient(object):
             string_parts.append(header)
 
         if 'data' in kwargs:
-            if "password" in kwargs['data']:
-                data = strutils.mask_password(kwargs['data'])
-            else:
-                data = kwargs['data']
+            data = kwargs['data']
+            if kwargs['headers'].get('Content-Encoding') == 'gzip':
+                data = zlib.decompress(data, _GZIP_WBITS)
+            if isinstance(data, six.binary_type):
+                data = data.decode('utf-8')
+            if "password" in data:
+                from oslo_utils import strutils
+                data = strutils.mask_password(data)
             string_parts.append(" -d '%s'" % (data))
         self._logger.debug("\nREQ: %s\n" % "".join(string_parts))
 
@@ -224,7 +576,8 @@ class HTTPClient(object):
             resp.headers,
             resp.text)
 
-    def request(self, url, method, **kwargs):
+    def _prepare_request(self, kwargs):
+        """Add the standard headers and encode the body of a request."""
         kwargs.setdefault('headers', kwargs.get('headers', {}))
         kwargs['headers']['User-Agent'] = self.USER_AGENT
         kwargs['headers']['Accept'] = 'application/json'
@@ -234,83 +587,186 @@ class HTTPClient(object):
 
         if 'body' in kwargs:
             kwargs['headers']['Content-Type'] = 'application/json'
-            kwargs['data'] = json.dumps(kwargs['body'])
+            kwargs['data'] = self.json_codec.dumps(kwargs['body'])
             del kwargs['body']
+            if self.compression:
+                kwargs['data'] = compress_body(kwargs['headers'],
+                                               kwargs['data'])
+
+        if self.compression:
+            kwargs['headers']['Accept-Encoding'] = 'gzip, deflate'
 
         if self.timeout:
             kwargs.setdefault('timeout', self.timeout)
+        return kwargs
+
+    def _process_response(self, resp):
+        """Decode the body of a response and raise on HTTP errors."""
+        self.http_log_resp(resp)
+
+        try:
+            body = decode_body(resp, self.json_codec)
+        except ValueError as e:
+            body = None
+            self._logger.debug("Load http response text error: %s", e)
+
+        if resp.status_code >= 400:
+            raise exceptions.from_response(resp, body)
+
+        return body
+
+    def request(self, url, method, **kwargs):
+        kwargs = self._prepare_request(kwargs)
         self.http_log_req((url, method,), kwargs)
-        resp = requests.request(
+        instrumentation.reset_connect_time()
+        resp = self.http.request(
             method,
             url,
             verify=self.verify_cert,
             **kwargs)
-        self.http_log_resp(resp)
+        if kwargs.get('stream') and resp.status_code < 400:
+            # The caller reads the body from resp.raw itself.
+            return resp, None
+        return resp, self._process_response(resp)
 
-        body = None
-        if resp.text:
-            try:
-                body = json.loads(resp.text)
-            except ValueError as e:
-                self._logger.debug("Load http response text error: %s", e)
+    def _token_expiring(self):
+        """Tell whether the current token expires within the refresh window.
 
-        if resp.status_code >= 400:
-            raise exceptions.from_response(resp, body)
+        Only tokens obtained from Keystone carry expiry data; for anything
+        else (e.g. a proxy token or v1 auth) this returns False.
+        """
+        auth_ref = self.auth_ref
+        if auth_ref is None or auth_ref.auth_token != self.auth_token:
+            return False
+        try:
+            return auth_ref.will_expire_soon(self.TOKEN_REFRESH_WINDOW)
+        except (KeyError, ValueError):
+            return False
 
-        return resp, body
+    def _needs_authentication(self, failed_token=None):
+        return (not self.management_url or not self.auth_token or
+                (failed_token is not None and
+                 self.auth_token == failed_token) or
+                self._token_expiring())
+
+    def _authenticate_once(self, failed_token=None):
+        """Authenticate unless another thread already did.
+
+        Only one thread talks to Keystone at a time. Threads that were
+        waiting for it find a fresh token once they get the lock and reuse
+        it instead of authenticating again.
+
+        :param failed_token: the token the server just rejected
+        """
+        with self._auth_lock:
+            if self._needs_authentication(failed_token):
+                with self._checking_endpoint():
+                    self.authenticate()
+
+    @contextlib.contextmanager
+    def _checking_endpoint(self):
+        """Clear the management URL while re-authenticating.
+
+        authenticate() then notices a service catalog that no longer has
+        the endpoint. The URL is restored if authentication did not set a
+        new one, e.g. because it failed, leaving the client as it was.
+        """
+        management_url = self.management_url
+        self.management_url = None
+        try:
+            yield
+        finally:
+            if self.management_url is None:
+                self.management_url = management_url
+
+    def _start_timing(self, method, url):
+        if not self.request_hooks:
+            return None
+        path = url
+        if self.management_url and url.startswith(self.management_url):
+            # An absolute pagination link.
+            path = url[len(self.management_url):]
+        return instrumentation.RequestTiming(method, path)
+
+    def _finish_timing(self, timing, resp=None, error=None, streamed=False):
+        if timing is not None:
+            timing.finish(resp, error=error, streamed=streamed)
+            self._run_request_hooks(timing)
+
+    def _prepare_attempt(self, url, kwargs):
+        """Add the auth headers for an attempt at a request.
+
+        :returns: tuple of (URL to send the request to, token used)
+        """
+        # Never see the management URL unset while another thread
+        # re-authenticates.
+        with self._auth_lock:
+            token = self.auth_token
+            management_url = self.management_url
+        kwargs.setdefault('headers', {})['X-Auth-Token'] = token
+        if self.projectid:
+            kwargs['headers']['X-Auth-Project-Id'] = self.projectid
+        # Pagination 'next' links returned by the server are absolute.
+        request_url = url
+        if not urlparse.urlsplit(url).netloc:
+            request_url = management_url + url
+        return request_url, token
 
     def _cs_request(self, url, method, **kwargs):
-        auth_attempts = 0
-        attempts = 0
-        backoff = 1
+        timing = self._start_timing(method, url)
+        try:
+            resp, body = self._cs_request_with_retries(url, method, timing,
+                                                       **kwargs)
+        except Exception as e:
+            self._finish_timing(timing, error=e)
+            raise
+        self._finish_timing(timing, resp,
+                            streamed=kwargs.get('stream', False))
+        return resp, body
+
+    def _cs_request_with_retries(self, url, method, timing, **kwargs):
+        attempts = RequestAttempts(self, timing)
         while True:
-            attempts += 1
-            if not self.management_url or not self.auth_token:
-                self.authenticate()
-            kwargs.setdefault('headers', {})['X-Auth-Token'] = self.auth_token
-            if self.projectid:
-                kwargs['headers']['X-Auth-Project-Id'] = self.projectid
+            attempts.start()
+            if self._needs_authentication():
+                self._authenticate_once()
+            request_url, token = self._prepare_attempt(url, kwargs)
             try:
-                resp, body = self.request(self.management_url + url, method,
-                                          **kwargs)
-                return resp, body
-            except exceptions.BadRequest as e:
-                if attempts > self.retries:
-                    raise
-            except exceptions.Unauthorized:
-                if auth_attempts > 0:
-                    raise
-                self._logger.debug("Unauthorized, reauthenticating.")
-                self.management_url = self.auth_token = None
-                # First reauth. Discount this attempt.
-                attempts -= 1
-                auth_attempts += 1
-                continue
-            except exceptions.ClientException as e:
-                if attempts > self.retries:
-                    raise
-                if 500 <= e.code <= 599:
-                    pass
-                else:
-                    raise
-            except requests.exceptions.ConnectionError as e:
-                self._logger.debug("Connection error: %s" % e)
-                if attempts > self.retries:
-                    msg = 'Unable to establish connection: %s' % e
-                    raise exceptions.ConnectionError(msg)
-            except requests.exceptions.Timeout as e:
-                self._logger.debug("Timeout error: %s" % e)
-                if attempts > self.retries:
-                    raise
-            self._logger.debug(
-                "Failed attempt(%s of %s), retrying in %s seconds" %
-                (attempts, self.retries, backoff))
-            sleep(backoff)
-            backoff *= 2
+                return self.request(request_url, method, **kwargs)
+            except Exception:
+                delay = attempts.failed()
+            if delay is RequestAttempts.REAUTHENTICATE:
+                self._authenticate_once(failed_token=token)
+            else:
+                sleep(delay)
 
     def get(self, url, **kwargs):
         return self._cs_request(url, 'GET', **kwargs)
 
+    def get_streamed(self, url, response_key):
+        """GET a listing and decode its ``response_key`` array item by item.
+
+        :returns: tuple of (response, iterator over the array elements, dict
+                  of the other top-level keys, complete once the iterator is
+                  exhausted), or None when streaming is not possible because
+                  ijson is not installed or responses are being logged
+        """
+        if ijson is None or self.http_log_debug:
+            return None
+        resp, body = self._cs_request(url, 'GET', stream=True)
+        # Let urllib3 undo any Content-Encoding while we read.
+        resp.raw.decode_content = True
+        rest = {}
+
+        def items():
+            try:
+                for item in iter_json_array(resp.raw, response_key, rest):
+                    yield item
+            finally:
+                resp.close()
+
+        return resp, items(), rest
+
     def post(self, url, **kwargs):
         return self._cs_request(url, 'POST', **kwargs)
 
@@ -343,6 +799,7 @@ class HTTPClient(object):
         """
 
         if resp.status_code == 200:  # content must always present
+            from keystoneclient import access
             try:
                 self.auth_url = url
                 self.auth_ref = access.AccessInfo.factory(resp, body)
@@ -517,10 +974,13 @@ def _construct_http_client(username=None, password=None, project_id=None,
                            cacert=None, tenant_id=None,
                            session=None,
                            auth=None,
-                           **kwargs):
+                           pool_connections=None, pool_maxsize=None,
+                           pool_block=False, keepalive=True,
+                           json_codec=None, compression=False, **kwargs):
 
     # Don't use sessions if third party plugin is used
     if session and not auth_plugin:
+        _add_catalog_discover_hack()
         kwargs.setdefault('user_agent', 'python-cinderclient')
         kwargs.setdefault('interface', endpoint_type)
         return SessionClient(session=session,
@@ -528,6 +988,8 @@ def _construct_http_client(username=None, password=None, project_id=None,
                              service_type=service_type,
                              service_name=service_name,
                              region_name=region_name,
+                             json_codec=json_codec,
+                             compression=compression,
                              **kwargs)
     else:
         # FIXME(jamielennox): username and password are now optional. Need
@@ -552,6 +1014,12 @@ def _construct_http_client(username=None, password=None, project_id=None,
                           cacert=cacert,
                           auth_system=auth_system,
                           auth_plugin=auth_plugin,
+                          pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_block=pool_block,
+                          keepalive=keepalive,
+                          json_codec=json_codec,
+                          compression=compression,
                           )
 
 
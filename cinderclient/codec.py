@@ -0,0 +1,129 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON codecs used to encode request bodies and decode response bodies.
+
+The standard library codec is used unless the client is given another one,
+either by name (``orjson``, ``ujson``, ``simplejson``), as ``auto`` for the
+fastest one installed, or as an object with the same interface as
+:class:`JSONCodec`.
+"""
+
+import json
+
+import six
+
+from cinderclient.openstack.common import importutils
+
+orjson = importutils.try_import("orjson")
+ujson = importutils.try_import("ujson")
+simplejson = importutils.try_import("simplejson")
+
+
+class JSONCodec(object):
+    """The standard library :mod:`json` module."""
+
+    name = 'json'
+
+    @staticmethod
+    def available():
+        return True
+
+    def dumps(self, obj):
+        """Encode ``obj``, returning ASCII text or UTF-8 bytes."""
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Decode a document given as UTF-8 bytes or text.
+
+        :raises ValueError: if ``data`` is not valid JSON
+        """
+        if isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    @staticmethod
+    def available():
+        return orjson is not None
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        # Takes bytes as they are, without decoding them to text first.
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    name = 'ujson'
+
+    @staticmethod
+    def available():
+        return ujson is not None
+
+    def dumps(self, obj):
+        return ujson.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return ujson.loads(data)
+
+
+class SimplejsonCodec(JSONCodec):
+    name = 'simplejson'
+
+    @staticmethod
+    def available():
+        return simplejson is not None
+
+    def dumps(self, obj):
+        return simplejson.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return simplejson.loads(data)
+
+
+# In order of preference for 'auto'.
+CODECS = (OrjsonCodec, UjsonCodec, SimplejsonCodec, JSONCodec)
+
+
+def get_codec(codec=None):
+    """Return the codec for ``codec``.
+
+    :param codec: None for the standard library codec, ``auto`` for the
+                  fastest installed one, a codec name or a codec object,
+                  which is returned as is
+    :raises ValueError: if the named codec is unknown
+    :raises ImportError: if the library of the named codec is not installed
+    """
+    if codec is None:
+        return JSONCodec()
+    if not isinstance(codec, six.string_types):
+        return codec
+    if codec == 'auto':
+        return next(cls() for cls in CODECS if cls.available())
+    for cls in CODECS:
+        if cls.name == codec:
+            if not cls.available():
+                raise ImportError("The %s JSON codec needs the %s package"
+                                  % (codec, codec))
+            return cls()
+    raise ValueError("Unknown JSON codec '%s', must be one of: auto, %s"
+                     % (codec, ', '.join(cls.name for cls in CODECS)))
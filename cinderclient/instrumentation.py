@@ -0,0 +1,281 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Timing of the API requests made by a client.
+
+Hooks added with ``add_request_hook()`` to
+:class:`cinderclient.client.HTTPClient` or
+:class:`cinderclient.client.SessionClient` are called with a
+:class:`RequestTiming` once a request has completed or failed.
+:class:`TimingHistogram` is such a hook; it aggregates timings in memory
+and is what the shell's ``--timings`` option prints.
+"""
+
+import bisect
+import collections
+import re
+import threading
+import time
+
+from requests import adapters
+from requests.packages.urllib3 import connectionpool
+
+try:
+    import urlparse
+except ImportError:
+    import urllib.parse as urlparse
+
+_ID_RE = re.compile(r'^([0-9a-f]{8}-([0-9a-f]{4}-){3}[0-9a-f]{12}|'
+                    r'[0-9a-f]{32}|\d+)$', re.IGNORECASE)
+
+# Connect time of the connection opened last by this thread, if any.
+_local = threading.local()
+
+
+def url_template(url):
+    """Return the path of ``url`` with resource and project IDs replaced.
+
+    ``http://cinder:8776/v2/<project>/volumes/<uuid>/action?x=1`` becomes
+    ``/v2/{id}/volumes/{id}/action``, so that requests for different
+    resources are aggregated together.
+    """
+    path = urlparse.urlsplit(url).path
+    return '/'.join('{id}' if _ID_RE.match(part) else part
+                    for part in path.split('/'))
+
+
+def reset_connect_time():
+    _local.connect = None
+
+
+def get_connect_time():
+    """Return the seconds spent opening connections since the last reset.
+
+    None if no connection had to be opened, i.e. a kept-alive one was
+    reused.
+    """
+    return getattr(_local, 'connect', None)
+
+
+class _TimedConnectionMixin(object):
+
+    def connect(self):
+        start = time.time()
+        super(_TimedConnectionMixin, self).connect()
+        _local.connect = ((get_connect_time() or 0.0) +
+                          time.time() - start)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin,
+                           connectionpool.HTTPConnectionPool.ConnectionCls):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin,
+                            connectionpool.HTTPSConnectionPool.ConnectionCls):
+    pass
+
+
+class _TimedHTTPConnectionPool(connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+_TIMED_POOL_CLASSES = {
+    connectionpool.HTTPConnectionPool: _TimedHTTPConnectionPool,
+    connectionpool.HTTPSConnectionPool: _TimedHTTPSConnectionPool,
+}
+
+
+def _time_connections(http_adapter):
+    pool_classes = http_adapter.poolmanager.pool_classes_by_scheme
+    # Pool classes someone else customized are left alone.
+    http_adapter.poolmanager.pool_classes_by_scheme = dict(
+        (scheme, _TIMED_POOL_CLASSES.get(cls, cls))
+        for scheme, cls in pool_classes.items())
+
+
+class TimedHTTPAdapter(adapters.HTTPAdapter):
+    """HTTPAdapter recording how long opening connections takes.
+
+    See :func:`get_connect_time`. The time includes the name lookup and,
+    for HTTPS, the TLS handshake.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(TimedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        _time_connections(self)
+
+
+def time_connections(http):
+    """Record connect times for the adapters of a requests session.
+
+    For sessions the client does not create itself, such as the one of a
+    keystone session, whose adapters may have settings of their own; the
+    adapters are kept and only the connections they open are timed.
+    """
+    for http_adapter in http.adapters.values():
+        if getattr(http_adapter, 'poolmanager', None) is not None:
+            _time_connections(http_adapter)
+
+
+class RequestTiming(object):
+    """Timing and outcome of one API request, retries included.
+
+    :ivar method: HTTP method
+    :ivar url: path of the request, see :func:`url_template`
+    :ivar status: HTTP status of the last response, None if there was none
+    :ivar bytes: size of the response body, None if unknown
+    :ivar dns: seconds spent on the name lookup; requests does not expose
+               it separately, so this is always None and the lookup is
+               part of ``connect``
+    :ivar connect: seconds spent opening a connection, None if a kept-alive
+                   connection was reused or the time is not known
+    :ivar ttfb: seconds from sending the request to receiving the response
+                headers
+    :ivar total: seconds for the whole request, including retries and
+                 re-authentication
+    :ivar retries: number of times the request was retried
+    :ivar reauths: number of times the client re-authenticated because the
+                   token was rejected
+    :ivar error: the exception the request failed with, if any
+    """
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url_template(url)
+        self.status = None
+        self.bytes = None
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.retries = 0
+        self.reauths = 0
+        self.error = None
+        self._start = time.time()
+
+    def finish(self, resp=None, error=None, streamed=False):
+        """Record the outcome of the request.
+
+        :param resp: the last response received
+        :param error: the exception the request failed with
+        :param streamed: whether the body of ``resp`` is still to be read
+        """
+        self.total = time.time() - self._start
+        self.error = error
+        self.connect = get_connect_time()
+        if resp is None:
+            self.status = getattr(error, 'code', None)
+            return
+        self.status = resp.status_code
+        elapsed = getattr(resp, 'elapsed', None)
+        if elapsed is not None:
+            self.ttfb = elapsed.total_seconds()
+        headers = resp.headers or {}
+        if streamed:
+            if headers.get('Content-Length'):
+                self.bytes = int(headers['Content-Length'])
+        else:
+            self.bytes = len(resp.content or b'')
+
+    def __repr__(self):
+        return ("<RequestTiming %s %s status=%s total=%.3f>"
+                % (self.method, self.url, self.status, self.total or 0))
+
+
+class TimingHistogram(object):
+    """Request hook aggregating timings per method and URL template.
+
+    Total times are counted in :attr:`BUCKETS`, so that memory use does not
+    grow with the number of requests; percentiles are the upper bound of
+    the bucket they fall in.
+    """
+
+    # Upper bounds, in seconds, of the buckets request times are counted in.
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+               10.0, 30.0, 60.0)
+
+    def __init__(self):
+        self._stats = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, timing):
+        key = (timing.method, timing.url)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'count': 0, 'errors': 0, 'total': 0.0, 'max': 0.0,
+                    'ttfb': 0.0, 'connects': 0, 'connect': 0.0, 'bytes': 0,
+                    'retries': 0, 'reauths': 0,
+                    'buckets': [0] * (len(self.BUCKETS) + 1)}
+            stats['count'] += 1
+            if timing.error is not None or (timing.status or 0) >= 400:
+                stats['errors'] += 1
+            stats['total'] += timing.total
+            stats['max'] = max(stats['max'], timing.total)
+            stats['ttfb'] += timing.ttfb or 0.0
+            if timing.connect is not None:
+                stats['connects'] += 1
+                stats['connect'] += timing.connect
+            stats['bytes'] += timing.bytes or 0
+            stats['retries'] += timing.retries
+            stats['reauths'] += timing.reauths
+            stats['buckets'][bisect.bisect_left(self.BUCKETS,
+                                                timing.total)] += 1
+
+    def _percentile(self, stats, fraction):
+        rank = fraction * stats['count']
+        seen = 0
+        for bound, count in zip(self.BUCKETS, stats['buckets']):
+            seen += count
+            if seen >= rank:
+                return min(bound, stats['max'])
+        return stats['max']
+
+    def summary(self):
+        """Return one dict per method and URL template, in first-seen order.
+
+        Times are in milliseconds.
+        """
+        rows = []
+        with self._lock:
+            for (method, url), stats in self._stats.items():
+                count = stats['count']
+                connects = stats['connects']
+                rows.append({
+                    'Method': method,
+                    'URL': url,
+                    'Count': count,
+                    'Errors': stats['errors'],
+                    'Mean': stats['total'] / count * 1000,
+                    'P50': self._percentile(stats, 0.5) * 1000,
+                    'P90': self._percentile(stats, 0.9) * 1000,
+                    'P99': self._percentile(stats, 0.99) * 1000,
+                    'Max': stats['max'] * 1000,
+                    'TTFB': stats['ttfb'] / count * 1000,
+                    'Connect': (stats['connect'] / connects * 1000
+                                if connects else None),
+                    'Bytes': stats['bytes'],
+                    'Retries': stats['retries'],
+                    'Reauths': stats['reauths'],
+                })
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
@@ -32,21 +32,17 @@ import sys
 
 import requests
 
+from cinderclient import cache
 from cinderclient import client
 from cinderclient import exceptions as exc
+from cinderclient import instrumentation
 from cinderclient import utils
 import cinderclient.auth_plugin
 import cinderclient.extension
 from cinderclient.openstack.common import importutils
 from cinderclient.openstack.common.gettextutils import _
-from cinderclient.v1 import shell as shell_v1
-from cinderclient.v2 import shell as shell_v2
 
-from keystoneclient import discover
 from keystoneclient import session
-from keystoneclient.auth.identity import v2 as v2_auth
-from keystoneclient.auth.identity import v3 as v3_auth
-from keystoneclient.exceptions import DiscoveryFailure
 import six.moves.urllib.parse as urlparse
 from oslo_utils import encodeutils
 from oslo_utils import strutils
@@ -208,6 +204,12 @@ class OpenStackCinderShell(object):
                             default=0,
                             help='Number of retries.')
 
+        parser.add_argument('--timings',
+                            default=False,
+                            action='store_true',
+                            help='Print a summary of the time taken by the '
+                                 'API calls made.')
+
         if osprofiler_profiler:
             parser.add_argument('--profile',
                                 metavar='HMAC_KEY',
@@ -383,46 +385,132 @@ class OpenStackCinderShell(object):
             '--os_url',
             help=argparse.SUPPRESS)
 
+        parser.add_argument(
+            '--os-cache',
+            default=strutils.bool_from_string(
+                utils.env('OS_CACHE', default=False)),
+            action='store_true',
+            help=_('Reuse Keystone tokens, service catalogs and version '
+                   'discovery results between runs. They are kept in files '
+                   'only readable by the current user. '
+                   'Defaults to env[OS_CACHE].'))
+
         # Register the CLI arguments that have moved to the session object.
         session.Session.register_cli_options(parser)
         parser.set_defaults(insecure=utils.env('CINDERCLIENT_INSECURE',
                                                default=False))
 
-    def get_subcommand_parser(self, version):
+    def get_subcommand_parser(self, version, command=None):
+        """Build the parser for all subcommands, or only for ``command``.
+
+        Registering the 100+ subcommands takes a noticeable share of the
+        CLI start up time, so normal runs only register the one being
+        executed. The full tree is built when ``command`` is not given or
+        is not a known subcommand, so that help output and error messages
+        list every subcommand.
+        """
         parser = self.get_base_parser()
 
         self.subcommands = {}
         subparsers = parser.add_subparsers(metavar='<subcommand>')
 
-        try:
-            actions_module = {
-                '1.1': shell_v1,
-                '2': shell_v2,
-            }[version]
-        except KeyError:
-            actions_module = shell_v1
+        actions_modules = [self._get_actions_module(version), self]
+        actions_modules.extend(extension.module
+                               for extension in self.extensions)
 
-        self._find_actions(subparsers, actions_module)
-        self._find_actions(subparsers, self)
+        if command:
+            attr = 'do_%s' % command.replace('-', '_')
+            owners = [module for module in actions_modules
+                      if hasattr(module, attr)]
+            # Commands are only registered under their hyphenated name.
+            if owners and self._command_name(attr) == command:
+                # Extensions are registered last and so override the
+                # built-in commands; pick the same one here.
+                self._add_action(subparsers, owners[-1], attr)
+                return parser
 
-        for extension in self.extensions:
-            self._find_actions(subparsers, extension.module)
+        for module in actions_modules:
+            self._find_actions(subparsers, module)
 
         self._add_bash_completion_subparser(subparsers)
 
         return parser
 
-    def _discover_extensions(self, version):
-        extensions = []
-        for name, module in itertools.chain(
-                self._discover_via_python_path(version),
-                self._discover_via_contrib_path(version)):
+    def _get_actions_module(self, version):
+        # Only the commands of the selected API version are imported.
+        return importutils.import_module({
+            '2': 'cinderclient.v2.shell',
+        }.get(version, 'cinderclient.v1.shell'))
+
+    def _is_builtin_command(self, version, command):
+        attr = 'do_%s' % command.replace('-', '_')
+        if self._command_name(attr) != command:
+            return False
+        return (hasattr(self, attr) or
+                hasattr(self._get_actions_module(version), attr))
+
+    def _discover_extensions(self, version, command=None):
+        """Load the extensions needed to run ``command``.
+
+        Extensions with hooks are always loaded, the others only if they
+        provide ``command``. Every extension is loaded when ``command`` is
+        not given or unknown, so that help output and error messages list
+        their commands too. What was found is kept in an
+        :class:`cinderclient.cache.ExtensionIndex`, so the sys.path
+        scan only happens again when something was installed or changed.
+        """
+        index = cache.ExtensionIndex(version,
+                                     self._get_contrib_path(version))
+        entries = index.load()
+        if entries is None:
+            found = itertools.chain(
+                ((name, module, False) for name, module
+                 in self._discover_via_python_path(version)),
+                ((name, module, True) for name, module
+                 in self._discover_via_contrib_path(version)))
+            loaded = [(self._describe_extension(name, module, contrib),
+                       module)
+                      for name, module, contrib in found]
+            index.store([entry for entry, _module in loaded])
+        else:
+            loaded = [(entry, None) for entry in entries]
+
+        if command and not (
+                self._is_builtin_command(version, command) or
+                any(command in entry['commands'] for entry, _m in loaded)):
+            command = None
 
-            extension = cinderclient.extension.Extension(name, module)
+        extensions = []
+        for entry, module in loaded:
+            if (command and not entry['hooks'] and
+                    command not in entry['commands']):
+                continue
+            if module is None:
+                module = self._load_extension(entry)
+            extension = cinderclient.extension.Extension(entry['name'],
+                                                         module)
             extensions.append(extension)
 
         return extensions
 
+    def _describe_extension(self, name, module, contrib):
+        path = getattr(module, '__file__', None)
+        return {
+            'name': name,
+            'file': path,
+            'mtime': os.stat(path).st_mtime if path else None,
+            'contrib': contrib,
+            'commands': [self._command_name(attr) for attr in dir(module)
+                         if attr.startswith('do_')],
+            'hooks': any(hasattr(module, hook) for hook
+                         in cinderclient.extension.Extension.SUPPORTED_HOOKS),
+        }
+
+    def _load_extension(self, entry):
+        if entry['contrib']:
+            return imp.load_source(entry['name'], entry['file'])
+        return importutils.import_module(entry['name'])
+
     def _discover_via_python_path(self, version):
         for (module_loader, name, ispkg) in pkgutil.iter_modules():
             if name.endswith('python_cinderclient_ext'):
@@ -433,11 +521,13 @@ class OpenStackCinderShell(object):
                 module = module_loader.load_module(name)
                 yield name, module
 
-    def _discover_via_contrib_path(self, version):
+    def _get_contrib_path(self, version):
         module_path = os.path.dirname(os.path.abspath(__file__))
         version_str = "v%s" % version.replace('.', '_')
-        ext_path = os.path.join(module_path, version_str, 'contrib')
-        ext_glob = os.path.join(ext_path, "*.py")
+        return os.path.join(module_path, version_str, 'contrib')
+
+    def _discover_via_contrib_path(self, version):
+        ext_glob = os.path.join(self._get_contrib_path(version), "*.py")
 
         for ext_path in glob.iglob(ext_glob):
             name = os.path.basename(ext_path)[:-3]
@@ -457,30 +547,37 @@ class OpenStackCinderShell(object):
         self.subcommands['bash_completion'] = subparser
         subparser.set_defaults(func=self.do_bash_completion)
 
+    @staticmethod
+    def _command_name(attr):
+        # I prefer to be hyphen-separated instead of underscores.
+        return attr[3:].replace('_', '-')
+
     def _find_actions(self, subparsers, actions_module):
         for attr in (a for a in dir(actions_module) if a.startswith('do_')):
-            # I prefer to be hyphen-separated instead of underscores.
-            command = attr[3:].replace('_', '-')
-            callback = getattr(actions_module, attr)
-            desc = callback.__doc__ or ''
-            help = desc.strip().split('\n')[0]
-            arguments = getattr(callback, 'arguments', [])
-
-            subparser = subparsers.add_parser(
-                command,
-                help=help,
-                description=desc,
-                add_help=False,
-                formatter_class=OpenStackHelpFormatter)
-
-            subparser.add_argument('-h', '--help',
-                                   action='help',
-                                   help=argparse.SUPPRESS,)
-
-            self.subcommands[command] = subparser
-            for (args, kwargs) in arguments:
-                subparser.add_argument(*args, **kwargs)
-            subparser.set_defaults(func=callback)
+            self._add_action(subparsers, actions_module, attr)
+
+    def _add_action(self, subparsers, actions_module, attr):
+        command = self._command_name(attr)
+        callback = getattr(actions_module, attr)
+        desc = callback.__doc__ or ''
+        help = desc.strip().split('\n')[0]
+        arguments = getattr(callback, 'arguments', [])
+
+        subparser = subparsers.add_parser(
+            command,
+            help=help,
+            description=desc,
+            add_help=False,
+            formatter_class=OpenStackHelpFormatter)
+
+        subparser.add_argument('-h', '--help',
+                               action='help',
+                               help=argparse.SUPPRESS,)
+
+        self.subcommands[command] = subparser
+        for (args, kwargs) in arguments:
+            subparser.add_argument(*args, **kwargs)
+        subparser.set_defaults(func=callback)
 
     def setup_debugging(self, debug):
         if not debug:
@@ -539,13 +636,21 @@ class OpenStackCinderShell(object):
             options.os_volume_api_version = DEFAULT_OS_VOLUME_API_VERSION
             api_version_input = False
 
+        # Help and bash completion need every subcommand; anything else
+        # only needs the parser and extensions of the subcommand being run.
+        command = next((arg for arg in args if not arg.startswith('-')),
+                       None)
+        if options.help or command in ('help', 'bash-completion',
+                                       'bash_completion'):
+            command = None
+
         # build available subcommands based on version
         self.extensions = self._discover_extensions(
-            options.os_volume_api_version)
+            options.os_volume_api_version, command=command)
         self._run_extension_hooks('__pre_parse_args__')
 
         subcommand_parser = self.get_subcommand_parser(
-            options.os_volume_api_version)
+            options.os_volume_api_version, command=command)
         self.parser = subcommand_parser
 
         if options.help or not argv:
@@ -666,6 +771,8 @@ class OpenStackCinderShell(object):
                 "You must provide an authentication URL "
                 "through --os-auth-url or env[OS_AUTH_URL].")
 
+        self.token_cache = None
+        self._cached_auth_ref = None
         auth_session = None
         if not auth_plugin:
             auth_session = self._get_keystone_session()
@@ -684,15 +791,23 @@ class OpenStackCinderShell(object):
                                 http_log_debug=args.debug,
                                 cacert=cacert, auth_system=os_auth_system,
                                 auth_plugin=auth_plugin,
-                                session=auth_session)
+                                session=auth_session,
+                                completion_cache=True)
+
+        timings = None
+        if options.timings:
+            timings = instrumentation.TimingHistogram()
+            self.cs.client.add_request_hook(timings)
 
         try:
-            if not utils.isunauthenticated(args.func):
+            if (not utils.isunauthenticated(args.func) and
+                    not self._cached_auth_ref):
                 self.cs.authenticate()
         except exc.Unauthorized:
             raise exc.CommandError("OpenStack credentials are not valid.")
         except exc.AuthorizationFailure:
             raise exc.CommandError("Unable to authorize user.")
+        self._save_token(auth_session)
 
         endpoint_api_version = None
         # Try to get the API version from the endpoint URL.  If that fails fall
@@ -726,7 +841,13 @@ class OpenStackCinderShell(object):
         if profile:
             osprofiler_profiler.init(options.profile)
 
-        args.func(self.cs, args)
+        try:
+            args.func(self.cs, args)
+        finally:
+            # The session re-authenticates when a cached token is rejected.
+            self._save_token(auth_session)
+            if timings:
+                self._print_timings(timings)
 
         if profile:
             trace_id = osprofiler_profiler.get().get_base_id()
@@ -734,6 +855,19 @@ class OpenStackCinderShell(object):
             print("To display trace use next command:\n"
                   "osprofiler trace show --html %s " % trace_id)
 
+    @staticmethod
+    def _print_timings(timings):
+        fields = ['Method', 'URL', 'Count', 'Errors', 'Mean', 'P50', 'P90',
+                  'P99', 'Max', 'TTFB', 'Connect', 'Bytes', 'Retries',
+                  'Reauths']
+        formatters = dict((field, lambda row, field=field: (
+            '%.1f' % row[field] if row[field] is not None else '-'))
+            for field in ('Mean', 'P50', 'P90', 'P99', 'Max', 'TTFB',
+                          'Connect'))
+        print("API call timings (ms):")
+        utils.print_list(timings.summary(), fields, formatters=formatters,
+                         sortby_index=None)
+
     def _run_extension_hooks(self, hook_type, *args, **kwargs):
         """Runs hooks for all registered extensions."""
         for extension in self.extensions:
@@ -772,6 +906,7 @@ class OpenStackCinderShell(object):
             self.parser.print_help()
 
     def get_v2_auth(self, v2_auth_url):
+        from keystoneclient.auth.identity import v2 as v2_auth
 
         username = self.options.os_username
         password = self.options.os_password
@@ -786,6 +921,7 @@ class OpenStackCinderShell(object):
             tenant_name=tenant_name)
 
     def get_v3_auth(self, v3_auth_url):
+        from keystoneclient.auth.identity import v3 as v3_auth
 
         username = self.options.os_username
         user_id = self.options.os_user_id
@@ -811,9 +947,18 @@ class OpenStackCinderShell(object):
             project_domain_id=project_domain_id,
         )
 
-    def _discover_auth_versions(self, session, auth_url):
+    def _discover_auth_versions(self, session, auth_url,
+                                discovery_cache=None):
         # discover the API versions the server is supporting based on the
         # given URL
+        if discovery_cache:
+            cached = discovery_cache.load(auth_url)
+            if cached:
+                return cached
+
+        from keystoneclient import discover
+        from keystoneclient.exceptions import DiscoveryFailure
+
         v2_auth_url = None
         v3_auth_url = None
         try:
@@ -838,6 +983,10 @@ class OpenStackCinderShell(object):
                 raise exc.CommandError('Unable to determine the Keystone'
                                        ' version to authenticate with '
                                        'using the given auth_url.')
+        else:
+            # Only real discovery results are cached, never the guesses.
+            if discovery_cache:
+                discovery_cache.store(auth_url, v2_auth_url, v3_auth_url)
 
         return (v2_auth_url, v3_auth_url)
 
@@ -853,10 +1002,27 @@ class OpenStackCinderShell(object):
             verify = cacert or True
 
         ks_session = session.Session(verify=verify, cert=cert)
+
+        if self.options.os_cache:
+            self.token_cache = self._get_token_cache()
+            cached_auth_url, auth_ref = self.token_cache.load()
+            if auth_ref:
+                if auth_ref.version == 'v3':
+                    auth = self.get_v3_auth(cached_auth_url)
+                else:
+                    auth = self.get_v2_auth(cached_auth_url)
+                auth.auth_ref = self._cached_auth_ref = auth_ref
+                ks_session.auth = auth
+                return ks_session
+
         # discover the supported keystone versions using the given url
+        discovery_cache = None
+        if self.options.os_cache:
+            discovery_cache = cache.DiscoveryCache()
         (v2_auth_url, v3_auth_url) = self._discover_auth_versions(
             session=ks_session,
-            auth_url=self.options.os_auth_url)
+            auth_url=self.options.os_auth_url,
+            discovery_cache=discovery_cache)
 
         username = self.options.os_username or None
         user_domain_name = self.options.os_user_domain_name or None
@@ -887,6 +1053,28 @@ class OpenStackCinderShell(object):
         ks_session.auth = auth
         return ks_session
 
+    def _get_token_cache(self):
+        options = self.options
+        user = (options.os_user_id or options.os_username,
+                options.os_user_domain_id or options.os_user_domain_name)
+        project = (options.os_project_id or options.os_tenant_id,
+                   options.os_project_name or options.os_tenant_name,
+                   options.os_project_domain_id or
+                   options.os_project_domain_name)
+        return cache.TokenCache(options.os_auth_url, user, project,
+                                options.os_region_name,
+                                password=options.os_password)
+
+    def _save_token(self, ks_session):
+        """Store the session's token if it is new since the last save."""
+        if not self.token_cache or ks_session is None:
+            return
+        auth = ks_session.auth
+        auth_ref = getattr(auth, 'auth_ref', None)
+        if auth_ref is not None and auth_ref is not self._cached_auth_ref:
+            self.token_cache.store(auth.auth_url, auth_ref)
+            self._cached_auth_ref = auth_ref
+
 # I'm picky about my shell help.
 
 
@@ -63,3 +63,15 @@ class Fixture(base.Fixture):
         self.requests.register_uri('GET',
                                    self.url('detail?sort=id'),
                                    status_code=200, json={'snapshots': []})
+
+        self.requests.register_uri(
+            'GET', self.url('detail?status=available'), status_code=200,
+            json={'snapshots': [_stub_snapshot(id='1234')],
+                  'snapshots_links': [
+                      {'href': self.url('detail?marker=1234&status=available'),
+                       'rel': 'next'}]})
+
+        self.requests.register_uri(
+            'GET', self.url('detail?marker=1234&status=available'),
+            status_code=200,
+            json={'snapshots': [_stub_snapshot(id='5678')]})
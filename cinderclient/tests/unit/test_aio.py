@@ -0,0 +1,278 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import threading
+import time
+
+import mock
+import requests
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+import testtools
+
+from cinderclient import exceptions
+from cinderclient.openstack.common import importutils
+from cinderclient.tests.unit import utils
+
+# cinderclient.aio uses async/await and cannot even be parsed before Python
+# 3.6; the tests themselves avoid that syntax so this module always imports.
+aio = asyncio = None
+if sys.version_info >= (3, 6):
+    aio = importutils.try_import("cinderclient.aio")
+    asyncio = importutils.try_import("asyncio")
+aiohttp = importutils.try_import("aiohttp")
+
+BASE_URL = 'http://cinder.example.com/v2/fake'
+
+
+def _response(status_code, body=None):
+    return utils.TestResponse({
+        "status_code": status_code,
+        "text": json.dumps(body) if body is not None else '',
+    })
+
+
+@testtools.skipIf(aio is None, "cinderclient.aio needs Python 3.6+")
+class AsyncClientTest(utils.TestCase):
+
+    def setUp(self):
+        super(AsyncClientTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.cs = aio.Client('user', 'password', 'project',
+                             'http://keystone.example.com/v2.0',
+                             bypass_url=BASE_URL, retries=1)
+        self.cs.client.auth_token = 'token'
+        self.responses = []
+        self.send = mock.Mock(side_effect=self._send)
+        self.cs.client._send = self.send
+        # Retries back off with asyncio.sleep; don't actually wait.
+        sleep = mock.patch('asyncio.sleep', side_effect=self._done)
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _done(self, *args):
+        future = self.loop.create_future()
+        future.set_result(None)
+        return future
+
+    def _send(self, method, url, **kwargs):
+        future = self.loop.create_future()
+        future.set_result(self.responses.pop(0))
+        return future
+
+    def call(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_list_follows_next_links(self):
+        self.responses = [
+            _response(200, {'volumes': [{'id': '1'}],
+                            'volumes_links': [
+                                {'rel': 'next',
+                                 'href': BASE_URL + '/volumes/detail?'
+                                                    'marker=1'}]}),
+            _response(200, {'volumes': [{'id': '2'}]}),
+        ]
+        volumes = self.call(self.cs.volumes.list())
+        self.assertEqual(['1', '2'], [v.id for v in volumes])
+        self.assertIsInstance(volumes[0], aio.volumes.Volume)
+        urls = [c[0][1] for c in self.send.call_args_list]
+        self.assertEqual([BASE_URL + '/volumes/detail',
+                          BASE_URL + '/volumes/detail?marker=1'], urls)
+
+    def test_get(self):
+        self.responses = [_response(200, {'volume': {'id': '1234'}})]
+        volume = self.call(self.cs.volumes.get('1234'))
+        self.assertEqual('1234', volume.id)
+        headers = self.send.call_args[1]['headers']
+        self.assertEqual('token', headers['X-Auth-Token'])
+
+    def test_action_sends_body(self):
+        self.responses = [_response(202)]
+        self.call(self.cs.volumes.extend('1234', 2))
+        method, url = self.send.call_args[0]
+        self.assertEqual('POST', method)
+        self.assertEqual(BASE_URL + '/volumes/1234/action', url)
+        self.assertEqual({'os-extend': {'new_size': 2}},
+                         json.loads(self.send.call_args[1]['data']))
+
+    def test_error_response_is_mapped(self):
+        self.responses = [_response(404, {'itemNotFound': {
+            'message': 'Volume not found', 'code': 404}})]
+        self.assertRaises(exceptions.NotFound, self.call,
+                          self.cs.volumes.get('1234'))
+
+    def test_retry_on_server_error(self):
+        self.responses = [_response(500, {'error': {'message': 'oops'}}),
+                          _response(200, {'volume': {'id': '1234'}})]
+        volume = self.call(self.cs.volumes.get('1234'))
+        self.assertEqual('1234', volume.id)
+        self.assertEqual(2, self.send.call_count)
+
+    def test_request_hooks(self):
+        timings = []
+        self.cs.client.add_request_hook(timings.append)
+        self.responses = [_response(500, {'error': {'message': 'oops'}}),
+                          _response(200, {'volume': {'id': '1234'}})]
+        self.call(self.cs.volumes.get('1234'))
+        timing, = timings
+        self.assertEqual(('GET', '/volumes/{id}', 200, 1),
+                         (timing.method, timing.url, timing.status,
+                          timing.retries))
+
+    def test_unauthorized_reauthenticates_once(self):
+        def authenticate():
+            self.cs.client.auth_token = 'new-token'
+            self.cs.client.management_url = BASE_URL
+
+        self.cs.client.authenticate = mock.Mock(side_effect=authenticate)
+        unauthorized = {'unauthorized': {'message': 'expired', 'code': 401}}
+
+        def send(method, url, headers=None, **kwargs):
+            if headers['X-Auth-Token'] == 'token':
+                resp = _response(401, unauthorized)
+            else:
+                resp = _response(200, {'volume': {'id': url[-1]}})
+            future = self.loop.create_future()
+            future.set_result(resp)
+            return future
+
+        self.send.side_effect = send
+        # Both requests are in flight when the token is rejected.
+        tasks = [self.loop.create_task(self.cs.volumes.get(volume_id))
+                 for volume_id in ('1', '2')]
+        results = [self.call(task) for task in tasks]
+        self.assertEqual(['1', '2'], sorted(v.id for v in results))
+        self.cs.client.authenticate.assert_called_once_with()
+        headers = self.send.call_args[1]['headers']
+        self.assertEqual('new-token', headers['X-Auth-Token'])
+
+    def test_bulk_collects_errors(self):
+        self.responses = [_response(202),
+                          _response(404, {'itemNotFound': {
+                              'message': 'not found', 'code': 404}})]
+        results = self.call(self.cs.volumes.bulk('os-reserve', ['1', '2']))
+        self.assertEqual(202, results[0][0].status_code)
+        self.assertIsInstance(results[1], exceptions.NotFound)
+
+    def test_update_passes_resource_id(self):
+        self.responses = [_response(200, {'volume_type': {'id': '1',
+                                                          'name': 'new'}})]
+        with mock.patch.object(self.cs.volume_types, '_forget') as forget:
+            volume_type = self.call(self.cs.volume_types.update('1', 'new'))
+        self.assertEqual('new', volume_type.name)
+        forget.assert_called_once_with('1')
+        body = json.loads(self.send.call_args[1]['data'])
+        self.assertEqual('new', body['volume_type']['name'])
+
+    def test_delete_invalidates(self):
+        self.responses = [_response(202)]
+        with mock.patch.object(self.cs.volumes, '_forget') as forget:
+            self.call(self.cs.volumes.delete('1234'))
+        forget.assert_called_once_with('1234')
+
+    def test_resources_do_not_lazy_load(self):
+        self.responses = [_response(200, {'volumes': [{'id': '1'}]})]
+        volume = self.call(self.cs.volumes.list(detailed=False))[0]
+        self.assertRaises(AttributeError, getattr, volume, 'size')
+        self.assertEqual(1, self.send.call_count)
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Records requests and answers like the volume API would."""
+
+    def do_GET(self):
+        self.server.requests.append((self.command, self.path,
+                                     dict(self.headers), None))
+        if self.path.endswith('/slow'):
+            time.sleep(0.5)
+        self._reply(200, {'volume': {'id': self.path.rsplit('/', 1)[-1]}})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        self.server.requests.append((self.command, self.path,
+                                     dict(self.headers), body))
+        self._reply(404, {'itemNotFound': {'message': 'not found',
+                                           'code': 404}})
+
+    def _reply(self, status, body):
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('X-Compute-Request-Id', 'req-1')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+@testtools.skipIf(aio is None or aiohttp is None,
+                  "cinderclient.aio needs Python 3.6+ and aiohttp")
+class AsyncClientServerTest(utils.TestCase):
+    """Requests actually sent with aiohttp, to a local server."""
+
+    def setUp(self):
+        super(AsyncClientServerTest, self).setUp()
+        server = _Server(('127.0.0.1', 0), _Handler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.cs = aio.Client('user', 'password', 'project',
+                             'http://keystone.example.com/v2.0',
+                             bypass_url='http://127.0.0.1:%d/v2/fake'
+                                        % server.server_port,
+                             timeout=0.2)
+        self.cs.client.auth_token = 'token'
+        self.addCleanup(self.call, self.cs.close())
+
+    def call(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_get(self):
+        volume = self.call(self.cs.volumes.get('1234'))
+        self.assertEqual('1234', volume.id)
+        method, path, headers, body = self.server.requests[0]
+        self.assertEqual(('GET', '/v2/fake/volumes/1234'), (method, path))
+        self.assertEqual('token', headers['X-Auth-Token'])
+        self.assertEqual('application/json', headers['Accept'])
+
+    def test_error_response_with_body(self):
+        e = self.assertRaises(exceptions.NotFound, self.call,
+                              self.cs.volumes.extend('1234', 2))
+        self.assertEqual('not found', e.message)
+        self.assertEqual('req-1', e.request_id)
+        method, path, headers, body = self.server.requests[0]
+        self.assertEqual('/v2/fake/volumes/1234/action', path)
+        self.assertEqual('application/json', headers['Content-Type'])
+        self.assertEqual({'os-extend': {'new_size': 2}}, json.loads(body))
+
+    def test_timeout(self):
+        self.assertRaises(requests.exceptions.Timeout, self.call,
+                          self.cs.volumes.get('slow'))
@@ -103,7 +103,7 @@ class DeprecatedAuthPluginTest(utils.TestCase):
 
         @mock.patch.object(pkg_resources, "iter_entry_points",
                            mock_iter_entry_points)
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             plugin = auth_plugin.DeprecatedAuthPlugin("fake")
             cs = client.Client("username", "password", "project_id",
@@ -208,7 +208,7 @@ class DeprecatedAuthPluginTest(utils.TestCase):
 
 
 class AuthPluginTest(utils.TestCase):
-    @mock.patch.object(requests, "request")
+    @mock.patch.object(requests.Session, "request")
     @mock.patch.object(pkg_resources, "iter_entry_points")
     def _test_auth_success(self, mock_iter_entry_points, mock_request,
                            **client_kwargs):
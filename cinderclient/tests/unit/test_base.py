@@ -11,7 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
 from cinderclient import base
+from cinderclient import client
 from cinderclient import exceptions
 from cinderclient.v1 import volumes
 from cinderclient.tests.unit import utils
@@ -59,3 +62,285 @@ class BaseTest(utils.TestCase):
         self.assertRaises(exceptions.NotFound,
                           cs.volumes.find,
                           vegetable='carrot')
+
+    def test_prefetch_preserves_order(self):
+        self.assertEqual(list(range(10)),
+                         list(base._prefetch(iter(range(10)), 2)))
+
+    def test_prefetch_reraises_error(self):
+        def pages():
+            yield 1
+            raise exceptions.ClientException(500)
+
+        prefetched = base._prefetch(pages(), 1)
+        self.assertEqual(1, next(prefetched))
+        self.assertRaises(exceptions.ClientException, next, prefetched)
+
+    def test_list_closes_prefetch_when_stopping_early(self):
+        cs = fakes.FakeClient()
+        cs.prefetch_pages = 1
+        prefetched = []
+
+        def pages(*args, **kwargs):
+            while True:
+                yield [1, 2]
+
+        def prefetch(iterable, depth):
+            prefetched.append(real_prefetch(iterable, depth))
+            return prefetched[-1]
+
+        real_prefetch = base._prefetch
+        with mock.patch.object(base, '_prefetch', side_effect=prefetch):
+            with mock.patch.object(cs.volumes, '_iter_pages', pages):
+                self.assertEqual([1, 2, 1], list(cs.volumes._list_iter(
+                    '/volumes/detail', 'volumes', limit=3)))
+        # Still referenced here, so only an explicit close() ended it.
+        self.assertIsNone(prefetched[0].gi_frame)
+
+    def test_find_stops_after_two_matches(self):
+        listed = []
+
+        def iter_volumes(search_opts):
+            for volume_id in range(10):
+                listed.append(volume_id)
+                yield volumes.Volume(None, {'id': volume_id,
+                                            'status': 'error'}, loaded=True)
+
+        with mock.patch.object(cs.volumes, 'iter', create=True,
+                               side_effect=iter_volumes):
+            self.assertRaises(exceptions.NoUniqueMatch,
+                              cs.volumes.find, status='error')
+        self.assertEqual([0, 1], listed)
+
+    def test_list_updates_completion_cache(self):
+        cs.completion_cache = mock.Mock()
+        self.addCleanup(delattr, cs, 'completion_cache')
+        cs.volumes.list()
+        resource, values = cs.completion_cache.update.call_args[0]
+        self.assertEqual('volume', resource)
+        self.assertEqual([1234], values['uuid'])
+        self.assertEqual({'replace': True},
+                         cs.completion_cache.update.call_args[1])
+
+    def test_no_completion_cache_by_default(self):
+        with mock.patch('cinderclient.cache.write_file') as write:
+            cs.volumes.list()
+            cs.volumes.create(1)
+        self.assertFalse(write.called)
+
+
+class ResolutionCacheTest(utils.TestCase):
+
+    def _volume(self, volume_id, name):
+        return volumes.Volume(None, {'id': volume_id, 'display_name': name},
+                              loaded=True)
+
+    def test_resolves_ids_and_names(self):
+        cache = base.ResolutionCache()
+        cache.add('Volume', [self._volume('1', 'one')])
+        self.assertEqual('1', cache.get('Volume', 'one'))
+        self.assertEqual('1', cache.get('Volume', '1'))
+        self.assertIsNone(cache.get('Snapshot', 'one'))
+
+    def test_ambiguous_name_is_not_resolved(self):
+        cache = base.ResolutionCache()
+        cache.add('Volume', [self._volume('1', 'one'),
+                             self._volume('2', 'one')])
+        self.assertIsNone(cache.get('Volume', 'one'))
+        self.assertEqual('2', cache.get('Volume', '2'))
+
+    def test_name_ambiguous_across_listings_is_not_resolved(self):
+        cache = base.ResolutionCache()
+        cache.add('Volume', [self._volume('1', 'one')])
+        cache.add('Volume', [self._volume('2', 'one')])
+        self.assertIsNone(cache.get('Volume', 'one'))
+        cache.add('Volume', [self._volume('1', 'one')])
+        self.assertIsNone(cache.get('Volume', 'one'))
+
+    @mock.patch('time.time')
+    def test_expired_entry_is_replaced(self, mock_time):
+        cache = base.ResolutionCache(ttl=60)
+        mock_time.return_value = 1000
+        cache.add('Volume', [self._volume('1', 'one')])
+        mock_time.return_value = 1061
+        cache.add('Volume', [self._volume('2', 'one')])
+        self.assertEqual('2', cache.get('Volume', 'one'))
+
+    def test_compact_resources_are_recorded(self):
+        compact = base.compact_class(volumes.Volume)
+        cache = base.ResolutionCache()
+        cache.add('Volume', [compact(None, {'id': '1',
+                                            'display_name': 'one'})])
+        self.assertEqual('1', cache.get('Volume', 'one'))
+
+    @mock.patch('time.time')
+    def test_expired_entries_are_not_used(self, mock_time):
+        cache = base.ResolutionCache(ttl=60)
+        mock_time.return_value = 1000
+        cache.add('Volume', [self._volume('1', 'one')])
+        mock_time.return_value = 1061
+        self.assertIsNone(cache.get('Volume', 'one'))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = base.ResolutionCache(maxsize=2)
+        cache.add('Volume', [self._volume('1', None)])
+        cache.add('Volume', [self._volume('2', None)])
+        cache.get('Volume', '1')
+        cache.add('Volume', [self._volume('3', None)])
+        self.assertEqual('1', cache.get('Volume', '1'))
+        self.assertIsNone(cache.get('Volume', '2'))
+
+    def test_list_fills_and_delete_invalidates(self):
+        cs.resolution_cache.clear()
+        cs.volumes.list()
+        cache = cs.resolution_cache
+        self.assertEqual(1234, cache.get('Volume', 'sample-volume'))
+        cs.volumes.delete(1234)
+        self.assertIsNone(cache.get('Volume', 'sample-volume'))
+
+    def test_update_invalidates_the_updated_resource(self):
+        cs.resolution_cache.clear()
+        cs.volumes.list()
+        cache = cs.resolution_cache
+        cs.volumes.set_metadata(1234, {'k1': 'v1'})
+        self.assertEqual(1234, cache.get('Volume', 'sample-volume'))
+        cs.volumes.update(1234, display_name='renamed')
+        self.assertIsNone(cache.get('Volume', 'sample-volume'))
+
+
+class CompactResourceTest(utils.TestCase):
+
+    def setUp(self):
+        super(CompactResourceTest, self).setUp()
+        self.cs = fakes.FakeClient()
+        self.cs.compact_listings = True
+
+    def test_list_returns_compact_resources(self):
+        volume = self.cs.volumes.list()[0]
+        self.assertIsInstance(volume, volumes.Volume)
+        self.assertIsInstance(volume, base.CompactResource)
+        self.assertEqual('Volume', type(volume).__name__)
+        self.assertEqual(1234, volume.id)
+        self.assertEqual('sample-volume', volume.display_name)
+        self.assertFalse(hasattr(volume, '__dict__') and volume.__dict__)
+        self.assertEqual(volume, self.cs.volumes.get(1234))
+        self.assertEqual(self.cs.volumes.get(1234), volume)
+
+    def test_compact_resources_are_read_only(self):
+        volume = self.cs.volumes.list()[0]
+        self.assertRaises(AttributeError, setattr, volume, 'size', 2)
+        # Unknown attributes are not lazy-loaded.
+        self.assertRaises(AttributeError, getattr, volume, 'size')
+
+    def test_compact_resource_methods(self):
+        volume = self.cs.volumes.list()[0]
+        volume.delete()
+        self.cs.assert_called('DELETE', '/volumes/1234')
+        self.assertIn('display_name=sample-volume', repr(volume))
+
+    def test_get_is_not_compact(self):
+        volume = self.cs.volumes.get(1234)
+        self.assertNotIsInstance(volume, base.CompactResource)
+
+
+class LazyLoadingTest(utils.TestCase):
+
+    def setUp(self):
+        super(LazyLoadingTest, self).setUp()
+        self.cs = fakes.FakeClient()
+        base.lazy_loads.clear()
+        self.addCleanup(base.lazy_loads.clear)
+
+    def test_lazy_load_is_counted(self):
+        volume = volumes.Volume(self.cs.volumes, {'id': 1234})
+        self.assertEqual('sample-volume', volume.display_name)
+        self.cs.assert_called('GET', '/volumes/1234')
+        self.assertEqual({'Volume': 1}, dict(base.lazy_loads))
+
+    def test_lazy_loading_disabled(self):
+        self.cs.lazy_loading = False
+        volume = volumes.Volume(self.cs.volumes, {'id': 1234})
+        self.assertIsNone(getattr(volume, 'display_name', None))
+        self.assertEqual([], self.cs.client.callstack)
+        self.assertEqual({}, dict(base.lazy_loads))
+        # An explicit refresh still works.
+        volume.get()
+        self.assertEqual('sample-volume', volume.display_name)
+
+    def test_listed_resources_do_not_lazy_load(self):
+        volume = self.cs.volumes.list()[0]
+        self.assertIsNone(getattr(volume, 'replication_status', None))
+        self.assertEqual(1, len(self.cs.client.callstack))
+
+
+class StreamedListingTest(utils.TestCase):
+
+    def test_list_uses_streamed_items(self):
+        cs = fakes.FakeClient()
+        cs.stream_listings = True
+        rest = {}
+
+        def items():
+            yield {'id': 1}
+            rest['volumes_links'] = [{'rel': 'next',
+                                      'href': '/volumes/detail?marker=1'}]
+
+        pages = [(None, items(), rest), (None, iter([{'id': 2}]), {})]
+        cs.client.get_streamed = mock.Mock(side_effect=pages)
+        self.assertEqual([1, 2], [v.id for v in cs.volumes.list()])
+        self.assertEqual(
+            [mock.call('/volumes/detail', 'volumes'),
+             mock.call('/volumes/detail?marker=1', 'volumes')],
+            cs.client.get_streamed.call_args_list)
+
+    def test_list_iter_yields_while_parsing(self):
+        cs = fakes.FakeClient()
+        cs.stream_listings = True
+        parsed = []
+
+        def items():
+            for volume_id in (1, 2):
+                parsed.append(volume_id)
+                yield {'id': volume_id}
+
+        cs.client.get_streamed = mock.Mock(return_value=(None, items(), {}))
+        volumes = cs.volumes._list_iter('/volumes/detail', 'volumes')
+        self.assertEqual(1, next(volumes).id)
+        self.assertEqual([1], parsed)
+        self.assertEqual([2], [v.id for v in volumes])
+
+    def test_list_falls_back_without_streaming(self):
+        cs = fakes.FakeClient()
+        cs.stream_listings = True
+        cs.client.get_streamed = mock.Mock(return_value=None)
+        self.assertEqual([1234], [v.id for v in cs.volumes.list()])
+        cs.assert_called('GET', '/volumes/detail')
+
+
+class ResponseCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        self.cs = fakes.FakeClient()
+        self.cs.response_cache = client.ResponseCache()
+
+    def _gets(self, url):
+        return [call for call in self.cs.client.callstack
+                if call[0] == 'GET' and call[1].split('?')[0] == url]
+
+    def test_cacheable_listing(self):
+        self.cs.volume_types.list()
+        types = self.cs.volume_types.list()
+        self.assertEqual([1, 2], [t.id for t in types])
+        self.assertEqual(1, len(self._gets('/types')))
+
+    def test_write_clears_cache(self):
+        self.cs.volume_types.list()
+        self.cs.volume_types.create('test-type-3')
+        self.cs.volume_types.list()
+        self.assertEqual(2, len(self._gets('/types')))
+
+    def test_other_resources_not_cached(self):
+        self.cs.volumes.list()
+        self.cs.volumes.list()
+        self.assertEqual(2, len(self._gets('/volumes/detail')))
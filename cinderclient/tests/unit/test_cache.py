@@ -0,0 +1,204 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+
+import fixtures
+from keystoneclient import access
+import mock
+
+from cinderclient import cache
+from cinderclient.tests.unit import utils
+
+
+def _auth_ref(expires='2099-05-22T00:02:43.941430Z'):
+    return access.AccessInfo.factory(body={'access': {
+        'token': {'id': 'token-id', 'expires': expires},
+        'serviceCatalog': [],
+        'user': {'id': 'user-id', 'name': 'user'},
+    }})
+
+
+class TokenCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(TokenCacheTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR', self.cache_dir))
+        self.cache = cache.TokenCache('http://keystone/v2.0', 'user',
+                                      'project', 'region', 'password')
+
+    def test_store_and_load(self):
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        auth_url, auth_ref = self.cache.load()
+        self.assertEqual('http://keystone/v2.0', auth_url)
+        self.assertEqual('token-id', auth_ref.auth_token)
+        self.assertEqual('v2.0', auth_ref.version)
+
+    def test_files_are_private(self):
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        mode = stat.S_IMODE(os.stat(self.cache.path).st_mode)
+        self.assertEqual(0o600, mode)
+        mode = stat.S_IMODE(os.stat(os.path.dirname(self.cache.path)).st_mode)
+        self.assertEqual(0o700, mode)
+
+    def test_expiring_token_is_not_loaded(self):
+        self.cache.store('http://keystone/v2.0',
+                         _auth_ref(expires='2000-01-01T00:00:00Z'))
+        self.assertEqual((None, None), self.cache.load())
+
+    def test_key_includes_identity(self):
+        other = cache.TokenCache('http://keystone/v2.0', 'user',
+                                 'project', 'other-region', 'password')
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        self.assertEqual((None, None), other.load())
+
+    def test_password_not_in_file_name(self):
+        other = cache.TokenCache('http://keystone/v2.0', 'user',
+                                 'project', 'region', 'other-password')
+        self.assertEqual(self.cache.path, other.path)
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        with open(self.cache.path) as f:
+            self.assertNotIn('password', f.read().replace('password_hmac',
+                                                          ''))
+        self.assertEqual((None, None), other.load())
+        self.assertEqual('token-id', self.cache.load()[1].auth_token)
+
+    def test_new_secret_invalidates_tokens(self):
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        os.unlink(os.path.join(self.cache_dir, 'secret'))
+        self.assertEqual((None, None), self.cache.load())
+
+    def test_existing_cache_dir_is_restricted(self):
+        os.chmod(self.cache_dir, 0o755)
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        mode = stat.S_IMODE(os.stat(self.cache_dir).st_mode)
+        self.assertEqual(0o700, mode)
+        mode = stat.S_IMODE(os.stat(os.path.join(self.cache_dir,
+                                                 'secret')).st_mode)
+        self.assertEqual(0o600, mode)
+
+    def test_corrupt_entry_is_ignored(self):
+        os.makedirs(os.path.dirname(self.cache.path))
+        with open(self.cache.path, 'w') as f:
+            f.write('not json')
+        self.assertEqual((None, None), self.cache.load())
+
+    def test_clear(self):
+        self.cache.store('http://keystone/v2.0', _auth_ref())
+        self.cache.clear()
+        self.assertEqual((None, None), self.cache.load())
+
+
+class DiscoveryCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(DiscoveryCacheTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR', self.cache_dir))
+
+    def test_store_and_load(self):
+        discovery_cache = cache.DiscoveryCache()
+        discovery_cache.store('http://keystone', 'http://keystone/v2.0', None)
+        self.assertEqual(['http://keystone/v2.0', None],
+                         list(discovery_cache.load('http://keystone')))
+        self.assertIsNone(discovery_cache.load('http://other'))
+
+    @mock.patch('time.time')
+    def test_expired_entry_is_not_loaded(self, mock_time):
+        discovery_cache = cache.DiscoveryCache(ttl=60)
+        mock_time.return_value = 1000
+        discovery_cache.store('http://keystone', 'http://keystone/v2.0', None)
+        mock_time.return_value = 1061
+        self.assertIsNone(discovery_cache.load('http://keystone'))
+
+
+class ExtensionIndexTest(utils.TestCase):
+
+    def setUp(self):
+        super(ExtensionIndexTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR', self.cache_dir))
+        self.ext_dir = self.useFixture(fixtures.TempDir()).path
+        self.ext_file = os.path.join(self.ext_dir, 'ext.py')
+        with open(self.ext_file, 'w') as f:
+            f.write('')
+        self.extensions = [{'name': 'ext', 'file': self.ext_file,
+                            'mtime': os.stat(self.ext_file).st_mtime,
+                            'contrib': True, 'commands': ['ext-list'],
+                            'hooks': False}]
+
+    def test_store_and_load(self):
+        cache.ExtensionIndex('2', self.ext_dir).store(self.extensions)
+        index = cache.ExtensionIndex('2', self.ext_dir)
+        self.assertEqual(self.extensions, index.load())
+        self.assertIsNone(cache.ExtensionIndex('1.1',
+                                               self.ext_dir).load())
+
+    def test_changed_directory_invalidates(self):
+        index = cache.ExtensionIndex('2', self.ext_dir)
+        index.store(self.extensions)
+        os.utime(self.ext_dir, (0, 0))
+        self.assertIsNone(index.load())
+
+    def test_changed_extension_invalidates(self):
+        index = cache.ExtensionIndex('2', self.ext_dir)
+        index.store(self.extensions)
+        os.utime(self.ext_file, (0, 0))
+        self.assertIsNone(index.load())
+
+
+class CompletionCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(CompletionCacheTest, self).setUp()
+        self.cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR', self.cache_dir))
+        self.cache = cache.CompletionCache('user', 'http://cinder')
+
+    def _exported(self):
+        with open(self.cache.export_path) as f:
+            return f.read().split()
+
+    def test_update_dedups_and_exports(self):
+        self.cache.update('volume', {'uuid': ['1', '2', '1'],
+                                     'human_id': ['vol-1', None]})
+        self.cache.update('snapshot', {'uuid': ['1', '3']})
+        self.assertEqual(['1', '2', '3', 'vol-1'], self.cache.values())
+        self.assertEqual(['1', '2', '3', 'vol-1'], self._exported())
+
+    def test_replace(self):
+        self.cache.update('volume', {'uuid': ['1', '2']})
+        self.cache.update('volume', {'uuid': ['3']}, replace=True)
+        self.cache.update('volume', {'uuid': ['4']})
+        self.assertEqual(['3', '4'], self.cache.values())
+
+    @mock.patch('time.time')
+    def test_oldest_entries_are_evicted(self, mock_time):
+        self.cache.MAX_ENTRIES = 2
+        for now, value in enumerate(['1', '2', '3']):
+            mock_time.return_value = now
+            self.cache.update('volume', {'uuid': [value]})
+        self.assertEqual(['2', '3'], self.cache.values())
+
+    def test_unreadable_index_is_replaced(self):
+        os.makedirs(os.path.dirname(self.cache.path))
+        with open(self.cache.path, 'w') as f:
+            f.write('[')
+        self.cache.update('volume', {'uuid': ['1']})
+        self.assertEqual(['1'], self.cache.values())
@@ -20,6 +20,7 @@ import mock
 import cinderclient.client
 import cinderclient.v1.client
 import cinderclient.v2.client
+from cinderclient import cache
 from cinderclient import exceptions
 from cinderclient.tests.unit import utils
 from keystoneclient import adapter
@@ -40,6 +41,18 @@ class ClientTest(utils.TestCase):
         self.assertRaises(cinderclient.exceptions.UnsupportedVersion,
                           cinderclient.client.get_client_class, '0')
 
+    def test_completion_cache_off_by_default(self):
+        cs = cinderclient.v2.client.Client('user', 'password', 'project',
+                                           'http://keystone/v2.0')
+        self.assertIsNone(cs.completion_cache)
+
+    def test_completion_cache_enabled(self):
+        cs = cinderclient.v1.client.Client('user', 'password', 'project',
+                                           'http://keystone/v2.0',
+                                           completion_cache=True)
+        self.assertIsInstance(cs.completion_cache,
+                              cache.CompletionCache)
+
     def test_log_req(self):
         self.logger = self.useFixture(
             fixtures.FakeLogger(
@@ -160,6 +173,50 @@ class ClientTest(utils.TestCase):
         self.assertRaises(exceptions.BadRequest, session_client.request,
                           mock.sentinel.url, 'POST', **kwargs)
 
+    @mock.patch.object(adapter.Adapter, 'request')
+    def test_sessionclient_request_uses_json_codec(self, mock_request):
+        json_codec = mock.Mock()
+        json_codec.dumps.return_value = b'{"volume": {}}'
+        json_codec.loads.return_value = {'volume': {'id': '1234'}}
+        mock_request.return_value = utils.TestResponse({
+            "status_code": 200,
+            "text": '{"volume": {"id": "1234"}}',
+        })
+        session_client = cinderclient.client.SessionClient(
+            session=mock.Mock(), json_codec=json_codec)
+        resp, body = session_client.request(mock.sentinel.url, 'POST',
+                                            body={'volume': {}})
+
+        self.assertEqual({'volume': {'id': '1234'}}, body)
+        json_codec.dumps.assert_called_once_with({'volume': {}})
+        json_codec.loads.assert_called_once_with(
+            b'{"volume": {"id": "1234"}}')
+        kwargs = mock_request.call_args[1]
+        self.assertEqual(b'{"volume": {}}', kwargs['data'])
+        self.assertNotIn('json', kwargs)
+        self.assertEqual('application/json',
+                         kwargs['headers']['Content-Type'])
+
+    @mock.patch.object(adapter.Adapter, 'request')
+    def test_sessionclient_request_hooks(self, mock_request):
+        mock_request.side_effect = [
+            utils.TestResponse({"status_code": 200,
+                                "text": '{"volumes": []}'}),
+            utils.TestResponse({"status_code": 404, "text": ''}),
+        ]
+        timings = []
+        session_client = cinderclient.client.SessionClient(
+            session=mock.Mock())
+        session_client.add_request_hook(timings.append)
+        session_client.get('/volumes/detail')
+        self.assertRaises(exceptions.NotFound, session_client.get,
+                          '/volumes/1234')
+
+        self.assertEqual([('GET', '/volumes/detail', 200, 15),
+                          ('GET', '/volumes/{id}', 404, None)],
+                         [(t.method, t.url, t.status, t.bytes)
+                          for t in timings])
+
     @mock.patch.object(exceptions, 'from_response')
     def test_keystone_request_raises_auth_failure_exception(
             self, mock_from_resp):
@@ -0,0 +1,59 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+
+from cinderclient import codec
+from cinderclient.tests.unit import utils
+
+DOCUMENT = {'volumes': [{'id': '1234', 'name': u'vol\xe9', 'size': 1,
+                         'bootable': False, 'metadata': {}}]}
+
+
+class CodecTest(utils.TestCase):
+
+    def _check_round_trip(self, json_codec):
+        encoded = json_codec.dumps(DOCUMENT)
+        if isinstance(encoded, bytes):
+            encoded = encoded.decode('utf-8')
+        self.assertEqual(DOCUMENT, codec.JSONCodec().loads(encoded))
+        data = codec.JSONCodec().dumps(DOCUMENT)
+        self.assertEqual(DOCUMENT, json_codec.loads(data))
+        self.assertEqual(DOCUMENT, json_codec.loads(data.encode('utf-8')))
+        self.assertRaises(ValueError, json_codec.loads, b'{"volumes": ')
+
+    def test_codecs(self):
+        for cls in codec.CODECS:
+            if cls.available():
+                self._check_round_trip(cls())
+
+    def test_default(self):
+        self.assertIsInstance(codec.get_codec(), codec.JSONCodec)
+        self.assertEqual('json', codec.get_codec().name)
+
+    def test_auto_picks_first_available(self):
+        with mock.patch.object(codec, 'orjson', None):
+            with mock.patch.object(codec, 'ujson', None):
+                self.assertEqual('simplejson', codec.get_codec('auto').name)
+                with mock.patch.object(codec, 'simplejson', None):
+                    self.assertEqual('json', codec.get_codec('auto').name)
+
+    def test_by_name(self):
+        self.assertEqual('json', codec.get_codec('json').name)
+        with mock.patch.object(codec, 'ujson', None):
+            self.assertRaises(ImportError, codec.get_codec, 'ujson')
+        self.assertRaises(ValueError, codec.get_codec, 'yaml')
+
+    def test_object_is_used_as_is(self):
+        json_codec = mock.Mock()
+        self.assertIs(json_codec, codec.get_codec(json_codec))
@@ -11,9 +11,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import mock
+import gzip
+import io
+import json
+import threading
+import zlib
 
+from keystoneclient import session
+import mock
 import requests
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+import testtools
 
 from cinderclient import client
 from cinderclient import exceptions
@@ -84,7 +93,7 @@ class ClientTest(utils.TestCase):
     def test_get(self):
         cl = get_authed_client()
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -116,7 +125,7 @@ class ClientTest(utils.TestCase):
             cl.auth_token = "token"
 
         @mock.patch.object(cl, 'authenticate', reauth)
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -124,6 +133,89 @@ class ClientTest(utils.TestCase):
         test_get_call()
         self.assertEqual([], self.requests)
 
+    def test_get_reauth_detects_lost_endpoint(self):
+        cl = get_authed_client(retries=0)
+        cl.auth_url = "http://keystone/v2.0"
+
+        def v2_auth(url):
+            # A catalog without the volume endpoint, e.g. from a plugin.
+            cl.auth_token = "new-token"
+
+        def request(method, url, headers=None, **kwargs):
+            if headers['X-Auth-Token'] == 'token':
+                return bad_401_response
+            return fake_response
+
+        with mock.patch.object(cl, '_v2_auth', side_effect=v2_auth):
+            with mock.patch.object(cl.http, "request", request):
+                self.assertRaises(exceptions.Unauthorized, cl.get, "/hi")
+        self.assertEqual("http://example.com", cl.management_url)
+
+    def test_get_reauth_single_flight(self):
+        cl = get_authed_client(retries=0)
+        threads = 4
+        barrier = threading.Barrier(threads) if hasattr(
+            threading, 'Barrier') else None
+        auth_calls = []
+
+        def request(method, url, headers=None, **kwargs):
+            if headers['X-Auth-Token'] == 'token':
+                # Make sure every thread has seen the old token fail.
+                if barrier:
+                    barrier.wait(5)
+                return bad_401_response
+            return fake_response
+
+        def reauth():
+            auth_calls.append(1)
+            cl.auth_token = "new-token"
+
+        errors = []
+
+        def get():
+            try:
+                cl.get("/hi")
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(cl, 'authenticate', reauth):
+            with mock.patch.object(cl.http, "request", request):
+                workers = [threading.Thread(target=get)
+                           for _ in range(threads)]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(1, len(auth_calls))
+
+    def test_get_refreshes_expiring_token(self):
+        cl = get_authed_client()
+        cl.auth_ref = mock.Mock(auth_token="token")
+        cl.auth_ref.will_expire_soon.return_value = True
+
+        def reauth():
+            cl.auth_token = "new-token"
+            cl.auth_ref = mock.Mock(auth_token="new-token")
+            cl.auth_ref.will_expire_soon.return_value = False
+
+        with mock.patch.object(cl, 'authenticate',
+                               mock.Mock(side_effect=reauth)) as auth:
+            with mock.patch.object(requests.Session, "request",
+                                   mock_request):
+                cl.get("/hi")
+                cl.get("/hi")
+        auth.assert_called_once_with()
+        headers = mock_request.call_args[1]['headers']
+        self.assertEqual("new-token", headers["X-Auth-Token"])
+
+    def test_token_expiring_ignores_other_tokens(self):
+        cl = get_authed_client()
+        cl.auth_ref = mock.Mock(auth_token="admin-token")
+        cl.auth_ref.will_expire_soon.return_value = True
+        self.assertFalse(cl._token_expiring())
+
     def test_get_retry_500(self):
         cl = get_authed_client(retries=1)
 
@@ -133,7 +225,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -150,7 +242,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -167,7 +259,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -184,7 +276,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -201,7 +293,7 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
@@ -216,7 +308,7 @@ class ClientTest(utils.TestCase):
     def test_post(self):
         cl = get_authed_client()
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_post_call():
             cl.post("/hi", body=[1, 2, 3])
             headers = {
@@ -235,6 +327,55 @@ class ClientTest(utils.TestCase):
 
         test_post_call()
 
+    def test_json_codec(self):
+        cl = client.HTTPClient("username", "password", "project_id",
+                               "auth_test", json_codec=mock.Mock())
+        cl.management_url = "http://example.com"
+        cl.auth_token = "token"
+        cl.json_codec.dumps.return_value = b'{"password": "secret"}'
+        cl.json_codec.loads.return_value = {"hi": "there"}
+        cl.http_log_debug = True
+
+        with mock.patch.object(requests.Session, "request",
+                               return_value=fake_response) as request:
+            resp, body = cl.post("/hi", body={"password": "secret"})
+
+        self.assertEqual({"hi": "there"}, body)
+        cl.json_codec.loads.assert_called_once_with(b'{"hi": "there"}')
+        self.assertEqual(b'{"password": "secret"}',
+                         request.call_args[1]['data'])
+
+    def test_response_decoded_from_content(self):
+        cl = get_authed_client()
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = u'{"volume": {"name": "vol\xe9"}}'.encode('utf-8')
+
+        with mock.patch.object(requests.Response, 'text',
+                               new_callable=mock.PropertyMock) as text:
+            self.assertEqual({"volume": {"name": u"vol\xe9"}},
+                             cl._process_response(resp))
+        self.assertFalse(text.called)
+
+    def test_response_not_decoded_if_not_json(self):
+        cl = get_authed_client()
+        json_codec = cl.json_codec = mock.Mock()
+        for content_type, content in (
+                ('application/json', b''),
+                ('text/html; charset=utf-8', b'<html>Bad gateway</html>'),
+                ('text/plain', b'[]')):
+            resp = requests.Response()
+            resp.status_code = 200
+            resp.headers['Content-Type'] = content_type
+            resp._content = content
+            self.assertIsNone(cl._process_response(resp))
+        self.assertFalse(json_codec.loads.called)
+
+        resp._content = b'[]'
+        resp.headers['Content-Type'] = 'application/json; charset=UTF-8'
+        cl._process_response(resp)
+        json_codec.loads.assert_called_once_with(b'[]')
+
     def test_bypass_url(self):
         cl = get_authed_bypass_url()
         self.assertEqual("volume/v100", cl.bypass_url)
@@ -244,7 +385,7 @@ class ClientTest(utils.TestCase):
         cl = get_client()
 
         # response must not have x-server-management-url header
-        @mock.patch.object(requests, "request", mock_request_empty)
+        @mock.patch.object(requests.Session, "request", mock_request_empty)
         def test_auth_call():
             self.assertRaises(exceptions.AuthorizationFailure,
                               cl.authenticate)
@@ -256,7 +397,7 @@ class ClientTest(utils.TestCase):
 
         # response must not have x-server-management-url header
         # {'hi': 'there'} is neither V2 or V3
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(NotImplementedError, cl.authenticate)
 
@@ -271,10 +412,356 @@ class ClientTest(utils.TestCase):
             next_request = self.requests.pop(0)
             return next_request(*args, **kwargs)
 
-        @mock.patch.object(requests, "request", request)
+        @mock.patch.object(requests.Session, "request", request)
         @mock.patch('time.time', mock.Mock(return_value=1234))
         def test_get_call():
             resp, body = cl.get("/hi")
 
         test_get_call()
         self.assertEqual(self.requests, [])
+
+    def test_http_session_reused(self):
+        cl = get_authed_client()
+        sessions = []
+
+        def request(session, *args, **kwargs):
+            sessions.append(session)
+            return fake_response
+
+        @mock.patch.object(requests.Session, "request", request)
+        def test_get_call():
+            cl.get("/hi")
+            cl.get("/hi")
+
+        test_get_call()
+        self.assertEqual([cl.http, cl.http], sessions)
+
+    def test_http_session_pool_options(self):
+        cl = client.HTTPClient("username", "password", "project_id",
+                               "auth_test", pool_connections=4,
+                               pool_maxsize=32, pool_block=True)
+        for prefix in ('http://', 'https://'):
+            adapter = cl.http.get_adapter(prefix + 'example.com')
+            self.assertEqual(4, adapter._pool_connections)
+            self.assertEqual(32, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+        self.assertEqual('keep-alive', cl.http.headers['Connection'])
+
+    def test_http_session_no_keepalive(self):
+        cl = client.HTTPClient("username", "password", "project_id",
+                               "auth_test", keepalive=False)
+        self.assertEqual('close', cl.http.headers['Connection'])
+
+
+class StreamedListTest(utils.TestCase):
+
+    BODY = (b'{"volumes": [{"id": "1", "metadata": {"a": [1, 2]}}, '
+            b'{"id": "2", "metadata": {}}], '
+            b'"volumes_links": [{"rel": "next", "href": "/v?marker=2"}]}')
+
+    def _response(self):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = io.BytesIO(self.BODY)
+        return resp
+
+    @testtools.skipIf(client.ijson is None, "ijson is not installed")
+    def test_get_streamed(self):
+        cl = get_authed_client()
+        request = mock.Mock(return_value=self._response())
+
+        with mock.patch.object(requests.Session, "request", request):
+            resp, items, rest = cl.get_streamed("/volumes", "volumes")
+            self.assertTrue(request.call_args[1]['stream'])
+            self.assertEqual({}, rest)
+            self.assertEqual([{"id": "1", "metadata": {"a": [1, 2]}},
+                              {"id": "2", "metadata": {}}], list(items))
+        self.assertEqual(
+            {"volumes_links": [{"rel": "next", "href": "/v?marker=2"}]},
+            rest)
+
+    @testtools.skipIf(client.ijson is None, "ijson is not installed")
+    def test_iter_json_array_rejects_non_array(self):
+        items = client.iter_json_array(io.BytesIO(b'{"volumes": {}}'),
+                                       "volumes", {})
+        self.assertRaises(ValueError, list, items)
+
+    @testtools.skipIf(client.ijson is None, "ijson is not installed")
+    def test_iter_json_array_decodes_floats(self):
+        rest = {}
+        items = client.iter_json_array(
+            io.BytesIO(b'{"pools": [{"free": 1.5, "total": 2}], "x": 0.5}'),
+            "pools", rest)
+        item = list(items)[0]
+        self.assertEqual({"free": 1.5, "total": 2}, item)
+        self.assertIsInstance(item["free"], float)
+        self.assertIsInstance(rest["x"], float)
+
+    def test_get_streamed_unavailable(self):
+        cl = get_authed_client()
+        with mock.patch.object(client, 'ijson', None):
+            self.assertIsNone(cl.get_streamed("/volumes", "volumes"))
+        cl.http_log_debug = True
+        self.assertIsNone(cl.get_streamed("/volumes", "volumes"))
+
+
+class RequestHooksTest(utils.TestCase):
+
+    def setUp(self):
+        super(RequestHooksTest, self).setUp()
+        self.cl = get_authed_client(retries=1)
+        self.timings = []
+        self.cl.add_request_hook(self.timings.append)
+        self.responses = []
+        request = mock.patch.object(requests.Session, "request",
+                                    side_effect=self._request)
+        request.start()
+        self.addCleanup(request.stop)
+        sleep = mock.patch.object(client, 'sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _request(self, *args, **kwargs):
+        return self.responses.pop(0)
+
+    def test_retry_counted(self):
+        self.responses = [bad_500_response, fake_response]
+        self.cl.get("/volumes/1234")
+
+        timing, = self.timings
+        self.assertEqual(('GET', '/volumes/{id}', 200, 1, 0),
+                         (timing.method, timing.url, timing.status,
+                          timing.retries, timing.reauths))
+        self.assertEqual(len(fake_response.content), timing.bytes)
+        self.assertIsNotNone(timing.total)
+
+    def test_reauth_counted(self):
+        def reauth():
+            self.cl.auth_token = "new-token"
+
+        self.responses = [bad_401_response, fake_response]
+        with mock.patch.object(self.cl, 'authenticate', reauth):
+            self.cl.get("/hi")
+        self.assertEqual(1, self.timings[0].reauths)
+        self.assertEqual(0, self.timings[0].retries)
+
+    def test_failure_recorded(self):
+        self.responses = [bad_400_response, bad_400_response]
+        self.assertRaises(exceptions.BadRequest, self.cl.get, "/hi")
+        timing, = self.timings
+        self.assertEqual(400, timing.status)
+        self.assertIsInstance(timing.error, exceptions.BadRequest)
+
+    def test_failing_hook_ignored(self):
+        self.cl.add_request_hook(mock.Mock(side_effect=ValueError))
+        self.responses = [fake_response]
+        resp, body = self.cl.get("/hi")
+        self.assertEqual({"hi": "there"}, body)
+        self.assertEqual(1, len(self.timings))
+
+    def test_no_timing_without_hooks(self):
+        self.cl.request_hooks = []
+        self.responses = [fake_response]
+        with mock.patch.object(client.instrumentation,
+                               'RequestTiming') as timing:
+            self.cl.get("/hi")
+        self.assertFalse(timing.called)
+
+
+class _GzipHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Records requests and gzips responses for clients that accept it."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        self.server.requests.append((dict(self.headers.items()), body))
+        content = json.dumps(
+            {'volumes': [{'id': '%04d' % i} for i in range(500)]})
+        content = content.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            out = io.BytesIO()
+            with gzip.GzipFile(fileobj=out, mode='wb') as f:
+                f.write(content)
+            content = out.getvalue()
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_PUT = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+class CompressionTest(utils.TestCase):
+
+    def setUp(self):
+        super(CompressionTest, self).setUp()
+        server = _Server(('127.0.0.1', 0), _GzipHandler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        self.cl = client.HTTPClient(
+            "username", "password", "project_id", "auth_test",
+            bypass_url='http://127.0.0.1:%d/v2/fake' % server.server_port,
+            compression=True)
+        self.cl.auth_token = "token"
+
+    def test_connect_time_recorded(self):
+        timings = []
+        self.cl.add_request_hook(timings.append)
+        self.cl.get('/volumes/detail')
+        self.cl.get(self.cl.management_url + '/volumes/detail?marker=1')
+        self.assertIsNotNone(timings[0].connect)
+        # The second request reuses the connection.
+        self.assertIsNone(timings[1].connect)
+        self.assertEqual(['/volumes/detail', '/volumes/detail'],
+                         [timing.url for timing in timings])
+
+    def test_session_client_connect_time_recorded(self):
+        timings = []
+        url = self.cl.management_url + '/volumes/detail'
+        cl = client.SessionClient(session=session.Session())
+        cl.add_request_hook(timings.append)
+        cl.request(url, 'GET')
+        cl.request(url, 'GET')
+        self.assertIsNotNone(timings[0].connect)
+        self.assertIsNone(timings[1].connect)
+
+    def test_session_client_leaves_session_alone_without_hooks(self):
+        keystone_session = session.Session()
+        adapters = dict(keystone_session.session.adapters)
+        pool_classes = [
+            dict(http_adapter.poolmanager.pool_classes_by_scheme)
+            for http_adapter in adapters.values()]
+        cl = client.SessionClient(session=keystone_session)
+        cl.request(self.cl.management_url + '/volumes/detail', 'GET')
+        self.assertEqual(adapters, keystone_session.session.adapters)
+        self.assertEqual(pool_classes, [
+            http_adapter.poolmanager.pool_classes_by_scheme
+            for http_adapter in adapters.values()])
+
+    def test_compressed_response(self):
+        resp, body = self.cl.get('/volumes/detail')
+        self.assertEqual('gzip', resp.headers['Content-Encoding'])
+        self.assertEqual(500, len(body['volumes']))
+        headers = self.server.requests[0][0]
+        self.assertIn('gzip', headers['Accept-Encoding'])
+
+    def test_large_request_body_compressed(self):
+        metadata = dict(('key%d' % i, 'value%d' % i) for i in range(200))
+        body = {'metadata': metadata}
+        self.cl.put('/volumes/1234/metadata', body=body)
+        self.cl.post('/volumes/1234/action', body={'os-reserve': None})
+
+        (headers, data), (small_headers, small_data) = self.server.requests
+        self.assertEqual('gzip', headers['Content-Encoding'])
+        self.assertLess(int(headers['Content-Length']), len(data))
+        self.assertEqual(body, json.loads(data.decode('utf-8')))
+        self.assertNotIn('Content-Encoding', small_headers)
+        self.assertEqual({'os-reserve': None},
+                         json.loads(small_data.decode('utf-8')))
+
+    def test_request_body_not_compressed_by_default(self):
+        self.cl.compression = False
+        metadata = dict(('key%d' % i, 'value%d' % i) for i in range(200))
+        self.cl.put('/volumes/1234/metadata', body={'metadata': metadata})
+        headers = self.server.requests[0][0]
+        self.assertNotIn('Content-Encoding', headers)
+
+    @testtools.skipIf(client.ijson is None, "ijson is not installed")
+    def test_compressed_streamed_listing(self):
+        resp, items, rest = self.cl.get_streamed('/volumes/detail',
+                                                 'volumes')
+        self.assertEqual(500, len(list(items)))
+
+
+class ResponseCacheTest(utils.TestCase):
+
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        self.cache = client.ResponseCache(ttl=30, maxsize=2)
+        self.http_client = mock.Mock()
+        self.responses = []
+        self.http_client.get.side_effect = lambda url, **kw: (
+            self.responses.pop(0))
+
+    def _response(self, status_code, headers=None, body=None):
+        resp = requests.Response()
+        resp.status_code = status_code
+        resp.headers.update(headers or {})
+        return resp, body
+
+    def test_revalidated_with_etag(self):
+        self.responses = [
+            self._response(200, {'ETag': '"v1"'}, {'volume_types': []}),
+            self._response(304, {'ETag': '"v1"'}),
+        ]
+        resp, body = self.cache.get(self.http_client, '/types')
+        body['volume_types'].append('modified by the caller')
+        resp, body = self.cache.get(self.http_client, '/types')
+
+        self.assertEqual({'volume_types': []}, body)
+        self.assertEqual(200, resp.status_code)
+        self.http_client.get.assert_called_with(
+            '/types', headers={'If-None-Match': '"v1"'})
+
+    def test_revalidated_with_last_modified(self):
+        date = 'Sat, 01 Oct 2016 10:00:00 GMT'
+        self.responses = [
+            self._response(200, {'Last-Modified': date}, {'limits': {}}),
+            self._response(200, {'Last-Modified': date}, {'limits': {1: 2}}),
+        ]
+        self.cache.get(self.http_client, '/limits')
+        resp, body = self.cache.get(self.http_client, '/limits')
+        self.assertEqual({'limits': {1: 2}}, body)
+        self.http_client.get.assert_called_with(
+            '/limits', headers={'If-Modified-Since': date})
+
+    @mock.patch('time.time')
+    def test_ttl_without_validators(self, mock_time):
+        mock_time.return_value = 1000
+        self.responses = [self._response(200, body={'pools': [1]}),
+                          self._response(200, body={'pools': [2]})]
+        self.cache.get(self.http_client, '/pools')
+        mock_time.return_value = 1029
+        self.assertEqual({'pools': [1]},
+                         self.cache.get(self.http_client, '/pools')[1])
+        self.assertEqual(1, self.http_client.get.call_count)
+
+        mock_time.return_value = 1030
+        self.assertEqual({'pools': [2]},
+                         self.cache.get(self.http_client, '/pools')[1])
+        self.http_client.get.assert_called_with('/pools', headers={})
+
+    def test_least_recently_used_dropped(self):
+        self.responses = [self._response(200, body={'url': url})
+                          for url in ('/a', '/b', '/c', '/a')]
+        for url in ('/a', '/b', '/b', '/c', '/a'):
+            self.cache.get(self.http_client, url)
+        self.assertEqual(4, self.http_client.get.call_count)
+
+    def test_clear(self):
+        self.responses = [self._response(200, body={}),
+                          self._response(200, body={})]
+        self.cache.get(self.http_client, '/types')
+        self.cache.clear()
+        self.cache.get(self.http_client, '/types')
+        self.assertEqual(2, self.http_client.get.call_count)
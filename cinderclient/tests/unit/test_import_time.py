@@ -0,0 +1,85 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import testtools
+
+from cinderclient.tests.unit import utils
+
+# Cumulative import time, in milliseconds, allowed for the modules below.
+# Deliberately generous: the module lists are what catch regressions, the
+# budget only guards against something pathological.
+IMPORT_BUDGET_MS = int(os.environ.get('CINDERCLIENT_IMPORT_BUDGET_MS', 3000))
+
+# Modules that are only needed once a command actually runs.
+DEFERRED = ('keystoneclient.access',
+            'keystoneclient.discover',
+            'keystoneclient.auth.identity.v2',
+            'keystoneclient.auth.identity.v3',
+            'prettytable',
+            'multiprocessing.pool')
+
+
+def _import_times(module):
+    """Return the modules loaded by importing ``module``.
+
+    :returns: dict of {module name: cumulative import time in us}; modules
+              imported through importlib, e.g. the lazily imported
+              keystoneclient submodules, are only in :data:`sys.modules`
+              and have no time
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__)))))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        p for p in (root, env.get('PYTHONPATH')) if p)
+    proc = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import sys; import %s; print("\\n".join(sys.modules))' % module],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    out, err = proc.communicate()
+    times = dict((name, None)
+                 for name in out.decode('utf-8').splitlines())
+    for line in err.decode('utf-8').splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            _self, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            # The header line.
+            continue
+    return times
+
+
+@testtools.skipIf(sys.version_info < (3, 7), "-X importtime needs 3.7+")
+class ImportTimeTest(utils.TestCase):
+
+    def _check(self, module, deferred):
+        times = _import_times(module)
+        self.assertIn(module, times)
+        for name in deferred:
+            self.assertFalse(name in times,
+                             "%s imports %s eagerly" % (module, name))
+        self.assertLess(times[module] / 1000.0, IMPORT_BUDGET_MS)
+
+    def test_client(self):
+        self._check('cinderclient.v2.client', DEFERRED)
+
+    def test_shell(self):
+        self._check('cinderclient.shell',
+                    DEFERRED + ('cinderclient.v1.shell',
+                                'cinderclient.v2.shell'))
@@ -0,0 +1,106 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import mock
+import requests
+
+from cinderclient import exceptions
+from cinderclient import instrumentation
+from cinderclient.tests.unit import utils
+
+
+def _timing(method='GET', url='/volumes', total=0.1, status=200,
+            error=None):
+    timing = instrumentation.RequestTiming(method, url)
+    timing.total = total
+    timing.status = status
+    timing.error = error
+    return timing
+
+
+class InstrumentationTest(utils.TestCase):
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v2/{id}/volumes/{id}/action',
+            instrumentation.url_template(
+                'http://cinder:8776/v2/eb72eb33a0084acf8eb21356c2b021a7/'
+                'volumes/6a3b8f4e-0c5d-4f00-9a57-000000000001/action?x=1'))
+        self.assertEqual('/types/{id}/extra_specs',
+                         instrumentation.url_template(
+                             '/types/1/extra_specs'))
+        self.assertEqual('/types/default',
+                         instrumentation.url_template('/types/default'))
+
+    def test_finish(self):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b'{"volumes": []}'
+        resp.elapsed = datetime.timedelta(milliseconds=20)
+        instrumentation.reset_connect_time()
+        timing = instrumentation.RequestTiming('GET', '/volumes')
+        timing.finish(resp)
+
+        self.assertEqual(200, timing.status)
+        self.assertEqual(15, timing.bytes)
+        self.assertEqual(0.02, timing.ttfb)
+        self.assertIsNone(timing.connect)
+        self.assertIsNone(timing.dns)
+        self.assertGreaterEqual(timing.total, 0)
+
+        resp.headers['Content-Length'] = '1024'
+        timing.finish(resp, streamed=True)
+        self.assertEqual(1024, timing.bytes)
+
+    def test_finish_with_error(self):
+        timing = instrumentation.RequestTiming('GET', '/volumes/1')
+        error = exceptions.NotFound(404)
+        timing.finish(error=error)
+        self.assertEqual(404, timing.status)
+        self.assertIs(error, timing.error)
+
+    def test_histogram(self):
+        histogram = instrumentation.TimingHistogram()
+        for total in (0.004, 0.02, 0.02, 0.2, 3.0):
+            histogram(_timing(total=total))
+        histogram(_timing(method='DELETE', url='/volumes/1', status=404))
+        histogram(_timing(method='DELETE', url='/volumes/2', status=None,
+                          error=requests.exceptions.ConnectionError()))
+
+        get, delete = histogram.summary()
+        self.assertEqual(('GET', '/volumes', 5, 0),
+                         (get['Method'], get['URL'], get['Count'],
+                          get['Errors']))
+        self.assertAlmostEqual(648.8, get['Mean'])
+        self.assertEqual(25, get['P50'])
+        self.assertEqual(3000, get['P90'])
+        self.assertEqual(3000, get['Max'])
+        self.assertIsNone(get['Connect'])
+        self.assertEqual(('DELETE', '/volumes/{id}', 2, 2),
+                         (delete['Method'], delete['URL'], delete['Count'],
+                          delete['Errors']))
+
+        histogram.reset()
+        self.assertEqual([], histogram.summary())
+
+    @mock.patch('time.time')
+    def test_connect_time(self, mock_time):
+        mock_time.side_effect = [10.0, 10.25]
+        connection = instrumentation._TimedHTTPConnection('localhost', 80)
+        base_class = instrumentation.connectionpool.HTTPConnectionPool
+        instrumentation.reset_connect_time()
+        with mock.patch.object(base_class.ConnectionCls, 'connect'):
+            connection.connect()
+        self.assertEqual(0.25, instrumentation.get_connect_time())
@@ -23,6 +23,7 @@ import requests
 from six import moves
 from testtools import matchers
 
+from cinderclient import cache
 from cinderclient import exceptions
 from cinderclient import auth_plugin
 from cinderclient import shell
@@ -95,6 +96,53 @@ class ShellTest(utils.TestCase):
             self.assertThat(help_text,
                             matchers.MatchesRegex(r, re.DOTALL | re.MULTILINE))
 
+    def test_subcommand_parser_lazy(self):
+        _shell = shell.OpenStackCinderShell()
+        _shell.extensions = []
+        _shell.get_subcommand_parser('2', command='list')
+        self.assertEqual(['list'], list(_shell.subcommands))
+
+    def test_subcommand_parser_lazy_unknown_command(self):
+        _shell = shell.OpenStackCinderShell()
+        _shell.extensions = []
+        _shell.get_subcommand_parser('2', command='type_list')
+        self.assertIn('type-list', _shell.subcommands)
+        self.assertIn('bash_completion', _shell.subcommands)
+        self.assertIn('create', _shell.subcommands)
+
+    def test_subcommand_parser_lazy_extension_wins(self):
+        class Extension(object):
+            @staticmethod
+            def do_list(cs, args):
+                pass
+
+        _shell = shell.OpenStackCinderShell()
+        _shell.extensions = [mock.Mock(module=Extension)]
+        parser = _shell.get_subcommand_parser('2', command='list')
+        self.assertEqual(Extension.do_list,
+                         parser.parse_args(['list']).func)
+
+    def _discover_extensions(self, command=None):
+        _shell = shell.OpenStackCinderShell()
+        extensions = _shell._discover_extensions('2', command=command)
+        return sorted(extension.name for extension in extensions)
+
+    def test_discover_extensions_indexed(self):
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR',
+            self.useFixture(fixtures.TempDir()).path))
+        self.assertEqual(['list_extensions'], self._discover_extensions())
+        with mock.patch.object(shell.OpenStackCinderShell,
+                               '_discover_via_contrib_path') as mock_scan:
+            # Only the extension providing the command is loaded.
+            self.assertEqual(['list_extensions'],
+                             self._discover_extensions('list-extensions'))
+            self.assertEqual([], self._discover_extensions('list'))
+            # Unknown commands load everything for the error message.
+            self.assertEqual(['list_extensions'],
+                             self._discover_extensions('foofoo'))
+        self.assertFalse(mock_scan.called)
+
     def register_keystone_auth_fixture(self, mocker, url):
         mocker.register_uri('GET', url,
                             text=keystone_client.keystone_request_callback)
@@ -122,6 +170,33 @@ class ShellTest(utils.TestCase):
         self.assertEqual(v3_url, os_auth_url, "Expected v3 url")
         self.assertIsNone(v2_url, "Expected no v2 url")
 
+    @mock.patch('keystoneclient.discover.Discover')
+    def test_version_discovery_cached(self, mock_discover):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.useFixture(fixtures.EnvironmentVariable(
+            'CINDERCLIENT_UUID_CACHE_DIR', cache_dir))
+        discovery_cache = cache.DiscoveryCache()
+        os_auth_url = "https://keystone.discovery.com:5000"
+        mock_discover.return_value.url_for.side_effect = [
+            os_auth_url + '/v2.0', os_auth_url + '/v3']
+
+        _shell = shell.OpenStackCinderShell()
+        for _ in range(2):
+            v2_url, v3_url = _shell._discover_auth_versions(
+                None, auth_url=os_auth_url, discovery_cache=discovery_cache)
+            self.assertEqual(os_auth_url + '/v2.0', v2_url)
+            self.assertEqual(os_auth_url + '/v3', v3_url)
+        self.assertEqual(1, mock_discover.call_count)
+
+        # Guesses made when discovery is unavailable are not cached.
+        mock_discover.side_effect = ks_exc.ConnectionRefused()
+        os_auth_url = "https://keystone.discovery.com:5000/v2.0"
+        for _ in range(2):
+            v2_url, v3_url = _shell._discover_auth_versions(
+                None, auth_url=os_auth_url, discovery_cache=discovery_cache)
+            self.assertEqual(os_auth_url, v2_url)
+        self.assertEqual(3, mock_discover.call_count)
+
     @requests_mock.Mocker()
     def list_volumes_on_service(self, count, mocker):
         os_auth_url = "http://multiple.service.names/v2.0"
@@ -141,6 +216,32 @@ class ShellTest(utils.TestCase):
         for count in range(1, 4):
             self.list_volumes_on_service(count)
 
+    @requests_mock.Mocker()
+    def test_token_cache(self, mocker):
+        os_auth_url = "http://multiple.service.names/v2.0"
+        token_mock = mocker.register_uri(
+            'POST', os_auth_url + "/tokens",
+            text=keystone_client.keystone_request_callback)
+        mocker.register_uri('GET', "http://cinder1.api.com/v2/volumes/detail",
+                            text='{"volumes": []}')
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        self.make_env(include={'OS_AUTH_URL': os_auth_url,
+                               'CINDER_SERVICE_NAME': 'cinder1',
+                               'CINDERCLIENT_UUID_CACHE_DIR': cache_dir})
+
+        shell.OpenStackCinderShell().main(['--os-cache', 'list'])
+        shell.OpenStackCinderShell().main(['--os-cache', 'list'])
+        self.assertEqual(1, token_mock.call_count)
+
+        # A different password never reuses the cached token.
+        shell.OpenStackCinderShell().main(['--os-cache', '--os-password',
+                                           'other', 'list'])
+        self.assertEqual(2, token_mock.call_count)
+
+        # Without --os-cache the cache is neither read nor written.
+        shell.OpenStackCinderShell().main(['list'])
+        self.assertEqual(3, token_mock.call_count)
+
     @mock.patch('keystoneclient.adapter.Adapter.get_token',
                 side_effect=ks_exc.ConnectionRefused())
     @mock.patch('keystoneclient.discover.Discover',
@@ -154,7 +255,7 @@ class ShellTest(utils.TestCase):
         self.assertRaises(ks_exc.ConnectionRefused, _shell.main, ['list'])
         mock_getpass.assert_called_with('OS Password: ')
 
-    @mock.patch.object(requests, "request")
+    @mock.patch.object(requests.Session, "request")
     @mock.patch.object(pkg_resources, "iter_entry_points")
     def test_auth_system_not_keystone(self, mock_iter_entry_points,
                                       mock_request):
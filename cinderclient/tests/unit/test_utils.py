@@ -112,6 +112,91 @@ class FindResourceTestCase(test_utils.TestCase):
         self.assertEqual(display_manager.get('4242'), output)
 
 
+class MakeResourceFinderTestCase(test_utils.TestCase):
+
+    def setUp(self):
+        super(MakeResourceFinderTestCase, self).setUp()
+        self.manager = FakeManager(None)
+        self.manager.list = mock.Mock(side_effect=self.manager.list)
+        self.manager.get = mock.Mock(side_effect=self.manager.get)
+
+    def test_names_resolved_with_one_listing(self):
+        names = ['entity_one', 'entity_two', UUID, 'asdf']
+        find = utils.make_resource_finder(self.manager, names)
+        self.assertEqual('1234', find('entity_one').id)
+        self.assertEqual(UUID, find('entity_two').id)
+        self.assertEqual(UUID, find(UUID).id)
+        self.assertRaises(exceptions.CommandError, find, 'asdf')
+        self.assertEqual(1, self.manager.list.call_count)
+        self.assertFalse(self.manager.get.called)
+
+    def test_ids_are_not_listed(self):
+        find = utils.make_resource_finder(self.manager, ['1234', UUID])
+        self.assertEqual('1234', find('1234').id)
+        self.assertEqual(UUID, find(UUID).id)
+        self.assertFalse(self.manager.list.called)
+
+    def test_duplicate_names(self):
+        self.manager.resources = [FakeResource('1', {'name': 'dup'}),
+                                  FakeResource('2', {'name': 'dup'})]
+        find = utils.make_resource_finder(self.manager, ['dup', '1'])
+        self.assertRaises(exceptions.CommandError, find, 'dup')
+        self.assertEqual('1', find('1').id)
+
+    def test_failed_listing_falls_back_to_each(self):
+        self.manager.list.side_effect = exceptions.ClientException(500)
+        find = utils.make_resource_finder(self.manager,
+                                          ['entity_one', '1234'])
+        self.assertEqual('1234', find('1234').id)
+        self.assertRaises(exceptions.ClientException, find, 'entity_one')
+
+
+class FindCachedResourceTestCase(test_utils.TestCase):
+
+    def setUp(self):
+        super(FindCachedResourceTestCase, self).setUp()
+        api = mock.Mock(resolution_cache=base.ResolutionCache())
+        self.manager = FakeManager(api)
+        self.manager.resources = [FakeResource('1234', {'name': 'one'})]
+        api.resolution_cache.add('FakeResource', self.manager.resources)
+        self.manager.list = mock.Mock(side_effect=self.manager.list)
+
+    def test_cached_name_needs_no_listing(self):
+        output = utils.find_resource(self.manager, 'one')
+        self.assertEqual('1234', output.id)
+        self.assertFalse(self.manager.list.called)
+
+    def test_deleted_resource_falls_back(self):
+        self.manager.resources = [FakeResource('5678', {'name': 'one'})]
+        output = utils.find_resource(self.manager, 'one')
+        self.assertEqual('5678', output.id)
+        self.assertTrue(self.manager.list.called)
+
+    def test_renamed_resource_falls_back(self):
+        self.manager.resources[0].name = 'two'
+        self.assertRaises(exceptions.CommandError,
+                          utils.find_resource, self.manager, 'one')
+
+
+class RunForEachTestCase(test_utils.TestCase):
+
+    def _check(self, workers):
+        def func(item):
+            if item % 3 == 0:
+                raise exceptions.NotFound(item)
+
+        results = list(utils.run_for_each(func, range(10), workers))
+        self.assertEqual(list(range(10)), [item for item, e in results])
+        failed = [item for item, e in results if e is not None]
+        self.assertEqual([0, 3, 6, 9], failed)
+
+    def test_run_for_each_serial(self):
+        self._check(1)
+
+    def test_run_for_each_parallel(self):
+        self._check(4)
+
+
 class CaptureStdout(object):
     """Context manager for capturing stdout from statements in its block."""
     def __enter__(self):
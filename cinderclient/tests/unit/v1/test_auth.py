@@ -53,7 +53,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -126,7 +126,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -174,7 +174,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(exceptions.Unauthorized, cs.client.authenticate)
 
@@ -228,7 +228,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(side_effect=side_effect)
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -278,7 +278,7 @@ class AuthenticationTests(utils.TestCase):
         })
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -306,7 +306,7 @@ class AuthenticationTests(utils.TestCase):
         auth_response = utils.TestResponse({"status_code": 401})
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(exceptions.Unauthorized, cs.client.authenticate)
 
@@ -150,6 +150,7 @@ class TestAbsoluteLimit(utils.TestCase):
 class TestLimitsManager(utils.TestCase):
     def test_get(self):
         api = mock.Mock()
+        api.response_cache = None
         api.client.get.return_value = (
             None,
             {"limits": {"absolute": {"name1": "value1", }},
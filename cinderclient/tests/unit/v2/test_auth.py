@@ -56,7 +56,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -129,7 +129,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -177,7 +177,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(exceptions.Unauthorized, cs.client.authenticate)
 
@@ -231,7 +231,7 @@ class AuthenticateAgainstKeystoneTests(utils.TestCase):
 
         mock_request = mock.Mock(side_effect=side_effect)
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -281,7 +281,7 @@ class AuthenticationTests(utils.TestCase):
         })
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             cs.client.authenticate()
             headers = {
@@ -309,7 +309,7 @@ class AuthenticationTests(utils.TestCase):
         auth_response = utils.TestResponse({"status_code": 401})
         mock_request = mock.Mock(return_value=(auth_response))
 
-        @mock.patch.object(requests, "request", mock_request)
+        @mock.patch.object(requests.Session, "request", mock_request)
         def test_auth_call():
             self.assertRaises(exceptions.Unauthorized, cs.client.authenticate)
 
@@ -16,10 +16,12 @@
 import fixtures
 import mock
 from requests_mock.contrib import fixture as requests_mock_fixture
+import six
 from six.moves.urllib import parse
 
 from cinderclient import client
 from cinderclient import exceptions
+from cinderclient import instrumentation
 from cinderclient import shell
 from cinderclient.v2 import volumes
 from cinderclient.v2 import shell as test_shell
@@ -391,6 +393,39 @@ class ShellTest(utils.TestCase):
         self.assert_called_anytime('DELETE', '/volumes/1234')
         self.assert_called('DELETE', '/volumes/5678')
 
+    def test_delete_multiple_by_name_lists_once(self):
+        self.run_command('delete sample-volume 5678')
+        listings = [call for call in self.shell.cs.client.callstack
+                    if call[0] == 'GET' and '/volumes/detail' in call[1]]
+        self.assertEqual([('GET', '/volumes/detail?all_tenants=1')],
+                         [call[0:2] for call in listings])
+        self.assert_called_anytime('DELETE', '/volumes/1234')
+        self.assert_called('DELETE', '/volumes/5678')
+
+    @mock.patch.object(shell.OpenStackCinderShell, '_print_timings')
+    def test_timings(self, mock_print):
+        self.run_command('--timings list')
+        histogram, = self.shell.cs.client.request_hooks
+        self.assertIsInstance(histogram, instrumentation.TimingHistogram)
+        mock_print.assert_called_once_with(histogram)
+
+    def test_print_timings(self):
+        histogram = instrumentation.TimingHistogram()
+        timing = instrumentation.RequestTiming('GET', '/volumes/1234')
+        timing.finish(error=exceptions.NotFound(404))
+        histogram(timing)
+        with mock.patch('sys.stdout', new=six.StringIO()) as stdout:
+            self.shell._print_timings(histogram)
+        out = stdout.getvalue()
+        self.assertIn('API call timings', out)
+        self.assertIn('/volumes/{id}', out)
+        self.assertIn('| P99', out)
+
+    def test_delete_multiple_parallel(self):
+        self.run_command('delete --parallel 2 1234 5678')
+        self.assert_called_anytime('DELETE', '/volumes/1234')
+        self.assert_called_anytime('DELETE', '/volumes/5678')
+
     def test_backup(self):
         self.run_command('backup-create 1234')
         self.assert_called('POST', '/backups')
@@ -557,6 +592,13 @@ class ShellTest(utils.TestCase):
         self.assert_called_anytime('POST', '/volumes/1234/action',
                                    body=expected)
 
+    def test_reset_state_two_with_one_nonexistent_parallel(self):
+        cmd = 'reset-state --parallel 2 1234 123456789'
+        self.assertRaises(exceptions.CommandError, self.run_command, cmd)
+        expected = {'os-reset_status': {'status': 'available'}}
+        self.assert_called_anytime('POST', '/volumes/1234/action',
+                                   body=expected)
+
     def test_reset_state_one_with_one_nonexistent(self):
         cmd = 'reset-state 123456789'
         self.assertRaises(exceptions.CommandError, self.run_command, cmd)
@@ -42,3 +42,12 @@ class SnapshotActionsTest(utils.FixturedTestCase):
     def test_list_snapshots_with_sort(self):
         self.cs.volume_snapshots.list(sort="id")
         self.assert_called('GET', '/snapshots/detail?sort=id')
+
+    def test_iter_snapshots_follows_next_link(self):
+        snapshots = self.cs.volume_snapshots.iter(
+            search_opts={'status': 'available'})
+        self.assertEqual('1234', next(snapshots).id)
+        self.assert_called('GET', '/snapshots/detail?status=available')
+        self.assertEqual(['5678'], [s.id for s in snapshots])
+        self.assert_called('GET',
+                           '/snapshots/detail?marker=1234&status=available')
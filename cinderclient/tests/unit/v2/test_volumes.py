@@ -39,6 +39,11 @@ class VolumesTest(utils.TestCase):
         self.assertRaises(ValueError,
                           cs.volumes.list, sort_key='id', sort_dir='invalid')
 
+    def test_findall_pushes_server_filters(self):
+        cs.volumes.findall(status='available', human_id='sample-volume')
+        cs.assert_called('GET',
+                         '/volumes/detail?all_tenants=1&status=available')
+
     def test__list(self):
         # There only 2 volumes available for our tests, so we set limit to 2.
         limit = 2
@@ -66,6 +71,52 @@ class VolumesTest(utils.TestCase):
         self.assertEqual(fake_volumes, volumes)
         cs.client.osapi_max_limit = 1000
 
+    def test_iter_volumes_fetches_pages_lazily(self):
+        cs.client.osapi_max_limit = 1
+        self.addCleanup(setattr, cs.client, 'osapi_max_limit', 1000)
+        url = "/volumes?limit=1"
+
+        volumes = cs.volumes._list_iter(url, "volumes")
+        self.assertEqual(1234, next(volumes).id)
+        cs.assert_called('GET', url)
+        self.assertEqual([5678], [v.id for v in volumes])
+        cs.assert_called('GET', '/volumes?limit=1&marker=1234')
+
+    def test_list_volumes_with_prefetch(self):
+        cs.client.osapi_max_limit = 1
+        self.addCleanup(setattr, cs.client, 'osapi_max_limit', 1000)
+        cs.prefetch_pages = 2
+        self.addCleanup(setattr, cs, 'prefetch_pages', 0)
+
+        volumes = cs.volumes._list("/volumes?limit=1", "volumes")
+        self.assertEqual([1234, 5678], [v.id for v in volumes])
+        cs.assert_called('GET', '/volumes?limit=1&marker=1234')
+
+    def test_iter_volumes(self):
+        volumes = cs.volumes.iter(limit=1)
+        self.assertEqual([1234], [v.id for v in volumes])
+        cs.assert_called('GET', '/volumes/detail?limit=1')
+
+    def test_bulk_action(self):
+        v = cs.volumes.get('1234')
+        cs.clear_callstack()
+        results = cs.volumes.bulk('os-reset_status', [v, '5678', '0000'],
+                                  concurrency=2, status='error')
+        self.assertEqual(3, len(results))
+        self.assertEqual(202, results[0][0].status_code)
+        self.assertEqual(202, results[1][0].status_code)
+        self.assertIsInstance(results[2], AssertionError)
+        cs.assert_called_anytime('POST', '/volumes/1234/action',
+                                 {'os-reset_status': {'status': 'error'}})
+        cs.assert_called_anytime('POST', '/volumes/5678/action',
+                                 {'os-reset_status': {'status': 'error'}})
+
+    def test_bulk_action_without_body(self):
+        results = cs.volumes.bulk('os-reserve', ['1234'])
+        self.assertEqual(202, results[0][0].status_code)
+        cs.assert_called('POST', '/volumes/1234/action',
+                         {'os-reserve': None})
+
     def test_delete_volume(self):
         v = cs.volumes.list()[0]
         v.delete()
@@ -15,17 +15,20 @@
 
 from __future__ import print_function
 
+import collections
 import os
-import pkg_resources
 import sys
 import uuid
 
 import six
-import prettytable
 
 from cinderclient import exceptions
 from oslo_utils import encodeutils
 
+# NOTE: prettytable, pkg_resources and multiprocessing are imported where
+# they are used. Most importers of this module never need them and they
+# add noticeably to the time it takes to import cinderclient.
+
 
 def arg(*args, **kwargs):
     """Decorator for CLI args."""
@@ -158,6 +161,8 @@ def print_list(objs, fields, exclude_unavailable=False, formatters=None,
     for f in removed_fields:
         fields.remove(f)
 
+    import prettytable
+
     pt = prettytable.PrettyTable((f for f in fields), caching=False)
     pt.aligns = ['l' for f in fields]
     for row in rows:
@@ -171,6 +176,8 @@ def print_list(objs, fields, exclude_unavailable=False, formatters=None,
 
 
 def print_dict(d, property="Property"):
+    import prettytable
+
     pt = prettytable.PrettyTable([property, 'Value'], caching=False)
     pt.aligns = ['l', 'l']
     for r in six.iteritems(d):
@@ -181,8 +188,36 @@ def print_dict(d, property="Property"):
     _print(pt, property)
 
 
+def _find_cached_resource(manager, name_or_id):
+    """Resolve ``name_or_id`` via the client's resolution cache, or None."""
+    cache = getattr(getattr(manager, 'api', None), 'resolution_cache', None)
+    resource_class = getattr(manager, 'resource_class', None)
+    if not cache or resource_class is None:
+        return None
+    resource_id = cache.get(resource_class.__name__, name_or_id)
+    if resource_id is None:
+        return None
+    try:
+        resource = manager.get(resource_id)
+    except exceptions.NotFound:
+        resource = None
+    else:
+        # A renamed resource no longer answers to the cached name.
+        names = (resource_id,
+                 getattr(resource, resource_class.NAME_ATTR, None),
+                 getattr(resource, 'human_id', None))
+        if name_or_id in names:
+            return resource
+    cache.invalidate(resource_id)
+    return None
+
+
 def find_resource(manager, name_or_id):
     """Helper for the _find_* methods."""
+    resource = _find_cached_resource(manager, name_or_id)
+    if resource is not None:
+        return resource
+
     # first try to get entity as integer id
     try:
         if isinstance(name_or_id, int) or name_or_id.isdigit():
@@ -212,15 +247,97 @@ def find_resource(manager, name_or_id):
         try:
             return manager.find(human_id=name_or_id)
         except exceptions.NotFound:
-            msg = "No %s with a name or ID of '%s' exists." % \
-                (manager.resource_class.__name__.lower(), name_or_id)
-            raise exceptions.CommandError(msg)
+            raise _not_found_error(manager, name_or_id)
 
     except exceptions.NoUniqueMatch:
-        msg = ("Multiple %s matches found for '%s', use an ID to be more"
-               " specific." % (manager.resource_class.__name__.lower(),
-                               name_or_id))
-        raise exceptions.CommandError(msg)
+        raise _no_unique_match_error(manager, name_or_id)
+
+
+def _not_found_error(manager, name_or_id):
+    msg = "No %s with a name or ID of '%s' exists." % \
+        (manager.resource_class.__name__.lower(), name_or_id)
+    return exceptions.CommandError(msg)
+
+
+def _no_unique_match_error(manager, name_or_id):
+    msg = ("Multiple %s matches found for '%s', use an ID to be more"
+           " specific." % (manager.resource_class.__name__.lower(),
+                           name_or_id))
+    return exceptions.CommandError(msg)
+
+
+def _is_id(name_or_id):
+    if isinstance(name_or_id, int) or name_or_id.isdigit():
+        return True
+    try:
+        uuid.UUID(name_or_id)
+        return True
+    except ValueError:
+        return False
+
+
+def make_resource_finder(manager, names_or_ids):
+    """Resolve several names or IDs at once, for commands taking many.
+
+    Calling :func:`find_resource` for each of them may list every resource
+    of the tenant once or twice per name. Here all of them are resolved
+    from a single listing instead, when at least one is a name; IDs alone
+    are cheaper to get one by one.
+
+    :returns: a function that takes one of ``names_or_ids`` and, like
+              :func:`find_resource`, returns its resource or raises
+              CommandError; if the listing fails, every one of
+              ``names_or_ids`` is looked up with :func:`find_resource`
+    """
+    found = {}
+    resources = None
+    if (len(set(names_or_ids)) > 1 and
+            not all(_is_id(name_or_id) for name_or_id in names_or_ids)):
+        try:
+            resources = manager.findall()
+        except Exception:
+            # Leave it to find_resource, so that the error is reported for
+            # each of them rather than failing the whole command at once.
+            pass
+
+    if resources is not None:
+        name_attr = manager.resource_class.NAME_ATTR
+        by_id = {}
+        by_name = collections.defaultdict(list)
+        by_human_id = collections.defaultdict(list)
+        for resource in resources:
+            by_id[six.text_type(resource.id)] = resource
+            by_name[getattr(resource, name_attr, None)].append(resource)
+            by_human_id[getattr(resource, 'human_id', None)].append(resource)
+
+        for name_or_id in names_or_ids:
+            key = name_or_id
+            if sys.version_info <= (3, 0):
+                key = encodeutils.safe_decode(key)
+            key = six.text_type(key)
+            if key in by_id:
+                found[name_or_id] = by_id[key]
+                continue
+            matches = by_name.get(key) or by_human_id.get(key)
+            if not matches:
+                # IDs of resources that are not listed, e.g. because of
+                # their state, can still be looked up one by one.
+                if not _is_id(name_or_id):
+                    found[name_or_id] = _not_found_error(manager, name_or_id)
+            elif len(matches) > 1:
+                found[name_or_id] = _no_unique_match_error(manager,
+                                                           name_or_id)
+            else:
+                found[name_or_id] = matches[0]
+
+    def find(name_or_id):
+        if name_or_id not in found:
+            return find_resource(manager, name_or_id)
+        if isinstance(found[name_or_id], Exception):
+            raise found[name_or_id]
+        return found[name_or_id]
+
+    return find
 
 
 def find_volume(cs, volume):
@@ -228,6 +345,42 @@ def find_volume(cs, volume):
     return find_resource(cs.volumes, volume)
 
 
+def map_concurrently(func, items, workers=1):
+    """Call ``func`` on every item, on up to ``workers`` threads at once.
+
+    Yields ``(item, result, error)`` tuples in the order of ``items`` as
+    soon as each call (and the ones before it) has finished. ``error`` is
+    the exception raised by the call, or None when it succeeded.
+    """
+    def call(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    items = list(items)
+    workers = min(workers or 1, len(items))
+    if workers <= 1:
+        for item in items:
+            yield call(item)
+        return
+
+    from multiprocessing import pool
+
+    thread_pool = pool.ThreadPool(workers)
+    try:
+        for result in thread_pool.imap(call, items):
+            yield result
+    finally:
+        thread_pool.terminate()
+
+
+def run_for_each(func, items, workers=1):
+    """Like :func:`map_concurrently`, but yields ``(item, error)`` tuples."""
+    for item, result, error in map_concurrently(func, items, workers):
+        yield item, error
+
+
 def safe_issubclass(*args):
     """Like issubclass, but will just return False if not a class."""
 
@@ -242,6 +395,8 @@ def safe_issubclass(*args):
 
 def _load_entry_point(ep_name, name=None):
     """Try to load the entry point ep_name that matches name."""
+    import pkg_resources
+
     for ep in pkg_resources.iter_entry_points(ep_name, name=name):
         try:
             return ep.load()
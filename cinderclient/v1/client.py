@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from cinderclient import base
 from cinderclient import client
 from cinderclient.v1 import availability_zones
 from cinderclient.v1 import limits
@@ -54,10 +55,42 @@ class Client(object):
                  volume_service_name=None, bypass_url=None,
                  retries=None, http_log_debug=False,
                  cacert=None, auth_system='keystone', auth_plugin=None,
-                 session=None, **kwargs):
+                 session=None,
+                 pool_connections=None, pool_maxsize=None,
+                 pool_block=False, keepalive=True, prefetch_pages=0,
+                 completion_cache=None, resolution_cache=True,
+                 compact_listings=False, lazy_loading=True,
+                 stream_listings=False, response_cache=False, **kwargs):
         # FIXME(comstud): Rename the api_key argument above when we
         # know it's not being used as keyword argument
         password = api_key
+        self.prefetch_pages = prefetch_pages
+        # IDs for bash completion are only written to disk when asked
+        # for: pass True or a cinderclient.cache.CompletionCache.
+        if completion_cache is True:
+            from cinderclient import cache
+            completion_cache = cache.CompletionCache(
+                username, bypass_url or auth_url)
+        self.completion_cache = completion_cache or None
+        # Names seen in listings, so utils.find_resource can resolve them
+        # with a single GET; pass False or a base.ResolutionCache.
+        if resolution_cache is True:
+            resolution_cache = base.ResolutionCache()
+        self.resolution_cache = resolution_cache or None
+        # Listings return read-only base.CompactResource objects.
+        self.compact_listings = compact_listings
+        # With False, reading a missing attribute of a resource never
+        # sends a GET for the full resource.
+        self.lazy_loading = lazy_loading
+        # Decode listings item by item as they are received; needs ijson
+        # and is not supported with keystone sessions.
+        self.stream_listings = stream_listings
+        # Responses for read-mostly resources such as volume types are
+        # revalidated or reused for a while; pass True or a
+        # client.ResponseCache.
+        if response_cache is True:
+            response_cache = client.ResponseCache()
+        self.response_cache = response_cache or None
         self.limits = limits.LimitsManager(self)
 
         # extensions
@@ -105,6 +138,10 @@ class Client(object):
             auth_system=auth_system,
             auth_plugin=auth_plugin,
             session=session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive=keepalive,
             **kwargs)
 
     def authenticate(self):
@@ -42,6 +42,7 @@ class QoSSpecsManager(base.ManagerWithFind):
     Manage :class:`QoSSpecs` resources.
     """
     resource_class = QoSSpecs
+    cache_responses = True
 
     def list(self, search_opts=None):
         """Get a list of all qos specs.
@@ -66,7 +67,8 @@ class QoSSpecsManager(base.ManagerWithFind):
                       if it was in-use.
         """
         self._delete("/qos-specs/%s?force=%s" %
-                     (base.getid(qos_specs), force))
+                     (base.getid(qos_specs), force),
+                     resource_id=base.getid(qos_specs))
 
     def create(self, name, specs):
         """Create a qos specs.
@@ -98,7 +100,8 @@ class QoSSpecsManager(base.ManagerWithFind):
         }
 
         body["qos_specs"].update(specs)
-        return self._update("/qos-specs/%s" % qos_specs, body)
+        return self._update("/qos-specs/%s" % qos_specs, body,
+                            resource_id=qos_specs)
 
     def unset_keys(self, qos_specs, specs):
         """Remove keys from a qos specs.
@@ -130,6 +133,7 @@ class QoSSpecsManager(base.ManagerWithFind):
         """
         self.api.client.get("/qos-specs/%s/associate?vol_type_id=%s" %
                             (base.getid(qos_specs), vol_type_id))
+        self._invalidate_responses()
 
     def disassociate(self, qos_specs, vol_type_id):
         """Disassociate qos specs from volume type.
@@ -139,6 +143,7 @@ class QoSSpecsManager(base.ManagerWithFind):
         """
         self.api.client.get("/qos-specs/%s/disassociate?vol_type_id=%s" %
                             (base.getid(qos_specs), vol_type_id))
+        self._invalidate_responses()
 
     def disassociate_all(self, qos_specs):
         """Disassociate all entities from specific qos specs.
@@ -147,3 +152,4 @@ class QoSSpecsManager(base.ManagerWithFind):
         """
         self.api.client.get("/qos-specs/%s/disassociate_all" %
                             base.getid(qos_specs))
+        self._invalidate_responses()
@@ -77,6 +77,7 @@ class SnapshotManager(base.ManagerWithFind):
     Manage :class:`Snapshot` resources.
     """
     resource_class = Snapshot
+    server_filters = ('name', 'display_name', 'status', 'volume_id')
 
     def create(self, volume_id, force=False,
                display_name=None, display_description=None):
@@ -143,7 +144,8 @@ class SnapshotManager(base.ManagerWithFind):
 
         :param snapshot: The :class:`Snapshot` to delete.
         """
-        self._delete("/snapshots/%s" % base.getid(snapshot))
+        self._delete("/snapshots/%s" % base.getid(snapshot),
+                     resource_id=base.getid(snapshot))
 
     def update(self, snapshot, **kwargs):
         """
@@ -156,7 +158,8 @@ class SnapshotManager(base.ManagerWithFind):
 
         body = {"snapshot": kwargs}
 
-        self._update("/snapshots/%s" % base.getid(snapshot), body)
+        self._update("/snapshots/%s" % base.getid(snapshot), body,
+                     resource_id=base.getid(snapshot))
 
     def reset_state(self, snapshot, state):
         """Update the specified volume with the provided state."""
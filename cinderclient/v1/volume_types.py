@@ -79,6 +79,7 @@ class VolumeTypeManager(base.ManagerWithFind):
     Manage :class:`VolumeType` resources.
     """
     resource_class = VolumeType
+    cache_responses = True
 
     def list(self, search_opts=None):
         """
@@ -103,7 +104,8 @@ class VolumeTypeManager(base.ManagerWithFind):
 
         :param volume_type: The name or ID of the :class:`VolumeType` to get.
         """
-        self._delete("/types/%s" % base.getid(volume_type))
+        self._delete("/types/%s" % base.getid(volume_type),
+                     resource_id=base.getid(volume_type))
 
     def create(self, name):
         """
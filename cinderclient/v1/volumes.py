@@ -142,6 +142,7 @@ class VolumeManager(base.ManagerWithFind):
     Manage :class:`Volume` resources.
     """
     resource_class = Volume
+    server_filters = ('name', 'display_name', 'status', 'metadata')
 
     def create(self, size, snapshot_id=None, source_volid=None,
                display_name=None, display_description=None,
@@ -234,7 +235,8 @@ class VolumeManager(base.ManagerWithFind):
 
         :param volume: The :class:`Volume` to delete.
         """
-        self._delete("/volumes/%s" % base.getid(volume))
+        self._delete("/volumes/%s" % base.getid(volume),
+                     resource_id=base.getid(volume))
 
     def update(self, volume, **kwargs):
         """
@@ -247,7 +249,8 @@ class VolumeManager(base.ManagerWithFind):
 
         body = {"volume": kwargs}
 
-        self._update("/volumes/%s" % base.getid(volume), body)
+        self._update("/volumes/%s" % base.getid(volume), body,
+                     resource_id=base.getid(volume))
 
     def _action(self, action, volume, info=None, **kwargs):
         """
@@ -29,6 +29,7 @@ class AvailabilityZone(base.Resource):
 class AvailabilityZoneManager(base.ManagerWithFind):
     """Manage :class:`AvailabilityZone` resources."""
     resource_class = AvailabilityZone
+    cache_responses = True
 
     def list(self, detailed=False):
         """Lists all availability zones.
@@ -29,6 +29,7 @@ class Capabilities(base.Resource):
 class CapabilitiesManager(base.Manager):
     """Manage :class:`Capabilities` resources."""
     resource_class = Capabilities
+    cache_responses = True
 
     def get(self, host):
         """Show backend volume stats and properties.
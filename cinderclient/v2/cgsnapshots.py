@@ -101,7 +101,8 @@ class CgsnapshotManager(base.ManagerWithFind):
 
         :param cgsnapshot: The :class:`Cgsnapshot` to delete.
         """
-        self._delete("/cgsnapshots/%s" % base.getid(cgsnapshot))
+        self._delete("/cgsnapshots/%s" % base.getid(cgsnapshot),
+                     resource_id=base.getid(cgsnapshot))
 
     def update(self, cgsnapshot, **kwargs):
         """Update the name or description for a cgsnapshot.
@@ -113,7 +114,8 @@ class CgsnapshotManager(base.ManagerWithFind):
 
         body = {"cgsnapshot": kwargs}
 
-        self._update("/cgsnapshots/%s" % base.getid(cgsnapshot), body)
+        self._update("/cgsnapshots/%s" % base.getid(cgsnapshot), body,
+                     resource_id=base.getid(cgsnapshot))
 
     def _action(self, action, cgsnapshot, info=None, **kwargs):
         """Perform a cgsnapshot "action."
@@ -135,7 +135,9 @@ class ConsistencygroupManager(base.ManagerWithFind):
         body = {'consistencygroup': {'force': force}}
         self.run_hooks('modify_body_for_action', body, 'consistencygroup')
         url = '/consistencygroups/%s/delete' % base.getid(consistencygroup)
-        return self.api.client.post(url, body=body)
+        result = self.api.client.post(url, body=body)
+        self._forget(base.getid(consistencygroup))
+        return result
 
     def update(self, consistencygroup, **kwargs):
         """Update the name or description for a consistencygroup.
@@ -148,7 +150,7 @@ class ConsistencygroupManager(base.ManagerWithFind):
         body = {"consistencygroup": kwargs}
 
         self._update("/consistencygroups/%s" % base.getid(consistencygroup),
-                     body)
+                     body, resource_id=base.getid(consistencygroup))
 
     def _action(self, action, consistencygroup, info=None, **kwargs):
         """Perform a consistencygroup "action."
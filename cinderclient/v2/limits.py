@@ -82,6 +82,7 @@ class LimitsManager(base.Manager):
     """Manager object used to interact with limits resource."""
 
     resource_class = Limits
+    cache_responses = True
 
     def get(self):
         """Get a specific extension.
@@ -30,6 +30,9 @@ class Pool(base.Resource):
 class PoolManager(base.Manager):
     """Manage :class:`Pool` resources."""
     resource_class = Pool
+    # list() moves the capabilities of every pool up a level.
+    supports_compact = False
+    cache_responses = True
 
     def list(self, detailed=False):
         """Lists all
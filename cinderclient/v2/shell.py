@@ -441,15 +441,19 @@ def do_create(cs, args):
 @utils.arg('volume',
            metavar='<volume>', nargs='+',
            help='Name or ID of volume or volumes to delete.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of volumes to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_delete(cs, args):
     """Removes one or more volumes."""
     failure_count = 0
-    for volume in args.volume:
-        try:
-            utils.find_volume(cs, volume).delete()
+    find_volume = utils.make_resource_finder(cs.volumes, args.volume)
+    for volume, e in utils.run_for_each(
+            lambda volume: find_volume(volume).delete(),
+            args.volume, args.parallel):
+        if e is None:
             print("Request to delete volume %s has been accepted." % (volume))
-        except Exception as e:
+        else:
             failure_count += 1
             print("Delete for volume %s failed: %s" % (volume, e))
     if failure_count == len(args.volume):
@@ -460,14 +464,17 @@ def do_delete(cs, args):
 @utils.arg('volume',
            metavar='<volume>', nargs='+',
            help='Name or ID of volume or volumes to delete.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of volumes to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_force_delete(cs, args):
     """Attempts force-delete of volume, regardless of state."""
     failure_count = 0
-    for volume in args.volume:
-        try:
-            utils.find_volume(cs, volume).force_delete()
-        except Exception as e:
+    find_volume = utils.make_resource_finder(cs.volumes, args.volume)
+    for volume, e in utils.run_for_each(
+            lambda volume: find_volume(volume).force_delete(),
+            args.volume, args.parallel):
+        if e is not None:
             failure_count += 1
             print("Delete for volume %s failed: %s" % (volume, e))
     if failure_count == len(args.volume):
@@ -495,6 +502,8 @@ def do_force_delete(cs, args):
            help=('Clears the migration status of the volume in the DataBase '
                  'that indicates the volume is source or destination of '
                  'volume migration, with no regard to the actual status.'))
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of volumes to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_reset_state(cs, args):
     """Explicitly updates the volume state in the Cinder database.
@@ -507,13 +516,15 @@ def do_reset_state(cs, args):
     """
     failure_flag = False
     migration_status = 'none' if args.reset_migration_status else None
+    find_volume = utils.make_resource_finder(cs.volumes, args.volume)
 
-    for volume in args.volume:
-        try:
-            utils.find_volume(cs, volume).reset_state(args.state,
-                                                      args.attach_status,
-                                                      migration_status)
-        except Exception as e:
+    def reset_state(volume):
+        find_volume(volume).reset_state(args.state, args.attach_status,
+                                        migration_status)
+
+    for volume, e in utils.run_for_each(reset_state, args.volume,
+                                        args.parallel):
+        if e is not None:
             failure_flag = True
             msg = "Reset state for volume %s failed: %s" % (volume, e)
             print(msg)
@@ -752,14 +763,18 @@ def do_snapshot_create(cs, args):
 @utils.arg('snapshot',
            metavar='<snapshot>', nargs='+',
            help='Name or ID of the snapshot(s) to delete.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of snapshots to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_snapshot_delete(cs, args):
     """Removes one or more snapshots."""
     failure_count = 0
-    for snapshot in args.snapshot:
-        try:
-            _find_volume_snapshot(cs, snapshot).delete()
-        except Exception as e:
+    find_snapshot = utils.make_resource_finder(cs.volume_snapshots,
+                                               args.snapshot)
+    for snapshot, e in utils.run_for_each(
+            lambda snapshot: find_snapshot(snapshot).delete(),
+            args.snapshot, args.parallel):
+        if e is not None:
             failure_count += 1
             print("Delete for snapshot %s failed: %s" % (snapshot, e))
     if failure_count == len(args.snapshot):
@@ -808,17 +823,23 @@ def do_snapshot_rename(cs, args):
                  'the state of the Snapshot in the DataBase with no regard '
                  'to actual status, exercise caution when using. '
                  'Default=available.'))
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of snapshots to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_snapshot_reset_state(cs, args):
     """Explicitly updates the snapshot state."""
     failure_count = 0
 
     single = (len(args.snapshot) == 1)
+    find_snapshot = utils.make_resource_finder(cs.volume_snapshots,
+                                               args.snapshot)
 
-    for snapshot in args.snapshot:
-        try:
-            _find_volume_snapshot(cs, snapshot).reset_state(args.state)
-        except Exception as e:
+    def reset_state(snapshot):
+        find_snapshot(snapshot).reset_state(args.state)
+
+    for snapshot, e in utils.run_for_each(reset_state, args.snapshot,
+                                          args.parallel):
+        if e is not None:
             failure_count += 1
             msg = "Reset state for snapshot %s failed: %s" % (snapshot, e)
             if not single:
@@ -1526,17 +1547,22 @@ def do_backup_import(cs, args):
            help='The state to assign to the backup. Valid values are '
                 '"available", "error", "creating", "deleting", and '
                 '"error_deleting". Default=available.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of backups to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_backup_reset_state(cs, args):
     """Explicitly updates the backup state."""
     failure_count = 0
 
     single = (len(args.backup) == 1)
+    find_backup = utils.make_resource_finder(cs.backups, args.backup)
 
-    for backup in args.backup:
-        try:
-            _find_backup(cs, backup).reset_state(args.state)
-        except Exception as e:
+    def reset_state(backup):
+        find_backup(backup).reset_state(args.state)
+
+    for backup, e in utils.run_for_each(reset_state, args.backup,
+                                        args.parallel):
+        if e is not None:
             failure_count += 1
             msg = "Reset state for backup %s failed: %s" % (backup, e)
             if not single:
@@ -2365,14 +2391,22 @@ def do_consisgroup_create_from_src(cs, args):
                 'it can be deleted without the force flag. '
                 'If the consistency group is not empty, the force '
                 'flag is required for it to be deleted.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of consistency groups to process concurrently. '
+                'Default=1.')
 @utils.service_type('volumev2')
 def do_consisgroup_delete(cs, args):
     """Removes one or more consistency groups."""
     failure_count = 0
-    for consistencygroup in args.consistencygroup:
-        try:
-            _find_consistencygroup(cs, consistencygroup).delete(args.force)
-        except Exception as e:
+    find_consistencygroup = utils.make_resource_finder(
+        cs.consistencygroups, args.consistencygroup)
+
+    def delete(consistencygroup):
+        find_consistencygroup(consistencygroup).delete(args.force)
+
+    for consistencygroup, e in utils.run_for_each(
+            delete, args.consistencygroup, args.parallel):
+        if e is not None:
             failure_count += 1
             print("Delete for consistency group %s failed: %s" %
                   (consistencygroup, e))
@@ -2503,14 +2537,18 @@ def do_cgsnapshot_create(cs, args):
 @utils.arg('cgsnapshot',
            metavar='<cgsnapshot>', nargs='+',
            help='Name or ID of one or more cgsnapshots to be deleted.')
+@utils.arg('--parallel', metavar='<parallel>', type=int, default=1,
+           help='Number of cgsnapshots to process concurrently. Default=1.')
 @utils.service_type('volumev2')
 def do_cgsnapshot_delete(cs, args):
     """Removes one or more cgsnapshots."""
     failure_count = 0
-    for cgsnapshot in args.cgsnapshot:
-        try:
-            _find_cgsnapshot(cs, cgsnapshot).delete()
-        except Exception as e:
+    find_cgsnapshot = utils.make_resource_finder(cs.cgsnapshots,
+                                                 args.cgsnapshot)
+    for cgsnapshot, e in utils.run_for_each(
+            lambda cgsnapshot: find_cgsnapshot(cgsnapshot).delete(),
+            args.cgsnapshot, args.parallel):
+        if e is not None:
             failure_count += 1
             print("Delete for cgsnapshot %s failed: %s" % (cgsnapshot, e))
     if failure_count == len(args.cgsnapshot):
@@ -36,6 +36,7 @@ class VolumeBackup(base.Resource):
 class VolumeBackupManager(base.ManagerWithFind):
     """Manage :class:`VolumeBackup` resources."""
     resource_class = VolumeBackup
+    server_filters = ('name', 'status', 'volume_id')
 
     def create(self, volume_id, container=None,
                name=None, description=None,
@@ -83,7 +84,8 @@ class VolumeBackupManager(base.ManagerWithFind):
 
         :param backup: The :class:`VolumeBackup` to delete.
         """
-        self._delete("/backups/%s" % base.getid(backup))
+        self._delete("/backups/%s" % base.getid(backup),
+                     resource_id=base.getid(backup))
 
     def reset_state(self, backup, state):
         """Update the specified volume backup with the provided state."""
@@ -60,6 +60,7 @@ class Snapshot(base.Resource):
 class SnapshotManager(base.ManagerWithFind):
     """Manage :class:`Snapshot` resources."""
     resource_class = Snapshot
+    server_filters = ('name', 'display_name', 'status', 'volume_id')
 
     def create(self, volume_id, force=False,
                name=None, description=None, metadata=None):
@@ -107,12 +108,25 @@ class SnapshotManager(base.ManagerWithFind):
                                    limit=limit, sort=sort)
         return self._list(url, resource_type, limit=limit)
 
+    def iter(self, detailed=True, search_opts=None, marker=None, limit=None,
+             sort=None):
+        """Iterate over all snapshots, fetching them one page at a time.
+
+        :rtype: iterator of :class:`Snapshot`
+        """
+        resource_type = "snapshots"
+        url = self._build_list_url(resource_type, detailed=detailed,
+                                   search_opts=search_opts, marker=marker,
+                                   limit=limit, sort=sort)
+        return self._list_iter(url, resource_type, limit=limit)
+
     def delete(self, snapshot):
         """Delete a snapshot.
 
         :param snapshot: The :class:`Snapshot` to delete.
         """
-        self._delete("/snapshots/%s" % base.getid(snapshot))
+        self._delete("/snapshots/%s" % base.getid(snapshot),
+                     resource_id=base.getid(snapshot))
 
     def update(self, snapshot, **kwargs):
         """Update the name or description for a snapshot.
@@ -124,7 +138,8 @@ class SnapshotManager(base.ManagerWithFind):
 
         body = {"snapshot": kwargs}
 
-        self._update("/snapshots/%s" % base.getid(snapshot), body)
+        self._update("/snapshots/%s" % base.getid(snapshot), body,
+                     resource_id=base.getid(snapshot))
 
     def reset_state(self, snapshot, state):
         """Update the specified snapshot with the provided state."""
@@ -98,4 +98,5 @@ class VolumeTransferManager(base.ManagerWithFind):
 
         :param transfer_id: The :class:`VolumeTransfer` to delete.
         """
-        self._delete("/os-volume-transfer/%s" % base.getid(transfer_id))
+        self._delete("/os-volume-transfer/%s" % base.getid(transfer_id),
+                     resource_id=base.getid(transfer_id))
@@ -76,6 +76,7 @@ class VolumeType(base.Resource):
 class VolumeTypeManager(base.ManagerWithFind):
     """Manage :class:`VolumeType` resources."""
     resource_class = VolumeType
+    cache_responses = True
 
     def list(self, search_opts=None, is_public=None):
         """Lists all volume types.
@@ -107,7 +108,8 @@ class VolumeTypeManager(base.ManagerWithFind):
 
         :param volume_type: The name or ID of the :class:`VolumeType` to get.
         """
-        self._delete("/types/%s" % base.getid(volume_type))
+        self._delete("/types/%s" % base.getid(volume_type),
+                     resource_id=base.getid(volume_type))
 
     def create(self, name, description=None, is_public=True):
         """Creates a volume type.
@@ -147,4 +149,5 @@ class VolumeTypeManager(base.ManagerWithFind):
             body["volume_type"]["is_public"] = is_public
 
         return self._update("/types/%s" % base.getid(volume_type),
-                            body, response_key="volume_type")
+                            body, response_key="volume_type",
+                            resource_id=base.getid(volume_type))
@@ -15,7 +15,10 @@
 
 """Volume interface (v2 extension)."""
 
+import itertools
+
 from cinderclient import base
+from cinderclient import utils
 
 
 class Volume(base.Resource):
@@ -206,6 +209,8 @@ class Volume(base.Resource):
 class VolumeManager(base.ManagerWithFind):
     """Manage :class:`Volume` resources."""
     resource_class = Volume
+    server_filters = ('name', 'display_name', 'status', 'metadata',
+                      'bootable', 'availability_zone')
 
     def create(self, size, consistencygroup_id=None, snapshot_id=None,
                source_volid=None, name=None, description=None,
@@ -293,12 +298,29 @@ class VolumeManager(base.ManagerWithFind):
                                    sort_dir=sort_dir, sort=sort)
         return self._list(url, resource_type, limit=limit)
 
+    def iter(self, detailed=True, search_opts=None, marker=None, limit=None,
+             sort_key=None, sort_dir=None, sort=None):
+        """Iterate over all volumes, fetching them one page at a time.
+
+        Takes the same arguments as :meth:`list`, but returns a generator
+        that only keeps the current page of results in memory.
+
+        :rtype: iterator of :class:`Volume`
+        """
+        resource_type = "volumes"
+        url = self._build_list_url(resource_type, detailed=detailed,
+                                   search_opts=search_opts, marker=marker,
+                                   limit=limit, sort_key=sort_key,
+                                   sort_dir=sort_dir, sort=sort)
+        return self._list_iter(url, resource_type, limit=limit)
+
     def delete(self, volume):
         """Delete a volume.
 
         :param volume: The :class:`Volume` to delete.
         """
-        self._delete("/volumes/%s" % base.getid(volume))
+        self._delete("/volumes/%s" % base.getid(volume),
+                     resource_id=base.getid(volume))
 
     def update(self, volume, **kwargs):
         """Update the name or description for a volume.
@@ -310,7 +332,8 @@ class VolumeManager(base.ManagerWithFind):
 
         body = {"volume": kwargs}
 
-        self._update("/volumes/%s" % base.getid(volume), body)
+        self._update("/volumes/%s" % base.getid(volume), body,
+                     resource_id=base.getid(volume))
 
     def _action(self, action, volume, info=None, **kwargs):
         """Perform a volume "action."
@@ -320,6 +343,36 @@ class VolumeManager(base.ManagerWithFind):
         url = '/volumes/%s/action' % base.getid(volume)
         return self.api.client.post(url, body=body)
 
+    def bulk(self, action, volumes, concurrency=10, **kwargs):
+        """Perform the same volume "action" on many volumes concurrently.
+
+        All requests go through this client, so they share its connection
+        pool, authentication token and retry settings. A failure for one
+        volume does not stop the others.
+
+        :param action: The action to perform, e.g. 'os-reset_status'.
+        :param volumes: The :class:`Volume` objects (or their IDs).
+        :param concurrency: Maximum number of requests in flight at once.
+        :param kwargs: The body of the action, e.g. ``status='error'`` for
+                       'os-reset_status' or ``new_size=10`` for 'os-extend'.
+        :returns: list with one entry per volume, in the same order: the
+                  ``(resp, body)`` tuple on success or the exception raised
+                  for that volume.
+        """
+        info = kwargs or None
+        volumes = list(volumes)
+
+        def call(volume):
+            return self._action(action, volume, info)
+
+        # Send the first request on its own so the client authenticates
+        # once before the remaining requests are fanned out.
+        results = itertools.chain(
+            utils.map_concurrently(call, volumes[:1]),
+            utils.map_concurrently(call, volumes[1:], concurrency))
+        return [error if error is not None else result
+                for volume, result, error in results]
+
     def attach(self, volume, instance_uuid, mountpoint, mode='rw',
                host_name=None):
         """Set attachment metadata.
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the per-listing overhead of the bash completion cache.
+
+Responses are canned, so the numbers only contain the client side work of
+turning a page into resources and, with caching on, updating the cache
+below a temporary CINDERCLIENT_UUID_CACHE_DIR.
+
+Usage: python tools/benchmarks/completion_cache.py [iterations] [volumes]
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from cinderclient.v2 import client
+
+
+def _run(count, body, completion_cache):
+    cs = client.Client('user', 'password', 'project', 'http://keystone/v2.0',
+                       bypass_url='http://cinder/v2/fake',
+                       completion_cache=completion_cache)
+    cs.client.get = lambda url: (None, body)
+    cs.volumes.list()
+    start = time.time()
+    for _ in range(count):
+        cs.volumes.list()
+    return (time.time() - start) / count
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 200
+    size = int(argv[1]) if len(argv) > 1 else 50
+    body = {'volumes': [{'id': 'volume-%d' % i, 'name': 'vol%d' % i}
+                        for i in range(size)]}
+    cache_dir = tempfile.mkdtemp()
+    os.environ['CINDERCLIENT_UUID_CACHE_DIR'] = cache_dir
+    try:
+        off = _run(count, body, False)
+        on = _run(count, body, True)
+    finally:
+        shutil.rmtree(cache_dir)
+
+    print("iterations:           %d (%d volumes per list)" % (count, size))
+    print("completion cache off: %.3f ms per list" % (off * 1000))
+    print("completion cache on:  %.3f ms per list" % (on * 1000))
+    print("overhead:             %.3f ms per list" % ((on - off) * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare round-trip latency of HTTPClient with and without connection reuse.
+
+Usage: python tools/benchmarks/http_session.py [requests]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+import requests
+
+from cinderclient import client
+
+import stub_server
+
+
+class _NoReuseSession(object):
+    """Mimics the old behaviour: one new connection per request."""
+
+    def request(self, method, url, **kwargs):
+        return requests.request(method, url, **kwargs)
+
+
+def _make_client(url, reuse):
+    cl = client.HTTPClient('user', 'password', 'project', bypass_url=url)
+    cl.auth_token = 'token'
+    if not reuse:
+        cl.http = _NoReuseSession()
+    return cl
+
+
+def _run(url, count, reuse):
+    cl = _make_client(url, reuse)
+    # Warm up so both modes start from the same state.
+    cl.get('/volumes')
+    start = time.time()
+    for _ in range(count):
+        cl.get('/volumes')
+    return (time.time() - start) / count
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 1000
+    server, url = stub_server.start()
+    try:
+        no_reuse = _run(url, count, reuse=False)
+        reuse = _run(url, count, reuse=True)
+    finally:
+        server.shutdown()
+
+    print("requests per mode:      %d" % count)
+    print("new connection/request: %.3f ms" % (no_reuse * 1000))
+    print("pooled session:         %.3f ms" % (reuse * 1000))
+    print("speedup:                %.2fx" % (no_reuse / reuse))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare the installed JSON codecs on volumes/detail responses.
+
+"text" is the old way of decoding a response: requests works out the
+charset of a body sent without one and decodes it before the stdlib json
+module parses it. The codecs decode the raw bytes instead.
+
+Usage: python tools/benchmarks/json_codec.py [iterations] [volumes]
+"""
+
+from __future__ import print_function
+
+import json
+import sys
+import time
+
+import requests
+
+from cinderclient import codec
+
+
+def _volume(i):
+    return {
+        "id": "6a3b8f4e-0c5d-4f%03d-9a57-%012d" % (i % 1000, i),
+        "name": "volume-%d" % i,
+        "description": None,
+        "status": "available",
+        "size": 10,
+        "availability_zone": "nova",
+        "created_at": "2016-03-01T12:34:56.000000",
+        "updated_at": "2016-03-02T08:00:00.000000",
+        "attachments": [],
+        "links": [
+            {"href": "http://cinder:8776/v2/fake/volumes/%d" % i,
+             "rel": "self"},
+            {"href": "http://cinder:8776/fake/volumes/%d" % i,
+             "rel": "bookmark"},
+        ],
+        "metadata": {"owner": "team-%d" % (i % 10), "purpose": "data"},
+        "volume_type": "lvmdriver-1",
+        "snapshot_id": None,
+        "source_volid": None,
+        "bootable": "false",
+        "encrypted": False,
+        "multiattach": False,
+        "replication_status": "disabled",
+        "consistencygroup_id": None,
+        "user_id": "1b2d6e8928954ca4ae7c243863404bdc",
+        "os-vol-tenant-attr:tenant_id": "eb72eb33a0084acf8eb21356c2b021a7",
+        "os-vol-host-attr:host": "host-%d@lvm#pool" % (i % 4),
+        "os-vol-mig-status-attr:migstat": None,
+        "os-vol-mig-status-attr:name_id": None,
+    }
+
+
+def _time(count, func, *args):
+    func(*args)
+    start = time.time()
+    for _ in range(count):
+        func(*args)
+    return (time.time() - start) / count * 1000
+
+
+def _decode_text(content):
+    resp = requests.Response()
+    resp._content = content
+    resp.encoding = None
+    return json.loads(resp.text)
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 20
+    size = int(argv[1]) if len(argv) > 1 else 1000
+    document = {'volumes': [_volume(i) for i in range(size)]}
+    content = json.dumps(document).encode('utf-8')
+
+    print("iterations: %d, %d volumes (%d KiB)"
+          % (count, size, len(content) // 1024))
+    print("%-12s %12s %12s" % ('codec', 'decode ms', 'encode ms'))
+    print("%-12s %12.3f %12s"
+          % ('text', _time(count, _decode_text, content), '-'))
+    for cls in codec.CODECS:
+        if not cls.available():
+            print("%-12s %12s %12s" % (cls.name, 'n/a', 'n/a'))
+            continue
+        json_codec = cls()
+        print("%-12s %12.3f %12.3f"
+              % (cls.name, _time(count, json_codec.loads, content),
+                 _time(count, json_codec.dumps, document)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare building the full subcommand parser tree with building only the
+parser of the subcommand being run.
+
+Usage: python tools/benchmarks/shell_startup.py [iterations] [command]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from cinderclient import shell
+
+
+def _run(count, version, command):
+    _shell = shell.OpenStackCinderShell()
+    _shell.extensions = _shell._discover_extensions(version)
+    start = time.time()
+    for _ in range(count):
+        _shell.get_subcommand_parser(version, command=command)
+    return (time.time() - start) / count
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 50
+    command = argv[1] if len(argv) > 1 else 'show'
+    full = _run(count, '2', None)
+    lazy = _run(count, '2', command)
+
+    print("iterations:           %d" % count)
+    print("full parser tree:     %.2f ms" % (full * 1000))
+    print("single subcommand:    %.2f ms (%s)" % (lazy * 1000, command))
+    print("speedup:              %.1fx" % (full / lazy))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
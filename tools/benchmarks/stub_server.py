@@ -0,0 +1,72 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Minimal local HTTP server used by the benchmarks in this directory.
+
+The server speaks HTTP/1.1 so that clients are able to keep connections
+alive between requests. Every GET is answered with the JSON document
+returned by the ``responder`` callable given to :func:`start`.
+"""
+
+import json
+import threading
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without this the
+    # Nagle/delayed-ACK interaction adds ~40ms to every kept-alive request.
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        body = json.dumps(self.server.responder(self.path)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        self._reply()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+
+
+def start(responder=None):
+    """Start the stub server on a random local port.
+
+    :param responder: callable taking the request path and returning the
+                      object to send back as JSON
+    :returns: tuple of (server, base_url); call ``server.shutdown()`` to stop
+    """
+    server = _Server(('127.0.0.1', 0), _Handler)
+    server.responder = responder or (lambda path: {'volumes': []})
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, 'http://127.0.0.1:%d/v2/fake' % server.server_address[1]